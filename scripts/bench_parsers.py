@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Parity check and benchmark for the HTML parser backends of bwf_scrape.py.
+
+Runs every page parser over the HTML pages of a fixture archive (recorded with
+BWF_RECORD=path.zip) once with the BeautifulSoup reference backend and once with
+the lxml backend, reports any page where the results differ, then times both.
+
+Usage: python scripts/bench_parsers.py fixtures.zip [rounds]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import warnings
+import zipfile
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bwf_scrape as bwf  # noqa: E402
+
+
+def load_pages(path):
+    """(url, html) for every 200 text/html response in the archive."""
+    pages = []
+    with zipfile.ZipFile(path) as zf:
+        index = json.loads(zf.read('index.json'))
+        for url, entry in sorted(index.items()):
+            ctype = (entry.get('headers') or {}).get('Content-Type') or (entry.get('headers') or {}).get('content-type') or ''
+            # streamed responses were recorded only up to what was read (e.g. a <head>)
+            if entry.get('status') != 200 or 'html' not in ctype.lower() or entry.get('partial'):
+                continue
+            # pages fetched through a proxy API are parsed as the page they wrap
+            target = bwf.proxy_target(url) or url
+            pages.append((target, zf.read(entry['file']).decode('utf-8', 'replace')))
+    return pages
+
+
+def parsers_for(url):
+    """The parsers that can be pointed at this page."""
+    u = urlparse(url)
+    origin = f'{u.scheme}://{u.hostname}'
+    return [
+        ('parse_article', lambda: bwf.parse_article(url)),
+        ('parse_listing', lambda: bwf.parse_listing(origin)),
+        ('parse_listing_latest', lambda: bwf.parse_listing_latest(origin)),
+        ('parse_bwf_main_pages', lambda: bwf.parse_bwf_main_pages(url)),
+        ('parse_championships_list_only', lambda: bwf.parse_championships_list_only(url)),
+        ('discover_from_official_lists', lambda: bwf.discover_from_official_lists()),
+    ]
+
+
+def run(backend, url, html):
+    bwf.BWF_PARSER = backend
+    bwf.fetch = lambda u, use_cloud=True: html
+    bwf.fetch_via_proxy = lambda u, render=None: html
+    # image probes and <head>-first article fetches are real network requests;
+    # keep them out of the offline parity check and the parser timings
+    bwf.BWF_IMAGE_PROBE = False
+    bwf.BWF_HEAD_FIRST = False
+    out = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, fn in parsers_for(url):
+            out[name] = fn()
+    return out
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(2)
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    # RSS/XML responses are in the archive too; bs4 warns about parsing them as HTML
+    warnings.simplefilter('ignore')
+    pages = load_pages(sys.argv[1])
+    print(f"{len(pages)} HTML pages")
+
+    mismatches = 0
+    for url, html in pages:
+        ref = run('bs4', url, html)
+        fast = run('lxml', url, html)
+        for name in ref:
+            if ref[name] != fast[name]:
+                mismatches += 1
+                print(f"❌ {name} differs on {url}")
+    print(f"Parity: {'✅ identical' if not mismatches else f'❌ {mismatches} mismatches'}")
+
+    timings = {}
+    for backend in ('bs4', 'lxml'):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for url, html in pages:
+                run(backend, url, html)
+        timings[backend] = (time.perf_counter() - start) / (rounds * max(1, len(pages)))
+        print(f"{backend:5s} {timings[backend] * 1000:8.2f} ms per page (all parsers)")
+    if timings['lxml']:
+        print(f"Speedup: {timings['bs4'] / timings['lxml']:.1f}x")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
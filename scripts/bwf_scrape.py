@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
+import asyncio
+import atexit
+import functools
+import hashlib
+import heapq
+import io
 import json
+import math
 import os
+import random
 import re
+import struct
 import sys
+import threading
 import time
-from datetime import datetime, timezone
-from urllib.parse import urlencode, urlparse, unquote
+import zipfile
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from html import unescape as html_unescape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, parse_qsl, quote, urlencode, urlparse, urlunparse, unquote
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 import concurrent.futures
 from dateutil import parser as date_parser
+from lxml import etree
 
 try:
     import cloudscraper  # optional
@@ -20,6 +37,15 @@ except Exception:  # pragma: no cover
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUT_PATH = os.path.join(ROOT, 'public', 'data', 'bwf_news.json')
 OVERRIDES_PATH = os.path.join(ROOT, 'scripts', 'image_overrides.json')
+# Newest items kept in OUT_PATH
+MAX_ITEMS = 20
+# State kept between cron runs (restored by the workflow's cache step)
+CACHE_DIR = os.getenv('BWF_CACHE_DIR') or os.path.join(ROOT, '.cache', 'bwf')
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, 'http')
+FETCH_STATS_PATH = os.path.join(CACHE_DIR, 'fetch_stats.json')
+IMAGE_PROBES_PATH = os.path.join(CACHE_DIR, 'image_probes.json')
+ARTICLE_INDEX_PATH = os.path.join(CACHE_DIR, 'article_index.json')
+LAST_RUN_PATH = os.path.join(CACHE_DIR, 'last_run.json')
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -34,134 +60,1700 @@ HEADERS = {
     'Sec-Fetch-User': '?1',
     'Cache-Control': 'max-age=0'
 }
+IMAGE_HEADERS = {
+    'User-Agent': HEADERS['User-Agent'],
+    'Accept': 'image/avif,image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': HEADERS['Accept-Language'],
+}
+
+SCRAPERAPI_KEY = os.getenv('SCRAPERAPI_KEY')
+SCRAPINGBEE_KEY = os.getenv('SCRAPINGBEE_KEY')
+BWF_FORCE_PROXY = os.getenv('BWF_FORCE_PROXY', '').strip().lower() in ('1', 'true', 'yes')
+BWF_MODE = (os.getenv('BWF_MODE', '').strip().lower() or 'default')  # 'default' | 'list_only'
+# HTML parser backend: 'lxml' works on the native lxml tree, 'bs4' is the BeautifulSoup reference
+BWF_PARSER = (os.getenv('BWF_PARSER', '').strip().lower() or 'lxml')
+# Number of articles enriched in parallel; HTTP pools are sized from it so every worker keeps a warm connection
+BWF_CONCURRENCY = max(1, int(os.getenv('BWF_CONCURRENCY', '8') or 8))
+# Async engine: overlaps slow proxy calls (render=true takes 20-60 s) instead of waiting on them in turn
+BWF_ASYNC = os.getenv('BWF_ASYNC', '').strip().lower() in ('1', 'true', 'yes')
+BWF_MAX_INFLIGHT = max(1, int(os.getenv('BWF_MAX_INFLIGHT', '32') or 32))
+BWF_PER_HOST = max(1, int(os.getenv('BWF_PER_HOST', '6') or 6))
+# Distinct hosts we keep pools for: main site, tournament subdomains, Google News, proxy APIs
+POOL_HOSTS = 10
+# All in-flight proxy calls share one API host, so in async mode its pool must fit the global cap
+POOL_SIZE = max(BWF_CONCURRENCY, BWF_MAX_INFLIGHT) if BWF_ASYNC else BWF_CONCURRENCY
+# Record every HTTP response to a zip archive, or replay such an archive from a local stand-in server
+BWF_RECORD = os.getenv('BWF_RECORD', '').strip()
+BWF_REPLAY = os.getenv('BWF_REPLAY', '').strip()
+BWF_REPLAY_LATENCY = os.getenv('BWF_REPLAY_LATENCY', '').strip().lower() in ('1', 'true', 'yes')
+# Conditional-GET response cache for the direct and cloudscraper paths ('0' disables it);
+# off while recording or replaying so fixtures hold full bodies and runs stay repeatable
+BWF_HTTP_CACHE = (os.getenv('BWF_HTTP_CACHE', '1').strip().lower() not in ('0', 'false', 'no')
+                  and not (BWF_RECORD or BWF_REPLAY))
+HTTP_CACHE_MAX_AGE_DAYS = 21
+# Adaptive tier ordering: measure each tier this many times per host before ranking it,
+# and push a tier to the back after this many consecutive failures (re-probed after the hours pass)
+TIER_MIN_SAMPLES = 2
+TIER_SKIP_STREAK = 3
+TIER_SKIP_HOURS = 6
+# Token-bucket limits (requests/second) per target host and per proxy provider
+BWF_HOST_RATE = float(os.getenv('BWF_HOST_RATE', '2') or 2)
+BWF_PROXY_RATE = float(os.getenv('BWF_PROXY_RATE', '5') or 5)
+# 429/503 handling: retries with jittered exponential backoff, or the server's Retry-After
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 3
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 60.0
+# Circuit breakers: open after this many consecutive failures, allow one trial call after the cooldown
+BWF_BREAKER_THRESHOLD = max(1, int(os.getenv('BWF_BREAKER_THRESHOLD', '3') or 3))
+BWF_BREAKER_COOLDOWN = float(os.getenv('BWF_BREAKER_COOLDOWN', '120') or 120)
+# Whole-run time budget in seconds (0 = unlimited); the tail is kept free for merging and writing output
+BWF_DEADLINE = float(os.getenv('BWF_DEADLINE', '0') or 0)
+DEADLINE_RESERVE = 20.0
+MIN_REQUEST_TIMEOUT = 3.0
+# Proxy escalation ladder: a plain proxied fetch first, a JS-rendered one only when that fails.
+# Credits per successful request as billed by each provider.
+PROXY_CREDITS = {
+    ('scraperapi', 'plain'): 1,
+    ('scraperapi', 'render'): 10,
+    ('scrapingbee', 'plain'): 1,
+    ('scrapingbee', 'render'): 5,
+}
+PROXY_TIMEOUTS = {'plain': 30, 'render': 60}
+# Hedged fetches: start the next-best tier alongside a slow one after BWF_HEDGE_DELAY seconds
+# (immediately for hosts whose leading tier fails often) and keep whichever valid page comes first
+BWF_HEDGE = os.getenv('BWF_HEDGE', '').strip().lower() in ('1', 'true', 'yes')
+BWF_HEDGE_DELAY = float(os.getenv('BWF_HEDGE_DELAY', '10') or 10)
+FLAKY_FAILURE_RATE = 0.3
+# Articles are first read from their streamed <head> only; the body is downloaded just when
+# the head metadata is missing or fails the quality checks ('0' disables the fast path)
+BWF_HEAD_FIRST = os.getenv('BWF_HEAD_FIRST', '1').strip().lower() not in ('0', 'false', 'no')
+HEAD_MAX_BYTES = 256 * 1024
+# Listings come from each BWF host's WordPress REST API (one small JSON request per host);
+# its HTML news pages are only scraped when the API is blocked ('0' always scrapes HTML).
+# A host whose API failed is not asked again for WP_API_RETRY_HOURS
+BWF_WP_API = os.getenv('BWF_WP_API', '1').strip().lower() not in ('0', 'false', 'no')
+WP_API_RETRY_HOURS = 24
+# Each BWF host's sitemaps (news-sitemap.xml, else the wp-sitemap.xml index) list the articles
+# changed since that host's listing was last read in full; a host listing none has its news pages skipped.
+# Hosts without a readable sitemap are not asked again for SITEMAP_RETRY_HOURS ('0' disables)
+BWF_SITEMAPS = os.getenv('BWF_SITEMAPS', '1').strip().lower() not in ('0', 'false', 'no')
+SITEMAP_RETRY_HOURS = 24
+SITEMAP_CHILDREN = 2
+SITEMAP_MAX_ARTICLES = 30
+# scrape() runs its strategies side by side; each may take this many seconds (within
+# BWF_DEADLINE, overridable per strategy as BWF_BUDGET_<KEY>, e.g. BWF_BUDGET_GOOGLE=300)
+# before the run stops it and keeps the items it had found. Their items are merged in this order.
+STRATEGY_BUDGETS = {
+    key: float(os.getenv(f'BWF_BUDGET_{key.upper()}', str(default)) or default)
+    for key, default in (
+        ('rss', 90),
+        ('google', 480),
+        ('alternative', 10),
+        ('direct', 480),
+        ('tournaments', 720),
+        ('sitemaps', 300),
+    )
+}
+# The best image candidates of an article are probed with a ranged GET of their first bytes:
+# real width/height/format feed the ranking and dead (404/410) URLs are dropped. Results are
+# cached per URL between runs ('0' disables probing)
+BWF_IMAGE_PROBE = os.getenv('BWF_IMAGE_PROBE', '1').strip().lower() not in ('0', 'false', 'no')
+IMAGE_PROBE_BYTES = 32 * 1024
+IMAGE_PROBE_TOP = 3
+IMAGE_PROBE_PER_HOST = 4
+IMAGE_PROBE_RATE = 8.0
+IMAGE_PROBE_TTL_DAYS = 14
+# Parsed articles are indexed by canonical href between runs ('0' disables it); an indexed
+# article is reused without a fetch until its last check is ARTICLE_RECHECK_DAYS old, or
+# ARTICLE_FRESH_RECHECK_HOURS while it is under ARTICLE_FRESH_DAYS old or was last found
+# changed (edited) that recently (new and edited stories get edited again).
+# Entries not seen for ARTICLE_INDEX_MAX_AGE_DAYS are dropped
+BWF_ARTICLE_INDEX = os.getenv('BWF_ARTICLE_INDEX', '1').strip().lower() not in ('0', 'false', 'no')
+ARTICLE_RECHECK_DAYS = 14
+ARTICLE_FRESH_RECHECK_HOURS = 12
+ARTICLE_FRESH_DAYS = 3
+ARTICLE_INDEX_MAX_AGE_DAYS = 60
+
+
+def is_official_host(host: str) -> bool:
+    return host == 'bwfbadminton.com' or host.endswith('.bwfbadminton.com')
+
+def is_main_host(host: str) -> bool:
+    """Return True only for the primary site host (no subdomains)."""
+    return (host or '').lower() == 'bwfbadminton.com'
+
+
+_MONTH_RE = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:t|tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+
+_TITLE_DATE_RES = (
+    re.compile(rf"\b\d{{1,2}}\s+{_MONTH_RE}\s+\d{{4}}$", re.IGNORECASE),
+    re.compile(rf"\b\d{{1,2}}\s+{_MONTH_RE}$", re.IGNORECASE),
+)
+
+
+def remove_date_from_title(title: str) -> str:
+    """Strip trailing inline dates like '05 Sep', '7 September 2025' from listing titles."""
+    if not title:
+        return title
+    s = title.strip()
+    for pat in _TITLE_DATE_RES:
+        s = pat.sub("", s).rstrip(" -|,–—").strip()
+    return s
+
+
+# --- Dates -------------------------------------------------------------------------------
+# Every date string goes through parse_date(): memoized, with precompiled fast paths for the
+# formats the sites actually emit (ISO-8601 from meta tags and our own output, RSS pubDate,
+# "Friday, September 5, 2025" bylines). Anything else falls back to dateutil, and the fast
+# paths give exactly what dateutil would.
+DOW_DATE_RE = re.compile(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+[A-Za-z]+\s+\d{1,2},\s+\d{4}")
+MONTH_DAY_YEAR_RE = re.compile(r"[A-Za-z]+\s+\d{1,2},\s+\d{4}")
+MONTH_NAME_RE = re.compile(r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\b", re.I)
+URL_DATE_RE = re.compile(r'/(\d{4})/(\d{1,2})/(\d{1,2})/')
+DATE_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?)?')
+_MONTH_NUMBERS = {
+    name: i + 1
+    for i, names in enumerate((
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'), ('may',),
+        ('jun', 'june'), ('jul', 'july'), ('aug', 'august'), ('sep', 'sept', 'september'),
+        ('oct', 'october'), ('nov', 'november'), ('dec', 'december'),
+    ))
+    for name in names
+}
+_WEEKDAY = r'(?:mon|tue|wed|thu|fri|sat|sun|monday|tuesday|wednesday|thursday|friday|saturday|sunday)'
+_TEXT_DATE_RE = re.compile(rf'(?:{_WEEKDAY},?\s+)?([a-z]+)\s+(\d{{1,2}}),?\s+(\d{{4}})', re.I)
+_RFC822_DATE_RE = re.compile(
+    rf'(?:{_WEEKDAY},\s*)?(\d{{1,2}})\s+([a-z]+)\s+(\d{{4}})\s+(\d{{2}}):(\d{{2}})(?::(\d{{2}}))?\s+(GMT|UTC|[+-]\d{{4}})', re.I)
+
+
+def _fast_parse_date(s: str) -> datetime | None:
+    if _ISO_DATE_RE.fullmatch(s):
+        return datetime.fromisoformat(s)
+    m = _TEXT_DATE_RE.fullmatch(s)
+    if m and m.group(1).lower() in _MONTH_NUMBERS:
+        return datetime(int(m.group(3)), _MONTH_NUMBERS[m.group(1).lower()], int(m.group(2)))
+    m = _RFC822_DATE_RE.fullmatch(s)
+    if m and m.group(2).lower() in _MONTH_NUMBERS:
+        day, _, year, hour, minute, second, zone = m.groups()
+        if zone.upper() in ('GMT', 'UTC') or zone[1:] == '0000':
+            tz = timezone.utc
+        else:
+            sign = -1 if zone[0] == '-' else 1
+            tz = timezone(sign * timedelta(hours=int(zone[1:3]), minutes=int(zone[3:5])))
+        return datetime(int(year), _MONTH_NUMBERS[m.group(2).lower()], int(day),
+                        int(hour), int(minute), int(second or 0), tzinfo=tz)
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(s: str) -> datetime | None:
+    """What dateutil.parser.parse(s) returns, or None if it cannot read `s`."""
+    if not s:
+        return None
+    try:
+        dt = _fast_parse_date(s.strip())
+    except ValueError:
+        # out-of-range fields: let dateutil have the final word
+        dt = None
+    if dt is not None:
+        return dt
+    try:
+        return date_parser.parse(s)
+    except Exception:
+        return None
+
+
+def normalize_date_iso(s: str) -> str:
+    dt = parse_date(s)
+    if dt is None:
+        return s.strip() if s else ''
+    return dt.replace(tzinfo=timezone.utc).isoformat()
+
+
+def utc_date(s: str) -> datetime | None:
+    """The UTC datetime normalize_date_iso() would store for `s`, or None if it cannot read it."""
+    iso = normalize_date_iso(s or '')
+    return parse_date(iso) if iso else None
+
+
+def date_sort_key(s: str) -> datetime:
+    """Sort key for a stored date string; unreadable or missing dates sort last."""
+    return parse_date(s or '') or DATE_MIN
+
+
+def url_path_date(url: str) -> str:
+    """Midnight-UTC ISO date from a /YYYY/MM/DD/ URL path, or ''."""
+    m = URL_DATE_RE.search(url)
+    if not m:
+        return ''
+    year, month, day = m.groups()
+    return f"{year}-{month.zfill(2)}-{day.zfill(2)}T00:00:00+00:00"
+
+
+_client_lock = threading.Lock()
+_session: requests.Session | None = None
+_scraper = None
+_stats_lock = threading.Lock()
+_tier_stats: dict | None = None
+_order_logged: set[str] = set()
+_limiters_lock = threading.Lock()
+_limiters: dict = {}
+_breakers_lock = threading.Lock()
+_breakers: dict = {}
+_usage_lock = threading.Lock()
+_proxy_usage: dict = {}
+_render_hosts: set[str] = set()
+_hedge_ctx = threading.local()
+_strategy_ctx = threading.local()
+_hedge_pool: concurrent.futures.ThreadPoolExecutor | None = None
+_recorder = None
+_replay = None
+_overrides_lock = threading.Lock()
+_overrides: tuple | None = None  # (mtime of OVERRIDES_PATH, ImageOverrides)
+_probes_lock = threading.Lock()
+_image_probes: dict | None = None
+_probe_inflight: dict = {}
+_probe_slots: dict = {}
+_probe_pool: concurrent.futures.ThreadPoolExecutor | None = None
+_fetch_pool: concurrent.futures.ThreadPoolExecutor | None = None
+_frontier = None  # UrlFrontier of the current scrape() run
+_index_lock = threading.Lock()
+_article_index: dict | None = None
+_index_counts = {'reused': 0, 'new': 0, 'unchanged': 0, 'changed': 0}
+_last_run_lock = threading.Lock()
+_last_run: dict | None = None  # host -> start of the last run that read its listing in full
+_listed_hosts: set[str] = set()  # hosts whose listing this run read in full
+
+
+def _size_pools(session: requests.Session) -> requests.Session:
+    """Resize the per-host connection pools of every adapter mounted on `session`."""
+    for adapter in set(session.adapters.values()):
+        adapter.init_poolmanager(POOL_HOSTS, POOL_SIZE, block=False)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session used for direct requests and proxy API calls."""
+    global _session
+    if _session is None:
+        with _client_lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers.update(HEADERS)
+                adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_SIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def get_scraper():
+    """Shared cloudscraper session, so a solved Cloudflare challenge (clearance cookies) is reused."""
+    global _scraper
+    if cloudscraper is None:
+        return None
+    if _scraper is None:
+        with _client_lock:
+            if _scraper is None:
+                scraper = cloudscraper.create_scraper(
+                    browser={
+                        'browser': 'chrome',
+                        'platform': 'windows',
+                        'desktop': True
+                    }
+                )
+                # keep cloudscraper's own TLS adapter, only widen its pools
+                _scraper = _size_pools(scraper)
+    return _scraper
+
+
+class DeadlineExceeded(Exception):
+    """Raised instead of starting work that cannot finish inside the run budget."""
+
+
+class Skipped(Exception):
+    """Returned by run_all() for items dropped before they started (see UrlFrontier.behind)."""
+
+
+class HedgeCancelled(Exception):
+    """Raised inside the losing side of a hedged fetch once the other side has won."""
+
+
+class Abandoned(DeadlineExceeded):
+    """Raised inside a strategy that run_strategies() has stopped at its time budget."""
+
+
+class StrategyRun:
+    """One strategy inside run_strategies(): the items it has found so far, kept if it is
+    stopped at its budget, and the event that stops its remaining work.
+
+    It is the current strategy of the thread that runs it and, through carry_strategy(), of
+    the run_all() and hedge workers that thread hands work to.
+    """
+
+    def __init__(self):
+        self.cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._found: dict[str, dict] = {}
+
+    def add(self, items) -> None:
+        with self._lock:
+            for it in items:
+                if isinstance(it, dict) and it.get('href') and it.get('title'):
+                    self._found.setdefault(canonical_url(it['href']), it)
+
+    def found(self) -> list[dict]:
+        with self._lock:
+            return list(self._found.values())
+
+    def call(self, fn, *args):
+        _strategy_ctx.run = self
+        try:
+            return fn(*args)
+        finally:
+            _strategy_ctx.run = None
+
+
+def current_strategy() -> StrategyRun | None:
+    return getattr(_strategy_ctx, 'run', None)
+
+
+def stopped() -> bool:
+    """True once the calling thread's strategy has been stopped at its budget."""
+    run = current_strategy()
+    return run is not None and run.cancel.is_set()
+
+
+def check_abandoned() -> None:
+    if stopped():
+        raise Abandoned('strategy stopped at its time budget')
+
+
+def carry_strategy(fn):
+    """`fn` wrapped to run as part of the calling thread's strategy on whatever thread runs it."""
+    run = current_strategy()
+    if run is None:
+        return fn
+    return functools.partial(run.call, fn)
+
+
+def gathered(found):
+    """Record an item (or list of items) with the current strategy as soon as it is found, so
+    it survives the strategy being stopped at its budget; returns `found` unchanged."""
+    run = current_strategy()
+    if run is not None and found:
+        run.add([found] if isinstance(found, dict) else found)
+    return found
+
+
+class Deadline:
+    """Run-wide time budget; request timeouts shrink as it runs out."""
+
+    def __init__(self):
+        self.end: float | None = None
+
+    def start(self, seconds: float) -> None:
+        if self.end is None and seconds > 0:
+            self.end = time.monotonic() + seconds
+
+    def budget(self) -> float:
+        """Seconds left for scraping work, i.e. excluding the output reserve."""
+        if self.end is None:
+            return math.inf
+        return self.end - DEADLINE_RESERVE - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.budget() <= 0
+
+    def timeout(self, default: float) -> float:
+        left = self.budget()
+        if left < MIN_REQUEST_TIMEOUT:
+            raise DeadlineExceeded('run deadline reached')
+        return min(default, left)
+
+
+RUN_DEADLINE = Deadline()
+
+
+def out_of_time(stage: str, until: float | None = None) -> bool:
+    """True (and logged) once the run deadline or the caller's own `until` (monotonic) has passed."""
+    if RUN_DEADLINE.expired():
+        print(f"Run deadline reached, skipping {stage}")
+        return True
+    if (until is not None and time.monotonic() >= until) or stopped():
+        print(f"Time budget used up, skipping {stage}")
+        return True
+    return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `pause()` holds every caller back (used for Retry-After)."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 0.01)
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.stamp = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            # reserve the token now and sleep outside the lock, so waiters queue up fairly
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+def limiter(key: str) -> TokenBucket:
+    """Shared bucket for a host name, a proxy provider ('scraperapi', 'scrapingbee') or the
+    image probes of a host ('img:<host>')."""
+    with _limiters_lock:
+        bucket = _limiters.get(key)
+        if bucket is None:
+            if key in ('scraperapi', 'scrapingbee'):
+                rate = BWF_PROXY_RATE
+            elif key.startswith('img:'):
+                rate = IMAGE_PROBE_RATE
+            else:
+                rate = BWF_HOST_RATE
+            bucket = _limiters[key] = TokenBucket(rate, math.ceil(rate))
+        return bucket
+
+
+def _retry_after(r: requests.Response) -> float | None:
+    value = (r.headers.get('Retry-After') or '').strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+
+PROXY_API_HOSTS = ('api.scraperapi.com', 'app.scrapingbee.com')
+
+
+def redact_url(url: str) -> str:
+    """Strip proxy API keys so fixture archives can be shared."""
+    return re.sub(r'(api_key=)[^&]+', r'\1REDACTED', url)
+
+
+def proxy_target(url: str) -> str | None:
+    """Target page of a proxy API URL, or None for a direct URL."""
+    u = urlparse(url)
+    if (u.hostname or '').lower() not in PROXY_API_HOSTS:
+        return None
+    return (parse_qs(u.query).get('url') or [None])[0]
+
+
+class FixtureRecorder:
+    """Collects every response received and writes them to a zip archive at exit.
+
+    A streamed response is recorded with only the bytes its caller read (a page's <head>, an
+    image's first bytes) and never replaces a complete body recorded for the same URL.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def add(self, url: str, r: requests.Response, body: bytes | None = None) -> None:
+        """Record `r`, or for a stream=True response the `body` bytes read from it."""
+        key = redact_url(url)
+        entry = {
+            'status': r.status_code,
+            'headers': {k: v for k, v in r.headers.items() if k.lower() in ('content-type', 'etag', 'last-modified', 'retry-after')},
+            'elapsed': r.elapsed.total_seconds() if r.elapsed else 0.0,
+            'body': r.content if body is None else body,
+        }
+        if body is not None:
+            entry['partial'] = True
+        with self.lock:
+            old = self.entries.get(key)
+            if body is not None and old is not None and not old.get('partial'):
+                return
+            self.entries[key] = entry
+
+    def save(self) -> None:
+        with self.lock:
+            entries = dict(self.entries)
+        if not entries:
+            return
+        index = {}
+        with zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for key, entry in sorted(entries.items()):
+                name = 'bodies/' + hashlib.sha1(key.encode('utf-8')).hexdigest()
+                zf.writestr(name, entry['body'])
+                index[key] = {k: v for k, v in entry.items() if k != 'body'} | {'file': name}
+            zf.writestr('index.json', json.dumps(index, indent=1))
+        print(f"Recorded {len(index)} responses to {self.path}")
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = (parse_qs(urlparse(self.path).query).get('u') or [''])[0]
+        entry = self.server.replay.lookup(url)
+        if entry is None:
+            body = f'no fixture for {url}'.encode('utf-8')
+            self.send_response(404)
+            self.send_header('Content-Type', 'text/plain')
+        else:
+            if BWF_REPLAY_LATENCY:
+                time.sleep(entry.get('elapsed') or 0)
+            body = entry['body']
+            self.send_response(entry['status'])
+            for k, v in entry['headers'].items():
+                self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer:
+    """Local HTTP stand-in for the BWF sites, Google News and the proxy APIs.
+
+    Requests are looked up by their (redacted) URL; a page recorded through a proxy also
+    answers a direct request for the same target and vice versa, so replays work with or
+    without proxy keys.
+    """
+
+    def __init__(self, path: str):
+        self.entries: dict[str, dict] = {}
+        self.by_target: dict[str, dict] = {}
+        with zipfile.ZipFile(path) as zf:
+            for key, meta in json.loads(zf.read('index.json')).items():
+                entry = dict(meta, body=zf.read(meta['file']))
+                self.entries[key] = entry
+                target = proxy_target(key) or key
+                if entry['status'] == 200 or target not in self.by_target:
+                    self.by_target[target] = entry
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.replay = self
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        print(f"Replaying {len(self.entries)} recorded responses from {path} at {self.base}")
+
+    def lookup(self, url: str) -> dict | None:
+        return self.entries.get(url) or self.by_target.get(proxy_target(url) or url)
+
+    def local_url(self, url: str) -> str:
+        return f'{self.base}/replay?u={quote(redact_url(url), safe="")}'
+
+
+def _record_replay_init() -> None:
+    global _recorder, _replay
+    with _client_lock:
+        if BWF_REPLAY and _replay is None:
+            _replay = ReplayServer(BWF_REPLAY)
+        elif BWF_RECORD and not BWF_REPLAY and _recorder is None:
+            _recorder = FixtureRecorder(BWF_RECORD)
+            atexit.register(_recorder.save)
+
+
+def throttled_get(session: requests.Session, url: str, limit_key: str | None = None, **kwargs) -> requests.Response:
+    """session.get() behind the shared rate limiter, retrying 429/503 with backoff
+    (but not a 503 that is a Cloudflare challenge page).
+
+    The wait is applied to the whole bucket, so other threads hitting the same host or
+    provider back off too instead of piling more requests onto a throttled endpoint.
+    """
+    key = limit_key or (urlparse(url).hostname or '').lower()
+    bucket = limiter(key)
+    timeout = kwargs.pop('timeout', 60)
+    cancel = getattr(_hedge_ctx, 'cancel', None)
+    if (BWF_RECORD or BWF_REPLAY) and _recorder is None and _replay is None:
+        _record_replay_init()
+    for attempt in range(MAX_RETRIES + 1):
+        if _replay is None:
+            bucket.acquire()
+        if cancel is not None and cancel.is_set():
+            raise HedgeCancelled(url)
+        check_abandoned()
+        target = _replay.local_url(url) if _replay is not None else url
+        r = session.get(target, timeout=RUN_DEADLINE.timeout(timeout), **kwargs)
+        # reading .content would download a streamed body in full: its callers record what they read
+        if _recorder is not None and not kwargs.get('stream'):
+            _recorder.add(url, r)
+        if r.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return r
+        # Cloudflare serves its challenge as a 503: that is a tier failure, not rate limiting,
+        # so hand it back at once and let the caller fall through to the next tier
+        if r.status_code == 503 and classify_page(r.content, consent=False) in ('blocked', 'challenge'):
+            return r
+        delay = _retry_after(r)
+        if delay is None:
+            delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+        delay = min(delay, BACKOFF_CAP)
+        if delay + MIN_REQUEST_TIMEOUT > RUN_DEADLINE.budget():
+            return r
+        print(f"HTTP {r.status_code} from {key}, retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s")
+        bucket.pause(delay)
+    return r
+
+
+def record_streamed(url: str, r: requests.Response, body: bytes) -> None:
+    """Record a stream=True response from throttled_get() with the `body` bytes read from it."""
+    if _recorder is not None:
+        _recorder.add(url, r, body)
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a host or tier whose breaker is open."""
+
+
+class CircuitBreaker:
+    """closed -> open after `threshold` consecutive failures -> half_open after `cooldown`.
+
+    In half_open a single trial call is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, name: str, threshold: int = BWF_BREAKER_THRESHOLD, cooldown: float = BWF_BREAKER_COOLDOWN):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = 'half_open'
+                print(f"Circuit {self.name}: half-open, sending a trial request")
+            if self.state == 'closed':
+                return True
+            if self.state == 'half_open' and not self.trial_running:
+                self.trial_running = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """Forget an allowed call that never reached the endpoint (e.g. out of run time)."""
+        with self.lock:
+            self.trial_running = False
+
+    def success(self) -> None:
+        with self.lock:
+            if self.state != 'closed':
+                print(f"Circuit {self.name}: closed")
+            self.state = 'closed'
+            self.failures = 0
+            self.trial_running = False
+
+    def failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.state == 'half_open' or (self.state == 'closed' and self.failures >= self.threshold):
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+                print(f"Circuit {self.name}: open after {self.failures} consecutive failures")
+
+
+def breaker(key: str) -> CircuitBreaker:
+    """Shared breaker for 'host:<name>', a proxy provider, or '<tier>@<host>'."""
+    with _breakers_lock:
+        cb = _breakers.get(key)
+        if cb is None:
+            cb = _breakers[key] = CircuitBreaker(key)
+        return cb
+
+
+def _counts_as_outage(e: Exception) -> bool:
+    # a 404/410 proves the endpoint is up; only transport errors, blocks and 5xx/403/429 trip breakers
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return e.response.status_code not in (404, 410)
+    return True
+
+
+def guarded(key: str, fn, *args):
+    """Call fn(*args) through breaker `key`, raising CircuitOpen without calling it when open."""
+    cb = breaker(key)
+    if not cb.allow():
+        raise CircuitOpen(f"circuit open: {key}")
+    try:
+        result = fn(*args)
+    except (CircuitOpen, DeadlineExceeded, HedgeCancelled):
+        cb.release()
+        raise
+    except Exception as e:
+        if _counts_as_outage(e):
+            cb.failure()
+        else:
+            cb.success()
+        raise
+    cb.success()
+    return result
+
+
+def log_breakers() -> None:
+    with _breakers_lock:
+        cbs = sorted(_breakers.values(), key=lambda cb: cb.name)
+    if not cbs:
+        return
+    print("Circuit breakers:")
+    for cb in cbs:
+        print(f"  {cb.name}: {cb.state} (consecutive failures: {cb.failures})")
+
+
+def _http_cache_paths(url: str) -> tuple[str, str]:
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    base = os.path.join(HTTP_CACHE_DIR, key[:2], key)
+    return base + '.json', base + '.body'
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def http_cache_load(url: str) -> dict | None:
+    """Return stored validators for `url` ({'etag', 'last_modified', 'encoding'}) or None."""
+    if not BWF_HTTP_CACHE:
+        return None
+    meta_path, body_path = _http_cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('url') == url and os.path.exists(body_path):
+            return meta
+    except Exception:
+        pass
+    return None
+
+
+def http_cache_store(url: str, r: requests.Response) -> None:
+    """Persist a validated 200 response that carries an ETag or Last-Modified validator."""
+    if not BWF_HTTP_CACHE or getattr(r, 'from_cache', False):
+        return
+    etag = r.headers.get('ETag')
+    last_modified = r.headers.get('Last-Modified')
+    if r.status_code != 200 or not (etag or last_modified):
+        return
+    meta_path, body_path = _http_cache_paths(url)
+    meta = {
+        'url': url,
+        'etag': etag,
+        'last_modified': last_modified,
+        'encoding': r.encoding or 'utf-8',
+        'stored_at': datetime.now(timezone.utc).isoformat(),
+    }
+    try:
+        _write_atomic(body_path, r.content)
+        _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+    except Exception as e:
+        print(f"HTTP cache write failed for {url}: {e}")
+
+
+def conditional_get(session: requests.Session, url: str, timeout: float = 60, **kwargs) -> requests.Response:
+    """GET with If-None-Match/If-Modified-Since from the on-disk cache.
+
+    A 304 is turned into a 200 response carrying the cached body (marked `from_cache`),
+    so callers validate and consume it exactly like a fresh download.
+    """
+    meta = http_cache_load(url)
+    headers = dict(kwargs.pop('headers', None) or HEADERS)
+    if meta:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    r = throttled_get(session, url, headers=headers, timeout=timeout, **kwargs)
+    if r.status_code == 304 and meta:
+        meta_path, body_path = _http_cache_paths(url)
+        with open(body_path, 'rb') as f:
+            r._content = f.read()
+        # a revalidated entry is fresh again as far as prune_http_cache() is concerned
+        for path in (meta_path, body_path):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        r.status_code = 200
+        r.encoding = meta.get('encoding') or 'utf-8'
+        r.from_cache = True
+        print(f"HTTP cache hit (304): {url}")
+    return r
+
+
+def prune_http_cache(max_age_days: int = HTTP_CACHE_MAX_AGE_DAYS) -> None:
+    """Drop cache entries not revalidated for `max_age_days` so the directory stays bounded."""
+    if not os.path.isdir(HTTP_CACHE_DIR):
+        return
+    cutoff = time.time() - max_age_days * 86400
+    for dirpath, _, files in os.walk(HTTP_CACHE_DIR):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+def _proxy_url(provider: str, url: str, render: bool) -> str:
+    target = requests.utils.quote(url, safe='')
+    if provider == 'scraperapi':
+        return f"https://api.scraperapi.com?api_key={SCRAPERAPI_KEY}&url={target}&country=de" + ('&render=true' if render else '')
+    return f"https://app.scrapingbee.com/api/v1/?api_key={SCRAPINGBEE_KEY}&url={target}&render_js={'true' if render else 'false'}"
+
+
+def _proxy_get(provider: str, level: str, url: str) -> str:
+    started = time.monotonic()
+    ok = False
+    try:
+        r = throttled_get(get_session(), _proxy_url(provider, url, level == 'render'), provider,
+                          headers=HEADERS, timeout=PROXY_TIMEOUTS[level])
+        r.raise_for_status()
+        ok = True
+        return r.text
+    finally:
+        with _usage_lock:
+            u = _proxy_usage.setdefault((provider, level), {'requests': 0, 'ok': 0, 'credits': 0, 'secs': 0.0})
+            u['requests'] += 1
+            u['secs'] += time.monotonic() - started
+            if ok:
+                u['ok'] += 1
+                u['credits'] += PROXY_CREDITS[(provider, level)]
+
+
+def fetch_via_proxy(url: str, render: bool | None = None) -> str:
+    """Fetch through ScraperAPI, then ScrapingBee; a provider whose circuit is open is skipped.
+
+    By default each provider is first asked for the plain page, which must pass check_page();
+    only if that fails is the (slower, pricier) JS-rendered fetch used. Hosts whose plain page
+    was rejected by check_page() once go straight to rendering for the rest of the run (a plain
+    fetch that merely errored says nothing about the page). `render=True` skips the plain step.
+    """
+    providers = [p for p, key in (('scraperapi', SCRAPERAPI_KEY), ('scrapingbee', SCRAPINGBEE_KEY)) if key]
+    if not providers:
+        raise RuntimeError('no proxy key')
+    host = (urlparse(url).hostname or '').lower()
+    if render is None:
+        render = host in _render_hosts
+    levels = ['render'] if render else ['plain', 'render']
+    last_error = None
+    rejected = False
+    for provider in providers:
+        for level in levels:
+            try:
+                text = guarded(provider, _proxy_get, provider, level, url)
+            except (DeadlineExceeded, HedgeCancelled):
+                raise
+            except CircuitOpen as e:
+                # the provider is down for either level: try the next one
+                last_error = e
+                break
+            except Exception as e:
+                if level == 'plain':
+                    print(f"Plain proxy fetch via {provider} failed for {url}: {e}; escalating to render")
+                last_error = e
+                continue
+            if level == 'plain':
+                try:
+                    check_page(text)
+                except Exception as e:
+                    print(f"Plain proxy fetch via {provider} not usable for {url}: {e}; escalating to render")
+                    last_error = e
+                    rejected = True
+                    continue
+            elif rejected:
+                _render_hosts.add(host)
+            return text
+    raise last_error
+
+
+def log_proxy_usage() -> None:
+    with _usage_lock:
+        usage = sorted(_proxy_usage.items())
+    if not usage:
+        return
+    print("Proxy usage:")
+    for (provider, level), u in usage:
+        print(f"  {provider}/{level}: {u['requests']} requests, {u['ok']} ok, "
+              f"{u['credits']} credits, {u['secs']:.1f}s")
+
+
+def load_image_overrides() -> dict:
+    try:
+        if os.path.exists(OVERRIDES_PATH):
+            with open(OVERRIDES_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                # structure:
+                # {
+                #   "by_href": { "<article_url>": "<image_url>" },
+                #   "by_title_substr": { "Week in Quotes": "<image_url>" }
+                # }
+                return data or {}
+    except Exception:
+        pass
+    return {}
+
+
+class ImageOverrides:
+    """image_overrides.json compiled for lookups: an exact map for `by_href`, and an
+    Aho-Corasick automaton over the lowercased `by_title_substr` keys, so matching a title
+    costs one pass over the title however many keys there are."""
+
+    def __init__(self, data: dict):
+        data = data if isinstance(data, dict) else {}
+        self.by_href = {canonical_url(k): v for k, v in (data.get('by_href') or {}).items()}
+        by_title_substr = data.get('by_title_substr') or {}
+        # state -> {char: state}, failure links, and the earliest key (file order) ending at
+        # the state or any of its suffix states; -1 when none
+        self.goto: list[dict] = [{}]
+        self.fail = [0]
+        self.first = [-1]
+        self.images = []
+        for key, img in by_title_substr.items():
+            if not key:
+                continue
+            state = 0
+            for ch in key.lower():
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.first.append(-1)
+                state = nxt
+            if self.first[state] == -1:
+                self.first[state] = len(self.images)
+            self.images.append(img)
+        # breadth-first, so a state's failure target is complete before the state itself
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                inherited = self.first[self.fail[nxt]]
+                if inherited != -1 and (self.first[nxt] == -1 or inherited < self.first[nxt]):
+                    self.first[nxt] = inherited
+                queue.append(nxt)
+
+    def title_image(self, title: str) -> str | None:
+        """Image of the first `by_title_substr` key (in file order) found in `title`."""
+        if not self.images or not title:
+            return None
+        goto, fail, first = self.goto, self.fail, self.first
+        best = -1
+        state = 0
+        for ch in title.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = first[state]
+            if hit != -1 and (best == -1 or hit < best):
+                best = hit
+                if best == 0:
+                    break
+        return self.images[best] if best != -1 else None
+
+    def image_for(self, href: str, title: str) -> str | None:
+        return self.by_href.get(canonical_url(href)) or self.title_image(title)
+
+
+def image_overrides() -> ImageOverrides:
+    """The compiled overrides, re-read only when OVERRIDES_PATH's mtime changes."""
+    global _overrides
+    try:
+        mtime = os.stat(OVERRIDES_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    with _overrides_lock:
+        if _overrides is None or _overrides[0] != mtime:
+            _overrides = (mtime, ImageOverrides(load_image_overrides() if mtime is not None else {}))
+        return _overrides[1]
+
+
+def _fetch_stats() -> dict:
+    """Per-host, per-tier fetch outcomes, loaded once from FETCH_STATS_PATH.
+    Replays always start empty so that they are repeatable.
+    """
+    global _tier_stats
+    with _stats_lock:
+        if _tier_stats is None:
+            _tier_stats = {}
+            if not BWF_REPLAY:
+                try:
+                    with open(FETCH_STATS_PATH, 'r', encoding='utf-8') as f:
+                        _tier_stats = json.load(f) or {}
+                except Exception:
+                    pass
+        return _tier_stats
+
+
+def record_tier(host: str, tier: str, ok: bool, seconds: float) -> None:
+    stats = _fetch_stats()
+    with _stats_lock:
+        st = stats.setdefault(host, {}).setdefault(tier, {'ok': 0, 'fail': 0, 'streak': 0, 'secs': seconds})
+        if ok:
+            st['ok'] += 1
+            st['streak'] = 0
+        else:
+            st['fail'] += 1
+            st['streak'] += 1
+        # exponentially weighted so a tier that recovers (or degrades) is re-ranked within a few runs
+        st['secs'] = round(0.7 * st['secs'] + 0.3 * seconds, 3)
+        st['last'] = time.time()
+
+
+def recently_failed(host: str, source: str, hours: float) -> bool:
+    """True while a per-host source recorded like a tier (e.g. 'wp_api') is within `hours` of a failure."""
+    st = _fetch_stats().get(host, {}).get(source)
+    return bool(st and st['streak'] and time.time() - st.get('last', 0) < hours * 3600)
+
+
+def order_tiers(host: str, tiers: list) -> list:
+    """Order (name, fn) tiers cheapest-first by expected seconds per successful fetch.
+
+    Tiers with fewer than TIER_MIN_SAMPLES attempts are tried first so every tier gets
+    measured; tiers on a failure streak are moved behind the rest until TIER_SKIP_HOURS pass.
+    """
+    stats = _fetch_stats().get(host) or {}
+    now = time.time()
+
+    def key(indexed):
+        idx, (name, _) = indexed
+        st = stats.get(name)
+        if not st or st['ok'] + st['fail'] < TIER_MIN_SAMPLES:
+            return (0, 0.0, idx)
+        skipped = st['streak'] >= TIER_SKIP_STREAK and now - st.get('last', 0) < TIER_SKIP_HOURS * 3600
+        rate = st['ok'] / (st['ok'] + st['fail'])
+        return (2 if skipped else 1, st['secs'] / max(rate, 0.01), idx)
+
+    ordered = [t for _, t in sorted(enumerate(tiers), key=key)]
+    names = [n for n, _ in ordered]
+    if names != [n for n, _ in tiers] and host not in _order_logged:
+        _order_logged.add(host)
+        print(f"Fetch order for {host}: {' -> '.join(names)}")
+    return ordered
+
+
+def save_fetch_stats() -> None:
+    if _tier_stats is None or BWF_REPLAY:
+        return
+    try:
+        with _stats_lock:
+            data = json.dumps(_tier_stats, indent=1, sort_keys=True).encode('utf-8')
+        _write_atomic(FETCH_STATS_PATH, data)
+    except Exception as e:
+        print(f"Failed to save fetch stats: {e}")
+
+
+# --- Page classification ---
+# Cloudflare block/challenge markers, looked for anywhere in the page
+BLOCK_MARKERS = (b'cloudflare', b'blocked', b'attention required')
+# Cookie-wall wording, looked for in the page text only; two different ones make a consent page
+CONSENT_SIGNALS = (b'we do not use cookies of this type', b'cookie', b'consent', b'privacy', b'gdpr')
+MIN_PAGE_BYTES = 1000
+# markup get_text() leaves out: script/style/template/ruby-annotation bodies, comments and tags
+_MARKUP_RE = re.compile(rb'<(script|style|template|rt|rp)\b.*?</\1\s*>|<!--.*?-->|<[a-z/!?][^>]*>', re.S)
+
+
+def classify_page(body, consent: bool = True) -> str:
+    """Verdict on a fetched page (raw bytes or str), without parsing it:
+    'blocked' / 'challenge' (Cloudflare), 'truncated' (suspiciously short),
+    'consent' (a cookie wall, only with `consent`) or 'ok'.
+
+    The page is ASCII-lowercased once as bytes; every marker is then a plain substring
+    search, which is much faster than a case-insensitive regex over the page.
+    """
+    raw = body.encode('utf-8', 'replace') if isinstance(body, str) else (body or b'')
+    low = raw.lower()
+    cloudflare, blocked, attention = (m in low for m in BLOCK_MARKERS)
+    if cloudflare and blocked:
+        return 'blocked'
+    if cloudflare and attention:
+        return 'challenge'
+    if len(raw) < MIN_PAGE_BYTES:
+        return 'truncated'
+    if consent:
+        text = _MARKUP_RE.sub(b' ', low)
+        if sum(1 for s in CONSENT_SIGNALS if s in text) >= 2:
+            return 'consent'
+    return 'ok'
+
+
+PAGE_ERRORS = {
+    'blocked': "Cloudflare blocked the request",
+    'challenge': "Cloudflare challenge page received",
+    'truncated': "Received suspiciously short response",
+}
+
+
+def check_page(body) -> None:
+    """Raise if a fetched page is a Cloudflare block/challenge or suspiciously short."""
+    verdict = classify_page(body, consent=False)
+    if verdict in PAGE_ERRORS:
+        raise Exception(PAGE_ERRORS[verdict])
+
+
+def _fetch_cloudscraper(url: str) -> str:
+    r = conditional_get(get_scraper(), url, timeout=60)
+    r.raise_for_status()
+    check_page(r.content)
+    http_cache_store(url, r)
+    return r.text
+
+
+def _fetch_direct(url: str) -> str:
+    r = conditional_get(get_session(), url, timeout=60)
+    r.raise_for_status()
+    check_page(r.content)
+    http_cache_store(url, r)
+    return r.text
+
+
+TIER_LABELS = {'proxy': 'Proxy', 'cloudscraper': 'Cloudscraper', 'direct': 'Direct request'}
+
+
+def fetch(url: str, use_cloud: bool = True) -> str:
+    """Page text via the best tier for its host; within a scrape() run each canonical URL
+    is fetched once per `use_cloud` setting (see UrlFrontier)."""
+    # a fetch kept off cloudscraper may fail where one allowed it succeeds: never share them
+    kind = 'page' if use_cloud else 'cloudless page'
+    return single_flight(kind, url, lambda u: _fetch_page(u, use_cloud))
+
+
+def _fetch_page(url: str, use_cloud: bool) -> str:
+    host = (urlparse(url).hostname or '').lower()
+    
+    # A host that failed on every tier several times in a row is short-circuited until its cooldown
+    host_cb = breaker(f'host:{host}')
+    if not host_cb.allow():
+        raise CircuitOpen(f"circuit open: host:{host}")
+    try:
+        text = _fetch_tiers(url, host, use_cloud)
+    except (CircuitOpen, DeadlineExceeded, HedgeCancelled):
+        host_cb.release()
+        raise
+    except Exception as e:
+        if _counts_as_outage(e):
+            host_cb.failure()
+        else:
+            host_cb.success()
+        raise
+    host_cb.success()
+    return text
+
+
+def _fetch_tiers(url: str, host: str, use_cloud: bool) -> str:
+    # For BWF sites, walk proxy / cloudscraper / direct tiers, best-performing for this host first
+    if is_official_host(host):
+        tiers = []
+        if SCRAPERAPI_KEY or SCRAPINGBEE_KEY:
+            # providers carry their own breakers inside fetch_via_proxy
+            tiers.append(('proxy', fetch_via_proxy))
+        if use_cloud and cloudscraper is not None:
+            tiers.append(('cloudscraper', functools.partial(guarded, f'cloudscraper@{host}', _fetch_cloudscraper)))
+        tiers.append(('direct', functools.partial(guarded, f'direct@{host}', _fetch_direct)))
+        ordered = order_tiers(host, tiers)
+        if BWF_HEDGE and len(ordered) > 1:
+            return _fetch_hedged(url, host, ordered)
+        last_error = None
+        for name, fn in ordered:
+            try:
+                return _attempt_tier(url, host, name, fn)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                last_error = e
+        raise last_error
+    
+    # For non-BWF sites, use direct request
+    r = conditional_get(get_session(), url, timeout=60)
+    r.raise_for_status()
+    http_cache_store(url, r)
+    return r.text
+
+
+def _attempt_tier(url: str, host: str, name: str, fn) -> str:
+    """Run one tier, recording its outcome; CircuitOpen/cancelled calls leave the stats alone."""
+    started = time.monotonic()
+    try:
+        text = fn(url)
+    except (DeadlineExceeded, HedgeCancelled):
+        raise
+    except CircuitOpen as e:
+        # nothing was sent, so the tier's statistics stay untouched
+        print(f"{TIER_LABELS[name]} skipped for {url}: {e}")
+        raise
+    except Exception as e:
+        record_tier(host, name, False, time.monotonic() - started)
+        print(f"{TIER_LABELS[name]} failed for {url}: {e}")
+        raise
+    record_tier(host, name, True, time.monotonic() - started)
+    return text
+
+
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.I)
+
+
+def _stream_head(session: requests.Session, url: str) -> str:
+    """Download `url` only up to its </head> and close the connection."""
+    r = throttled_get(session, url, headers=HEADERS, timeout=30, stream=True)
+    buf = b''
+    try:
+        r.raise_for_status()
+        for chunk in r.iter_content(8192):
+            # the closing tag may straddle two chunks
+            start = max(0, len(buf) - 16)
+            buf += chunk
+            m = _HEAD_END_RE.search(buf, start)
+            if m:
+                buf = buf[:m.end()]
+                break
+            if len(buf) >= HEAD_MAX_BYTES:
+                raise Exception(f"no </head> in the first {HEAD_MAX_BYTES} bytes")
+        return buf.decode(r.encoding or 'utf-8', errors='replace')
+    finally:
+        r.close()
+        record_streamed(url, r, buf)
+
+
+def fetch_head(url: str) -> str | None:
+    """<head> of an official page through the cheapest streaming (non-proxy) tier.
+
+    Returns None when the proxy ranks first for the host (it bills and sends whole pages
+    anyway) or every streaming tier fails; the caller then does a normal fetch().
+    """
+    host = (urlparse(url).hostname or '').lower()
+    tiers = []
+    if SCRAPERAPI_KEY or SCRAPINGBEE_KEY:
+        tiers.append(('proxy', None))
+    if cloudscraper is not None:
+        tiers.append(('cloudscraper', get_scraper))
+    tiers.append(('direct', get_session))
+    for name, client in order_tiers(host, tiers):
+        if client is None:
+            return None
+        try:
+            return guarded(f'{name}@{host}', _stream_head, client(), url)
+        except (DeadlineExceeded, HedgeCancelled):
+            raise
+        except Exception as e:
+            print(f"Head fetch via {TIER_LABELS[name]} failed for {url}: {e}")
+    return None
+
+
+def is_flaky_host(host: str, tier: str) -> bool:
+    st = (_fetch_stats().get(host) or {}).get(tier)
+    if not st or st['ok'] + st['fail'] < TIER_MIN_SAMPLES:
+        return False
+    return st['fail'] / (st['ok'] + st['fail']) >= FLAKY_FAILURE_RATE
+
+
+def _hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _hedge_pool
+    with _client_lock:
+        if _hedge_pool is None:
+            # every concurrent fetch may run two tiers at once
+            _hedge_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2 * POOL_SIZE, thread_name_prefix='hedge')
+        return _hedge_pool
+
+
+def _run_hedge_side(url: str, host: str, name: str, fn, cancel: threading.Event) -> str:
+    _hedge_ctx.cancel = cancel
+    try:
+        text = _attempt_tier(url, host, name, fn)
+        check_page(text)
+        return text
+    finally:
+        _hedge_ctx.cancel = None
+
+
+def _fetch_hedged(url: str, host: str, ordered: list) -> str:
+    """Race the best tier against the next one; remaining tiers run in turn if both fail.
+
+    Python cannot abort a request that is already on the wire, so the losing side is
+    cancelled cooperatively: it is never retried, and its late result is dropped.
+    """
+    pool = _hedge_executor()
+    cancel = threading.Event()
+    waiting = list(ordered)
+    pending: dict = {}
+
+    def launch() -> None:
+        name, fn = waiting.pop(0)
+        pending[pool.submit(carry_strategy(_run_hedge_side), url, host, name, fn, cancel)] = name
+
+    launch()
+    hedge_after = 0.0 if is_flaky_host(host, ordered[0][0]) else BWF_HEDGE_DELAY
+    hedged = False
+    last_error = None
+    try:
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, timeout=None if hedged or not waiting else hedge_after,
+                return_when=concurrent.futures.FIRST_COMPLETED)
+            if not done:
+                print(f"Hedging {url}: starting {TIER_LABELS[waiting[0][0]]} alongside {', '.join(pending.values())}")
+                launch()
+                hedged = True
+                continue
+            for f in done:
+                pending.pop(f)
+                try:
+                    return f.result()
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    last_error = e
+            if not pending and waiting:
+                # everything in flight failed: move on to the next tier
+                launch()
+        raise last_error
+    finally:
+        cancel.set()
+        for f in pending:
+            f.cancel()
+
 
-SCRAPERAPI_KEY = os.getenv('SCRAPERAPI_KEY')
-SCRAPINGBEE_KEY = os.getenv('SCRAPINGBEE_KEY')
-BWF_FORCE_PROXY = os.getenv('BWF_FORCE_PROXY', '').strip().lower() in ('1', 'true', 'yes')
-BWF_MODE = (os.getenv('BWF_MODE', '').strip().lower() or 'default')  # 'default' | 'list_only'
+# Process-wide caps for the async engine: every AsyncFetcher.map() call, including those of
+# strategies running side by side and nested ones, draws on the same allowance
+_inflight_gate = threading.BoundedSemaphore(BWF_MAX_INFLIGHT)
+_host_gates: dict[str, threading.BoundedSemaphore] = {}
+_host_gates_lock = threading.Lock()
+_gate_ctx = threading.local()
 
 
-def is_official_host(host: str) -> bool:
-    return host == 'bwfbadminton.com' or host.endswith('.bwfbadminton.com')
+def host_gate(host: str) -> threading.BoundedSemaphore:
+    with _host_gates_lock:
+        gate = _host_gates.get(host)
+        if gate is None:
+            gate = _host_gates[host] = threading.BoundedSemaphore(BWF_PER_HOST)
+        return gate
 
-def is_main_host(host: str) -> bool:
-    """Return True only for the primary site host (no subdomains)."""
-    return (host or '').lower() == 'bwfbadminton.com'
 
+def _fetch_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _fetch_pool
+    with _client_lock:
+        if _fetch_pool is None:
+            _fetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=BWF_MAX_INFLIGHT, thread_name_prefix='fetch')
+        return _fetch_pool
 
-_MONTH_RE = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:t|tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
 
-def remove_date_from_title(title: str) -> str:
-    """Strip trailing inline dates like '05 Sep', '7 September 2025' from listing titles."""
-    if not title:
-        return title
-    s = title.strip()
-    patterns = [
-        rf"\b\d{{1,2}}\s+{_MONTH_RE}\s+\d{{4}}$",
-        rf"\b\d{{1,2}}\s+{_MONTH_RE}$",
-    ]
-    for pat in patterns:
-        s = re.sub(pat, "", s, flags=re.IGNORECASE).rstrip(" -|,–—").strip()
-    return s
+class AsyncFetcher:
+    """Runs blocking fetch/parse calls on an asyncio loop, capped globally and per target host.
 
+    Every map() hands its work to one process-wide thread pool as wide as the global cap, so
+    dozens of slow proxy requests can be in flight at once while no single host sees more
+    than BWF_PER_HOST. The caps are process-wide semaphores taken around each call.
 
-def fetch_via_proxy(url: str) -> str:
-    if SCRAPERAPI_KEY:
-        proxy = f"https://api.scraperapi.com?api_key={SCRAPERAPI_KEY}&url={requests.utils.quote(url, safe='')}&country=de&render=true"
-        r = requests.get(proxy, headers=HEADERS, timeout=60)
-        r.raise_for_status()
-        return r.text
-    if SCRAPINGBEE_KEY:
-        proxy = f"https://app.scrapingbee.com/api/v1/?api_key={SCRAPINGBEE_KEY}&url={requests.utils.quote(url, safe='')}&render_js=true"
-        r = requests.get(proxy, headers=HEADERS, timeout=60)
-        r.raise_for_status()
-        return r.text
-    raise RuntimeError('no proxy key')
+    A call that fans out into another map() is already on a pool thread: it hands its slots
+    back, works through the inner items itself, and asks idle pool threads to help, rather
+    than blocking on work queued behind it. Nesting neither adds threads nor deadlocks.
+    """
 
+    @staticmethod
+    def _call(fn, item, host: str, until: float | None, skip):
+        gates = (_inflight_gate, host_gate(host))
+        for gate in gates:
+            gate.acquire()
+        # a nested map() may run calls on this thread while an outer one waits on it
+        outer = getattr(_gate_ctx, 'held', None)
+        _gate_ctx.held = gates
+        try:
+            if RUN_DEADLINE.expired() or (until is not None and time.monotonic() >= until):
+                raise DeadlineExceeded('run deadline reached')
+            check_abandoned()
+            if skip is not None and skip(item):
+                raise Skipped('no longer needed')
+            return fn(item)
+        finally:
+            _gate_ctx.held = outer
+            for gate in reversed(gates):
+                gate.release()
 
-def load_image_overrides() -> dict:
-    try:
-        if os.path.exists(OVERRIDES_PATH):
-            with open(OVERRIDES_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # structure:
-                # {
-                #   "by_href": { "<article_url>": "<image_url>" },
-                #   "by_title_substr": { "Week in Quotes": "<image_url>" }
-                # }
-                return data or {}
-    except Exception:
-        pass
-    return {}
+    async def _gather(self, fn, items: list, url_of, until: float | None, skip) -> list:
+        loop = asyncio.get_running_loop()
+        executor = _fetch_executor()
+        call = carry_strategy(self._call)
 
+        async def run_one(item):
+            host = (urlparse(url_of(item)).hostname or '').lower()
+            return await loop.run_in_executor(executor, call, fn, item, host, until, skip)
 
-def fetch(url: str, use_cloud: bool = True) -> str:
-    host = (urlparse(url).hostname or '').lower()
-    
-    # For BWF sites, always try proxy first if available, then cloudscraper, then direct
-    if is_official_host(host):
-        # Try proxy services first (most reliable for Cloudflare)
-        if SCRAPERAPI_KEY or SCRAPINGBEE_KEY:
+        return await asyncio.gather(*(run_one(it) for it in items), return_exceptions=True)
+
+    def _nested(self, fn, items: list, url_of, until: float | None, skip) -> list:
+        """map() from inside a call: this thread and any idle pool threads take the items in
+        order; helpers still queued once all are taken are cancelled, not waited for."""
+        results = [None] * len(items)
+        pending = deque(range(len(items)))
+
+        def drain():
+            while True:
+                try:
+                    i = pending.popleft()
+                except IndexError:
+                    return
+                host = (urlparse(url_of(items[i])).hostname or '').lower()
+                try:
+                    results[i] = self._call(fn, items[i], host, until, skip)
+                except Exception as e:
+                    results[i] = e
+
+        executor = _fetch_executor()
+        helpers = [executor.submit(carry_strategy(drain)) for _ in range(min(len(items), BWF_MAX_INFLIGHT) - 1)]
+        drain()
+        # a cancelled future only counts as done once a pool thread reaches it: skip those
+        concurrent.futures.wait([f for f in helpers if not f.cancel()])
+        return results
+
+    def map(self, fn, items: list, url_of=None, until: float | None = None, skip=None) -> list:
+        """Apply `fn` to every item, starting them in order; results (or raised exceptions)
+        come back in input order. Items not started by `until` (monotonic) fail with
+        DeadlineExceeded, and those for which skip(item) is true when their turn comes with Skipped."""
+        if not items:
+            return []
+        held = getattr(_gate_ctx, 'held', None)
+        if not held:
+            return asyncio.run(self._gather(fn, list(items), url_of or (lambda it: it), until, skip))
+        for gate in reversed(held):
+            gate.release()
+        try:
+            return self._nested(fn, list(items), url_of or (lambda it: it), until, skip)
+        finally:
+            for gate in held:
+                gate.acquire()
+
+
+def run_all(fn, items: list, url_of=None, until: float | None = None, newest_first: bool = False) -> list:
+    """Apply `fn` to each item, on the async engine when BWF_ASYNC is set, else on up to
+    BWF_CONCURRENCY threads. Either way results keep input order, exceptions are returned in
+    place of results, and items not started by `until` (monotonic) get DeadlineExceeded.
+
+    With `newest_first` (article fetches during scrape()), items start in order of their
+    URL's date hint, newest first, and once MAX_ITEMS confirmed items are newer than an
+    item's hint it is dropped as Skipped: not started, or cancelled while queued.
+    """
+    items = list(items)
+    if not items:
+        return []
+    url_of = url_of or (lambda it: it)
+    frontier = _frontier if newest_first else None
+    order = list(range(len(items)))
+    skip = None
+    if frontier is not None:
+        order.sort(key=lambda i: frontier.hint_key(url_of(items[i])))
+        skip = lambda it: frontier.behind(url_of(it))
+    ordered = [items[i] for i in order]
+
+    if BWF_ASYNC:
+        done = AsyncFetcher().map(fn, ordered, url_of, until, skip)
+    else:
+        def call(it):
+            if RUN_DEADLINE.expired() or (until is not None and time.monotonic() >= until):
+                return DeadlineExceeded('run deadline reached')
+            if stopped():
+                return Abandoned('strategy stopped at its time budget')
+            if skip is not None and skip(it):
+                return Skipped('no longer needed')
             try:
-                return fetch_via_proxy(url)
+                return fn(it)
             except Exception as e:
-                print(f"Proxy failed for {url}: {e}")
-        
-        # Try cloudscraper (good for Cloudflare bypass)
-        if use_cloud and cloudscraper is not None:
+                return e
+
+        if len(items) == 1:
+            done = [call(items[0])]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(BWF_CONCURRENCY, len(items))) as executor:
+                call = carry_strategy(call)
+                futures = [executor.submit(call, it) for it in ordered]
+                if skip is not None:
+                    # each finished item may confirm a date that puts queued ones out of reach
+                    for _ in concurrent.futures.as_completed(futures):
+                        for f, it in zip(futures, ordered):
+                            if not f.done() and skip(it):
+                                f.cancel()
+                done = [Skipped('cancelled') if f.cancelled() else f.result() for f in futures]
+    results = [None] * len(items)
+    for i, r in zip(order, done):
+        results[i] = r
+    return results
+
+
+def fetch_all(urls: list[str], use_cloud: bool = True, until: float | None = None) -> list:
+    """Fetch several pages; each entry is the page text or the exception that fetch() raised
+    (DeadlineExceeded for those not started by `until`)."""
+    return run_all(lambda u: fetch(u, use_cloud=use_cloud), urls, until=until)
+
+
+# --- URL frontier ------------------------------------------------------------------------
+# The strategies overlap (one story can turn up in Google News, Latest News and a tournament
+# overview, spelled http://, with ?utm_ tags or without its trailing slash), so during a
+# scrape() run page fetches and article parses go through one frontier keyed by canonical
+# URL: each is done once, and a caller asking for one already in flight waits for it.
+
+TRACKING_PARAMS = frozenset(('fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid', '_ga', 'ref_src'))
+TRACKING_PREFIXES = ('utm_',)
+
+
+@functools.lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
+    """One spelling per page: no fragment or tracking parameters, lowercase host without a
+    default port and, on BWF hosts, https, no www. and a trailing slash on (query-less)
+    directory paths."""
+    s = (url or '').strip()
+    try:
+        u = urlparse(s)
+        port = u.port
+    except ValueError:
+        return s
+    if not u.scheme or not u.hostname:
+        return s
+    scheme, host, path = u.scheme.lower(), u.hostname, u.path or '/'
+    query = u.query
+    if query:
+        pairs = parse_qsl(query, keep_blank_values=True)
+        kept = [(k, v) for k, v in pairs
+                if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)]
+        if len(kept) != len(pairs):
+            query = urlencode(kept)
+    if is_official_host(host):
+        scheme = 'https'
+        host = host.removeprefix('www.')
+        if '.' not in path.rsplit('/', 1)[-1] and not path.endswith('/') and not query:
+            path += '/'
+    netloc = host if port is None or (scheme, port) in (('http', 80), ('https', 443)) else f'{host}:{port}'
+    return urlunparse((scheme, netloc, path, u.params, query, ''))
+
+
+class UrlFrontier:
+    """Single-flight memo of one run's work by (kind, canonical URL). The work is done for the
+    URL as its first caller gave it (canonical_url() only decides what counts as the same
+    page). A successful result is kept for the rest of the run; a failure goes to the callers
+    already waiting on it and is then forgotten, so a later caller tries again.
+
+    It also tracks dates: cheap hints for URLs not fetched yet (URL path date, listing card
+    time, feed pubDate) and the dates of items the run already has, so article fetches can go
+    newest first and stop once MAX_ITEMS confirmed items are newer than anything left.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[tuple, concurrent.futures.Future] = {}
+        self.requests = 0
+        self.merged = 0
+        self._hints: dict[str, str] = {}
+        self._confirmed: dict[str, datetime] = {}
+        self._cutoff: datetime | None = None
+
+    def once(self, kind: str, url: str, fn):
+        key = (kind, canonical_url(url))
+        with self._lock:
+            self.requests += 1
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                owner = future is None
+                if owner:
+                    future = self._calls[key] = concurrent.futures.Future()
+                else:
+                    self.merged += 1
+            if owner:
+                try:
+                    future.set_result(fn(url))
+                except BaseException as e:
+                    with self._lock:
+                        del self._calls[key]
+                    future.set_exception(e)
             try:
-                scraper = cloudscraper.create_scraper(
-                    browser={
-                        'browser': 'chrome',
-                        'platform': 'windows',
-                        'desktop': True
-                    }
-                )
-                r = scraper.get(url, headers=HEADERS, timeout=60)
-                r.raise_for_status()
-                
-                # Check if we got blocked or received invalid content
-                content_lower = r.text.lower()
-                if 'cloudflare' in content_lower and 'blocked' in content_lower:
-                    raise Exception("Cloudflare blocked the request")
-                if 'attention required' in content_lower and 'cloudflare' in content_lower:
-                    raise Exception("Cloudflare challenge page received")
-                if len(r.text) < 1000:  # Suspiciously short response
-                    raise Exception("Received suspiciously short response")
-                
-                return r.text
-            except Exception as e:
-                print(f"Cloudscraper failed for {url}: {e}")
-        
-        # Try direct request with session and retries
-        try:
-            session = requests.Session()
-            session.headers.update(HEADERS)
-            
-            # Add some delay to avoid rate limiting
-            time.sleep(2)
-            
-            r = session.get(url, timeout=60)
-            r.raise_for_status()
-            
-            # Check if we got blocked or received invalid content
-            content_lower = r.text.lower()
-            if 'cloudflare' in content_lower and 'blocked' in content_lower:
-                raise Exception("Cloudflare blocked the request")
-            if 'attention required' in content_lower and 'cloudflare' in content_lower:
-                raise Exception("Cloudflare challenge page received")
-            if len(r.text) < 1000:  # Suspiciously short response
-                raise Exception("Received suspiciously short response")
-            
-            return r.text
-        except Exception as e:
-            print(f"Direct request failed for {url}: {e}")
-            raise
-    
-    # For non-BWF sites, use direct request
-    r = requests.get(url, headers=HEADERS, timeout=60)
-    r.raise_for_status()
-    return r.text
+                return future.result()
+            except Abandoned:
+                # the strategy doing the work was stopped; a caller still running takes it over
+                if owner or stopped():
+                    raise
+
+    def note_date(self, url: str, date: str) -> None:
+        """Record a date hint for `url` (from a card or feed); the first one given is kept."""
+        if date:
+            with self._lock:
+                self._hints.setdefault(canonical_url(url), date)
+
+    def date_hint(self, url: str) -> datetime | None:
+        canon = canonical_url(url)
+        with self._lock:
+            hint = self._hints.get(canon, '')
+        return utc_date(url_path_date(canon) or hint)
+
+    def hint_key(self, url: str) -> tuple:
+        """Sort key: URLs without a hint first (they cannot be ruled out), then newest first."""
+        hint = self.date_hint(url)
+        return (0, 0.0) if hint is None else (1, -hint.timestamp())
+
+    def confirm(self, url: str, date: str) -> None:
+        """Record an item the run has; an href confirmed twice counts with its older date."""
+        dt = utc_date(date or url_path_date(url))
+        if dt is None:
+            return
+        canon = canonical_url(url)
+        with self._lock:
+            if canon in self._confirmed and self._confirmed[canon] <= dt:
+                return
+            self._confirmed[canon] = dt
+            if len(self._confirmed) >= MAX_ITEMS:
+                self._cutoff = heapq.nlargest(MAX_ITEMS, self._confirmed.values())[-1]
+
+    def behind(self, url: str) -> bool:
+        """True once MAX_ITEMS confirmed items are newer than `url`'s date hint."""
+        hint = self.date_hint(url)
+        with self._lock:
+            cutoff = self._cutoff
+        return hint is not None and cutoff is not None and hint < cutoff
+
+    def log(self) -> None:
+        with self._lock:
+            kinds: dict[str, int] = {}
+            for kind, _ in self._calls:
+                kinds[kind] = kinds.get(kind, 0) + 1
+            requests, merged = self.requests, self.merged
+        if requests:
+            counts = ', '.join(f"{kind}s: {n}" for kind, n in sorted(kinds.items()))
+            print(f"URL frontier: {counts or 'nothing kept'}; {merged} of {requests} requests served without a new fetch")
+
+
+def single_flight(kind: str, url: str, fn):
+    """fn(url), done once per canonical URL through the current run's frontier; outside
+    scrape() simply fn(url)."""
+    frontier = _frontier
+    if frontier is None:
+        return fn(url)
+    return frontier.once(kind, url, fn)
+
 
 # Helper to normalize potentially relative URLs to absolute based on base_url
 # Works with protocol-relative and path-relative inputs
@@ -181,116 +1773,656 @@ def to_abs_url(base_url: str, possibly_relative: str) -> str:
     return origin + s
 
 
-def discover_from_official_lists(limit: int = 40) -> list[str]:
-    base = 'https://bwfbadminton.com'
-    links: list[str] = []
+# --- HTML parser backends ----------------------------------------------------------------
+# Parsers only use a small node API: select(), select_one(), get(), get_text(), .name, .attrs,
+# .parent, .string, .contents and .next_elements. BeautifulSoup provides it natively; LxmlNode
+# provides it straight on top of the lxml tree (the same libxml2 parse bs4 uses), skipping the
+# cost of building the bs4 object tree. Selectors are limited to what the parsers use: type,
+# .class, #id, [attr], [attr=|*=|^=|$=|~="v" i], descendant and child combinators, comma lists.
+
+# Tags whose strings bs4 stores as Script/Stylesheet/TemplateString/... rather than plain text
+STRING_CONTAINERS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+# bs4 stores a string of nothing but ASCII whitespace as a single '\n' (if it has one) or ' ',
+# except inside these tags
+PRESERVE_WHITESPACE = frozenset(('pre', 'textarea'))
+_ASCII_SPACES = ' \n\t\x0c\r'
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_CSS_COMPOUND_RE = re.compile(r'\s*(>)?\s*([a-zA-Z][\w-]*|\*)?((?:\.[\w-]+|#[\w-]+|\[[^\]]*\])*)')
+_CSS_PART_RE = re.compile(r'\.([\w-]+)|#([\w-]+)|\[\s*([\w:-]+)\s*(?:([*^$~]?=)\s*("[^"]*"|\'[^\']*\'|[^\s\]]+)\s*([is])?\s*)?\]')
+
+
+def _xpath_literal(s: str) -> str:
+    if "'" not in s:
+        return f"'{s}'"
+    if '"' not in s:
+        return f'"{s}"'
+    return 'concat(' + ", \"'\", ".join(f"'{p}'" for p in s.split("'")) + ')'
+
+
+def _css_attr_xpath(name: str, op: str, value: str, ignore_case: bool) -> str:
+    # multi-valued class is matched the way bs4 hands it to soupsieve: tokens joined by one space
+    attr = 'normalize-space(@class)' if name == 'class' else f'@{name}'
+    if ignore_case or name == 'type':
+        attr = f"translate({attr}, '{_UPPER}', '{_UPPER.lower()}')"
+        value = value.lower()
+    lit = _xpath_literal(value)
+    if op == '=':
+        # soupsieve matches [a="v"] as ^v$, which also accepts one trailing newline
+        test = f'{attr}={lit} or {attr}={_xpath_literal(value + chr(10))}'
+    elif not value:
+        return 'false()'
+    elif op == '*=':
+        test = f'contains({attr}, {lit})'
+    elif op == '^=':
+        test = f'starts-with({attr}, {lit})'
+    elif op == '$=':
+        test = f'substring({attr}, string-length({attr}) - {len(value) - 1})={lit}'
+    else:
+        test = f"contains(concat(' ', normalize-space({attr}), ' '), {_xpath_literal(' ' + value + ' ')})"
+    return f'@{name} and ({test})'
+
+
+@functools.lru_cache(maxsize=256)
+def css_to_xpath(selector: str, include_self: bool = False):
+    """Compile a CSS selector (see the subset above) to an lxml XPath matching descendants."""
+    branches = []
+    for complex_sel in selector.split(','):
+        steps = []
+        pos = 0
+        complex_sel = complex_sel.strip()
+        while pos < len(complex_sel):
+            m = _CSS_COMPOUND_RE.match(complex_sel, pos)
+            if not m or m.end() == pos:
+                raise ValueError(f'unsupported selector: {selector!r}')
+            pos = m.end()
+            preds = []
+            for cls, ident, attr, op, value, flag in _CSS_PART_RE.findall(m.group(3) or ''):
+                if cls:
+                    preds.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')")
+                elif ident:
+                    preds.append(f'@id={_xpath_literal(ident)}')
+                elif not op:
+                    preds.append(f'@{attr.lower()}')
+                else:
+                    if value[:1] in ('"', "'"):
+                        value = value[1:-1]
+                    preds.append(_css_attr_xpath(attr.lower(), op, value, flag == 'i'))
+            steps.append((bool(m.group(1)), (m.group(2) or '*').lower(), preds))
+        if not steps:
+            raise ValueError(f'unsupported selector: {selector!r}')
+        # the right-most compound is the match; everything to its left becomes nested
+        # parent::/ancestor:: predicates, so `a b > c` is c[parent::b[ancestor::a]]
+        expr = ''
+        for child, tag, preds in steps:
+            cond = ''.join(f'[{p}]' for p in preds)
+            if expr:
+                cond += f"[{'parent' if child else 'ancestor'}::{expr}]"
+            expr = tag + cond
+        branches.append(expr)
+    prefix = 'descendant-or-self::' if include_self else 'descendant::'
+    return etree.XPath(' | '.join(prefix + b for b in branches))
+
+
+def _bs4_string(s: str, el) -> str:
+    """`s`, a text or tail inside element `el`, as bs4 would store it."""
+    if s.strip(_ASCII_SPACES) or el.tag in PRESERVE_WHITESPACE or any(
+            a.tag in PRESERVE_WHITESPACE for a in el.iterancestors()):
+        return s
+    return '\n' if '\n' in s else ' '
+
+
+class LxmlNode:
+    """bs4-compatible view of an lxml element (or of the whole document when is_doc)."""
+
+    __slots__ = ('el', 'is_doc', '_attrs')
+
+    def __init__(self, el, is_doc: bool = False):
+        self.el = el
+        self.is_doc = is_doc
+        self._attrs = None
+
+    def __eq__(self, other):
+        return isinstance(other, LxmlNode) and other.el is self.el and other.is_doc == self.is_doc
+
+    def __hash__(self):
+        return hash((id(self.el), self.is_doc))
+
+    def __bool__(self):
+        return True
+
+    @property
+    def name(self) -> str:
+        return '[document]' if self.is_doc else self.el.tag
+
+    @property
+    def attrs(self) -> dict:
+        if self._attrs is None:
+            attrs = {} if self.is_doc else dict(self.el.attrib)
+            if 'class' in attrs:
+                attrs['class'] = attrs['class'].split()
+            self._attrs = attrs
+        return self._attrs
+
+    def get(self, key: str, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key: str) -> bool:
+        return key in self.attrs
+
+    @property
+    def parent(self):
+        if self.is_doc:
+            return None
+        parent = self.el.getparent()
+        if parent is None:
+            return LxmlNode(self.el, is_doc=True)
+        return LxmlNode(parent)
+
+    def select(self, selector: str) -> list:
+        return [LxmlNode(e) for e in css_to_xpath(selector, self.is_doc)(self.el)]
+
+    def select_one(self, selector: str):
+        found = css_to_xpath(selector, self.is_doc)(self.el)
+        return LxmlNode(found[0]) if found else None
+
+    @property
+    def contents(self) -> list:
+        """Child elements and text, with comments and processing instructions left out."""
+        if self.is_doc:
+            return [LxmlNode(self.el)]
+        el = self.el
+        out = [_bs4_string(el.text, el)] if el.text else []
+        for child in el:
+            if isinstance(child.tag, str):
+                out.append(LxmlNode(child))
+            if child.tail:
+                out.append(_bs4_string(child.tail, el))
+        return out
+
+    @property
+    def next_elements(self):
+        """Elements after this one in document order (bs4 also yields strings; parsers skip those)."""
+        for e in self.el.xpath('descendant::* | following::*'):
+            yield LxmlNode(e)
+
+    @property
+    def string(self):
+        if self.is_doc:
+            return LxmlNode(self.el).string
+        el = self.el
+        if len(el) == 0:
+            return _bs4_string(el.text, el) if el.text else el.text
+        if len(el) == 1 and not el.text and not el[0].tail:
+            child = el[0]
+            if isinstance(child.tag, str):
+                return LxmlNode(child).string
+            return child.text
+        return None
+
+    def _strings(self):
+        # bs4 types each string by its innermost script/style/template/rt/rp ancestor and a tag
+        # only yields its own kind, so never descend into a nested container and yield nothing
+        # for an ordinary tag that sits inside one
+        el = self.el
+        if (not self.is_doc and el.tag not in STRING_CONTAINERS
+                and any(a.tag in STRING_CONTAINERS for a in el.iterancestors())):
+            return
+        stack = [el]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+                continue
+            if item.text:
+                yield _bs4_string(item.text, item)
+            for child in reversed(item):
+                if child.tail:
+                    stack.append(_bs4_string(child.tail, item))
+                if isinstance(child.tag, str) and child.tag not in STRING_CONTAINERS:
+                    stack.append(child)
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        strings = self._strings()
+        if strip:
+            strings = (s.strip() for s in strings)
+            strings = (s for s in strings if s)
+        return separator.join(strings)
+
+
+PARSER_BACKENDS = ('lxml', 'bs4')
+
+
+def parse_html(html: str, backend: str | None = None):
+    """Parse a page with the configured backend (BWF_PARSER); both return the same node API."""
+    if (backend or BWF_PARSER) == 'bs4':
+        return BeautifulSoup(html, 'lxml')
+    parser = etree.HTMLParser(recover=True)
     try:
-        html = fetch(f'{base}/news/')
-    except Exception:
-        return []
-    soup = BeautifulSoup(html, 'lxml')
-    for a in soup.select('a[href]'):
-        href = a.get('href') or ''
-        abs_url = to_abs_url(base, href)
-        try:
-            u = urlparse(abs_url)
-            # Strictly require the main site host and a news path
-            if is_main_host((u.hostname or '').lower()) and re.search(r'/news/[^/].+', u.path):
-                links.append(u.geturl())
-        except Exception:
-            continue
-        if len(links) >= limit:
-            break
-    # unique preserve order
-    seen = set()
-    uniq = []
-    for h in links:
-        if h in seen:
+        parser.feed(html or '')
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        root = None
+    if root is None:
+        root = etree.Element('html')
+    return LxmlNode(root, is_doc=True)
+
+
+# --- Listing cards -----------------------------------------------------------------------
+# Every listing parser is the same walk: for each news anchor in scope, take a "card" (the
+# anchor or one of its ancestors) and read title, image, preview and date from it. The rule
+# table below describes the differences between page layouts; extract_cards() applies a
+# compiled rule in one pass over the document, recording for every element the first
+# descendant that matches each card probe, so per-card lookups cost nothing extra.
+#
+# Rule keys (defaults in LISTING_RULE_DEFAULTS):
+#   container           class of the element whose anchors are used (first match); None = page
+#   container_required  return nothing when the container is missing
+#   href_contains       substring the raw href must contain
+#   keep_http_hrefs     use hrefs starting with 'http' as they are instead of to_abs_url()
+#   hosts               'main' (bwfbadminton.com only) or 'official' (any BWF host)
+#   news_path           require a /news/<slug> path
+#   dedupe              skip repeated hrefs (otherwise the caller dedupes after the limit)
+#   card_up             how many parents above the anchor the card is
+#   min_title           shortest acceptable raw title (0 keeps untitled cards)
+#   clean_title         strip trailing dates from the title
+#   title_or_href       use the href as title for untitled cards
+#   img                 image sources tried in order (see _card_image)
+#   strip_size          drop WordPress '-300x200' size suffixes from the image
+#   drop_generic        substrings that disqualify the card image
+#   dates               date sources tried in order: 'time', 'text', 'url'
+#   normalize_date      store the date as ISO-8601
+LISTING_RULE_DEFAULTS = {
+    'container': None,
+    'container_required': False,
+    'href_contains': '/news',
+    'keep_http_hrefs': False,
+    'hosts': 'official',
+    'news_path': False,
+    'dedupe': True,
+    'card_up': 0,
+    'min_title': 0,
+    'clean_title': False,
+    'title_or_href': False,
+    'img': (),
+    'strip_size': False,
+    'drop_generic': (),
+    'dates': (),
+    'normalize_date': False,
+}
+
+LISTING_RULES = {
+    # bwfbadminton.com home and /news/ pages: links to the latest news of all tournaments
+    'bwf_main': {
+        'keep_http_hrefs': True,
+        'hosts': 'main',
+        'card_up': 1,
+        'min_title': 10,
+        'clean_title': True,
+        'img': ('img_src_or_data',),
+        'dates': ('url',),
+        'normalize_date': True,
+    },
+    # generic /news/ listing of any BWF site, image and date taken from inside the anchor
+    'bwf_news': {
+        'href_contains': '/news/',
+        'news_path': True,
+        'min_title': 1,
+        'img': ('img_src_then_data', 'og_meta'),
+        'dates': ('time', 'text'),
+    },
+    # 'LATEST NEWS' block of bwfbadminton.com/news/ (scope is found by parse_listing_latest)
+    'bwf_latest': {
+        'href_contains': '/news/',
+        'hosts': 'main',
+        'news_path': True,
+        'dedupe': False,
+        'card_up': 2,
+        'min_title': 1,
+        'img': ('img_src_then_data', 'og_meta'),
+        'dates': ('time',),
+    },
+    # tournament sites (World Tour, Championships): cards in .news-overview-wrap, list data only
+    'tournament_list': {
+        'container': 'news-overview-wrap',
+        'clean_title': True,
+        'title_or_href': True,
+        'img': ('img_any', 'source_srcset', 'style'),
+        'strip_size': True,
+        'dates': ('time', 'text', 'url'),
+        'normalize_date': True,
+    },
+    # same pages, as fallbacks for the article enrichment of parse_championships_overview
+    'tournament_overview': {
+        'container': 'news-overview-wrap',
+        'container_required': True,
+        'card_up': 2,
+        'clean_title': True,
+        'img': ('img_any', 'source_srcset', 'style', 'og_meta'),
+        'strip_size': True,
+        'drop_generic': ('logo', 'favicon', 'default', 'placeholder', 'sprite', 'icon', 'avatar', 'thumbnail',
+                         'fi-', 'header', 'banner', 'featured', 'momota'),
+        'dates': ('time', 'text'),
+    },
+}
+
+# First-descendant lookups a card can use: field -> (tag, attribute test), each replacing the
+# select_one() selector noted beside it
+CARD_PROBES = {
+    'p': ('p', lambda attrs: True),                                                         # p
+    'time': ('time', lambda attrs: 'datetime' in attrs),                                    # time[datetime]
+    'img_src': ('img', lambda attrs: 'src' in attrs),                                       # img[src]
+    'img_data_src': ('img', lambda attrs: 'data-src' in attrs),                             # img[data-src]
+    'img_src_or_data': ('img', lambda attrs: 'src' in attrs or 'data-src' in attrs),
+    'img_any': ('img', lambda attrs: any(k in attrs for k in ('src', 'data-src', 'srcset', 'data-srcset'))),
+    'source_srcset': ('source', lambda attrs: 'srcset' in attrs),                           # source[srcset]
+    'og_meta': ('meta', lambda attrs: ('content' in attrs                                   # meta[property="og:image"][content]
+                                       and _attr_equals(attrs.get('property'), 'og:image'))),
+}
+# probes each image source reads
+_IMAGE_SOURCE_PROBES = {
+    'img_src_or_data': ('img_src_or_data',),
+    'img_src_then_data': ('img_src', 'img_data_src'),
+    'img_any': ('img_any',),
+    'source_srcset': ('source_srcset',),
+    'style': (),
+    'og_meta': ('og_meta',),
+}
+_NEWS_PATH_RE = re.compile(r'/news/[^/].+')
+_BACKGROUND_IMAGE_RE = re.compile(r"background-image\s*:\s*url\((['\"]?)(.+?)\1\)", re.I)
+_IMAGE_SIZE_SUFFIX_RE = re.compile(r'-\d+x\d+\.(jpg|jpeg|png|webp)$', re.IGNORECASE)
+
+
+def compile_listing_rule(rule: dict) -> dict:
+    compiled = dict(LISTING_RULE_DEFAULTS, **rule)
+    fields = ['p']
+    if 'time' in compiled['dates']:
+        fields.append('time')
+    for source in compiled['img']:
+        fields.extend(_IMAGE_SOURCE_PROBES[source])
+    probes: dict[str, list] = {}
+    for field in dict.fromkeys(fields):
+        tag, test = CARD_PROBES[field]
+        probes.setdefault(tag, []).append((field, test))
+    compiled['probes'] = probes
+    compiled['host_ok'] = is_main_host if compiled['hosts'] == 'main' else is_official_host
+    return compiled
+
+
+COMPILED_LISTING_RULES = {name: compile_listing_rule(rule) for name, rule in LISTING_RULES.items()}
+
+
+def _same_node(a, b) -> bool:
+    # bs4 tags compare by content, lxml wrappers by the element they wrap
+    return a is b or (isinstance(a, LxmlNode) and a == b)
+
+
+def _first_srcset_url(srcset: str) -> str:
+    parts = [p.strip() for p in (srcset or '').split(',') if p.strip()]
+    if parts:
+        return parts[0].split()[0]
+    return ''
+
+
+def _card_image(source: str, card: dict) -> str:
+    if source == 'img_src_or_data':
+        el = card.get('img_src_or_data')
+        return (el.get('src') or el.get('data-src') or '') if el else ''
+    if source == 'img_src_then_data':
+        el = card.get('img_src') or card.get('img_data_src')
+        return (el.get('src') or el.get('data-src') or '') if el else ''
+    if source == 'img_any':
+        el = card.get('img_any')
+        if not el:
+            return ''
+        return (el.get('src') or el.get('data-src')
+                or _first_srcset_url(el.get('srcset') or el.get('data-srcset') or ''))
+    if source == 'source_srcset':
+        el = card.get('source_srcset')
+        return _first_srcset_url(el.get('srcset')) if el and el.get('srcset') else ''
+    if source == 'style':
+        m = _BACKGROUND_IMAGE_RE.search(card['node'].get('style') or '')
+        return m.group(2) if m else ''
+    if source == 'og_meta':
+        el = card.get('og_meta')
+        return (el.get('content') or '') if el else ''
+    raise ValueError(f'unknown image source: {source}')
+
+
+def _card_date(source: str, card: dict, href_abs: str) -> str:
+    if source == 'time':
+        t = card.get('time')
+        return (t.get('datetime') or t.get_text(' ', strip=True) or '').strip() if t else ''
+    if source == 'text':
+        txt = card['node'].get_text(' ', strip=True)
+        mdate = DOW_DATE_RE.search(txt) or MONTH_DAY_YEAR_RE.search(txt)
+        return mdate.group(0) if mdate else ''
+    if source == 'url':
+        return url_path_date(href_abs)
+    raise ValueError(f'unknown date source: {source}')
+
+
+def _element_events(soup):
+    """('start' | 'end', element, name, attrs) for every tag of a parsed page, in document order.
+
+    Elements are the backend's own (bs4 Tag or lxml element); _as_node() turns the latter
+    into nodes. lxml pages are walked in C by iterwalk.
+    """
+    if isinstance(soup, LxmlNode):
+        for event, el in etree.iterwalk(soup.el, events=('start', 'end')):
+            if isinstance(el.tag, str):
+                yield event, el, el.tag, el.attrib
+        return
+    stack = [iter(soup.contents)]
+    while stack:
+        for child in stack[-1]:
+            if isinstance(child, Tag):
+                yield 'start', child, child.name, child.attrs
+                stack.append(iter(child.contents))
+                break
+        else:
+            stack.pop()
+            if stack:
+                yield 'end', None, None, None
+
+
+def _as_node(el):
+    return LxmlNode(el) if isinstance(el, etree._Element) else el
+
+
+def _walk_cards(soup, rule: dict, status: dict, scope=None, after=None, stop_tags=()):
+    """Yield (anchor, card record) for every anchor in scope, in document order, as soon as
+    the anchor's card element is closed; sets status['found'] when the scope element is seen.
+
+    Scope is the rule's container, or the explicit `scope` element, or (with `after`) the
+    elements following `after` up to the next tag in `stop_tags`. Card records are filled
+    for the whole page, since a card may reach outside the scope. A missing container that
+    is not required widens the scope to the whole page (known only once the walk is done).
+    """
+    probes = rule['probes']
+    container = rule['container']
+    card_up = rule['card_up']
+    scope_el = scope.el if isinstance(scope, LxmlNode) else scope
+    after_el = after.el if isinstance(after, LxmlNode) else after
+    # records[0] is the document, records[d] the open element at depth d
+    records = [{'node': soup}]
+    # (anchor, card record, card depth) waiting for their card to close
+    pending = deque()
+    # anchors of the whole page, kept in case an optional container is missing
+    page_anchors = [] if container is not None and not rule['container_required'] else None
+    collecting = scope is None and after is None and container is None
+    if scope is not None and _same_node(scope, soup):
+        collecting = True
+        scope_el = None
+    if after is not None and _same_node(after, soup):
+        collecting = True
+        after_el = None
+    status['found'] = found = collecting
+    scope_depth = None
+    scope_done = False
+    stopped = False
+    for event, el, name, attrs in _element_events(soup):
+        if event == 'end':
+            depth = len(records) - 1
+            if scope_depth == depth:
+                collecting = False
+                scope_depth = None
+                scope_done = True
+            records.pop()
+            while pending and pending[0][2] >= depth:
+                yield pending.popleft()[:2]
             continue
-        seen.add(h)
-        uniq.append(h)
-    return uniq[:limit]
+        tests = probes.get(name)
+        if tests:
+            for field, test in tests:
+                if test(attrs):
+                    for record in reversed(records):
+                        if field in record:
+                            break
+                        record[field] = el
+        records.append({'node': el})
+        depth = len(records) - 1
+        if collecting and after_el is None and after is not None and not stopped and name in stop_tags:
+            collecting = False
+            stopped = True
+        if name == 'a' and 'href' in attrs:
+            card_depth = max(depth - card_up, 0)
+            if collecting:
+                pending.append((el, records[card_depth], card_depth))
+            elif page_anchors is not None:
+                page_anchors.append((el, records[card_depth]))
+        if not scope_done and scope_depth is None:
+            if container is not None and scope is None and after is None:
+                classes = attrs.get('class') or ()
+                if container in (classes.split() if isinstance(classes, str) else classes):
+                    scope_depth = depth
+            elif scope_el is not None and el is scope_el:
+                scope_depth = depth
+            if scope_depth is not None:
+                collecting = found = status['found'] = True
+                page_anchors = None
+        if after_el is not None and el is after_el:
+            collecting = found = status['found'] = True
+            after_el = None
+    for anchor, card, _ in pending:
+        yield anchor, card
+    if page_anchors is not None and not found:
+        yield from page_anchors
 
 
-def parse_bwf_main_pages(page_url: str, limit: int = 40) -> list[dict]:
-    """Parse BWF main pages (bwfbadminton.com) that contain links to latest news from all tournaments."""
-    try:
-        html = fetch(page_url)
-    except Exception as e:
-        print(f"Failed to fetch {page_url}: {e}")
-        return []
-    
-    soup = BeautifulSoup(html, 'lxml')
+def extract_cards(soup, rule_name: str, base_url: str, limit: int = 40, scope=None, after=None,
+                  stop_tags=()) -> list[dict] | None:
+    """Listing items ({'title', 'href', 'img', 'preview', 'date'}) from `soup` per LISTING_RULES.
+
+    Returns None when the rule requires a container the page does not have.
+    """
+    rule = COMPILED_LISTING_RULES[rule_name]
+    status: dict = {}
+    anchors = _walk_cards(soup, rule, status, scope=scope, after=after, stop_tags=stop_tags)
     items: list[dict] = []
     seen = set()
-    
-    # Look for all news links on the page
-    for a in soup.select('a[href]'):
+    for a, card in anchors:
+        a = _as_node(a)
+        card = {field: _as_node(el) for field, el in card.items()}
         href = a.get('href') or ''
-        if not href or '/news' not in href:
+        if rule['href_contains'] not in href:
             continue
-            
-        # Convert to absolute URL
-        if href.startswith('http'):
+        if rule['keep_http_hrefs'] and href.startswith('http'):
             href_abs = href
         else:
-            href_abs = to_abs_url(page_url, href)
-            
+            href_abs = to_abs_url(base_url, href)
         try:
             u = urlparse(href_abs)
-            # Only accept links from the main site host
-            if not (u.scheme and is_main_host((u.hostname or '').lower())):
+            if not (u.scheme and rule['host_ok']((u.hostname or '').lower())):
+                continue
+            if rule['news_path'] and not _NEWS_PATH_RE.search(u.path):
                 continue
         except Exception:
             continue
-            
-        if href_abs in seen:
-            continue
-        seen.add(href_abs)
-        
-        # Get title from link text or title attribute
+        if rule['dedupe']:
+            if href_abs in seen:
+                continue
+            seen.add(href_abs)
         title = (a.get('title') or a.get_text(' ', strip=True) or '').strip()
-        if not title or len(title) < 10:
+        if rule['min_title'] and len(title) < rule['min_title']:
             continue
-            
-        # Look for image in the same container
-        card = a.parent if a.parent else a
+        if rule['clean_title']:
+            title = remove_date_from_title(title)
+        if rule['title_or_href']:
+            title = title or href_abs
         img = ''
-        img_el = card.select_one('img[src], img[data-src]') if hasattr(card, 'select_one') else None
-        if img_el:
-            img = img_el.get('src') or img_el.get('data-src') or ''
+        for source in rule['img']:
+            img = _card_image(source, card)
             if img:
-                img = to_abs_url(href_abs, img)
-        
-        # Look for preview text
-        preview = ''
-        p = card.select_one('p') if hasattr(card, 'select_one') else None
-        if p:
-            preview = p.get_text(' ', strip=True)
-            
-        # Try to extract date from URL or text
-        date_raw = ''
-        url_date_match = re.search(r'/(\d{4})/(\d{1,2})/(\d{1,2})/', href_abs)
-        if url_date_match:
-            year, month, day = url_date_match.groups()
-            date_raw = f"{year}-{month.zfill(2)}-{day.zfill(2)}T00:00:00+00:00"
-        
+                break
+        img = to_abs_url(href_abs, img) if img else ''
+        if img and rule['strip_size']:
+            img = _IMAGE_SIZE_SUFFIX_RE.sub(r'.\1', img)
+        if img and rule['drop_generic'] and any(k in img.lower() for k in rule['drop_generic']):
+            img = ''
+        p = card.get('p')
+        preview = p.get_text(' ', strip=True) if p else ''
+        date = ''
+        for source in rule['dates']:
+            date = _card_date(source, card, href_abs)
+            if date:
+                break
         items.append({
-            'title': remove_date_from_title(title),
+            'title': title,
             'href': href_abs,
             'img': img,
             'preview': (preview or '')[:220],
-            'date': normalize_date_iso(date_raw or ''),
+            'date': normalize_date_iso(date or '') if rule['normalize_date'] else date,
         })
-        
         if len(items) >= limit:
             break
-    
-    return items
+    if rule['container_required'] and not status['found']:
+        return None
+    return items
+
+
+def discover_from_official_lists(limit: int = 40) -> list[str]:
+    base = 'https://bwfbadminton.com'
+    links: list[str] = []
+    try:
+        html = fetch(f'{base}/news/')
+    except Exception:
+        return []
+    soup = parse_html(html)
+    for a in soup.select('a[href]'):
+        href = a.get('href') or ''
+        abs_url = to_abs_url(base, href)
+        try:
+            u = urlparse(abs_url)
+            # Strictly require the main site host and a news path
+            if is_main_host((u.hostname or '').lower()) and re.search(r'/news/[^/].+', u.path):
+                links.append(u.geturl())
+        except Exception:
+            continue
+        if len(links) >= limit:
+            break
+    # unique preserve order
+    seen = set()
+    uniq = []
+    for h in links:
+        if h in seen:
+            continue
+        seen.add(h)
+        uniq.append(h)
+    return uniq[:limit]
+
+
+def parse_bwf_main_pages(page_url: str, limit: int = 40) -> list[dict]:
+    """Parse BWF main pages (bwfbadminton.com) that contain links to latest news from all tournaments."""
+    try:
+        html = fetch(page_url)
+    except Exception as e:
+        print(f"Failed to fetch {page_url}: {e}")
+        return []
+    return extract_cards(parse_html(html), 'bwf_main', page_url, limit)
 
 
-def discover_links_via_rss(limit: int = 20) -> list[dict]:
-    """Try to get BWF news from RSS feeds."""
+def discover_links_via_rss(limit: int = 20, until: float | None = None) -> list[dict]:
+    """Try to get BWF news from RSS feeds (those not fetched by `until` are skipped)."""
     items = []
     
     rss_urls = [
@@ -300,9 +2432,13 @@ def discover_links_via_rss(limit: int = 20) -> list[dict]:
     ]
     
     for rss_url in rss_urls:
+        print(f"Trying RSS feed: {rss_url}")
+    responses = fetch_all(rss_urls, use_cloud=False, until=until)
+
+    for rss_url, xml in zip(rss_urls, responses):
         try:
-            print(f"Trying RSS feed: {rss_url}")
-            xml = fetch(rss_url, use_cloud=False)
+            if isinstance(xml, Exception):
+                raise xml
             
             # Parse RSS XML
             import xml.etree.ElementTree as ET
@@ -344,8 +2480,8 @@ def discover_links_via_rss(limit: int = 20) -> list[dict]:
     return items
 
 
-def discover_links_via_google(limit: int = 30) -> list[str]:
-    """Discover BWF news links via Google News RSS."""
+def discover_links_via_google(limit: int = 30, until: float | None = None) -> list[str]:
+    """Discover BWF news links via Google News RSS (feeds not fetched by `until` are skipped)."""
     links: list[str] = []
     
     # Try multiple Google News search queries
@@ -355,18 +2491,22 @@ def discover_links_via_google(limit: int = 30) -> list[str]:
         'site:bwfworldtour.bwfbadminton.com when:30d'
     ]
     
+    urls = []
     for query in queries:
+        params = {
+            'q': query,
+            'hl': 'en-US',
+            'gl': 'US',
+            'ceid': 'US:en',
+        }
+        urls.append(f'https://news.google.com/rss/search?{urlencode(params)}')
+        print(f"Trying Google News query: {query}")
+    responses = fetch_all(urls, use_cloud=False, until=until)
+
+    for query, xml in zip(queries, responses):
         try:
-            params = {
-                'q': query,
-                'hl': 'en-US',
-                'gl': 'US',
-                'ceid': 'US:en',
-            }
-            url = f'https://news.google.com/rss/search?{urlencode(params)}'
-            print(f"Trying Google News query: {query}")
-            
-            xml = fetch(url, use_cloud=False)
+            if isinstance(xml, Exception):
+                raise xml
             
             for m in re.finditer(r'<item>([\s\S]*?)</item>', xml, re.I):
                 item = m.group(1)
@@ -384,12 +2524,15 @@ def discover_links_via_google(limit: int = 30) -> list[str]:
                     if m2:
                         link = unquote(m2.group(1))
                 
-                # Validate and add link
+                # Validate and add link; pubDate is a date hint for fetching newest first
                 try:
                     u = urlparse(link)
                     if u.scheme and is_official_host((u.hostname or '').lower()):
                         links.append(link)
                         print(f"Found BWF link: {link}")
+                        pub_m = re.search(r'<pubDate>([\s\S]*?)</pubDate>', item, re.I)
+                        if pub_m and _frontier is not None:
+                            _frontier.note_date(link, pub_m.group(1).strip())
                 except Exception:
                     pass
                 
@@ -400,10 +2543,11 @@ def discover_links_via_google(limit: int = 30) -> list[str]:
             print(f"Google News query failed for '{query}': {e}")
             continue
     
-    # Deduplicate while preserving order
+    # Deduplicate (by canonical URL) while preserving order
     seen = set()
     uniq = []
     for h in links:
+        h = canonical_url(h)
         if h in seen:
             continue
         seen.add(h)
@@ -416,7 +2560,7 @@ def discover_links_via_google(limit: int = 30) -> list[str]:
 def resolve_google(link: str) -> str:
     # Follow redirect to publisher URL
     try:
-        r = requests.get(link, headers=HEADERS, allow_redirects=True, timeout=40)
+        r = throttled_get(get_session(), link, headers=HEADERS, allow_redirects=True, timeout=40)
         final_url = r.url
         return final_url
     except Exception:
@@ -424,72 +2568,223 @@ def resolve_google(link: str) -> str:
         return link
 
 
+# --- WordPress REST API ---
+# _links/_embedded must be listed for _embed to survive _fields
+WP_POST_FIELDS = 'link,title,excerpt,date_gmt,_links,_embedded'
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def wp_posts_url(host: str, limit: int) -> str:
+    params = {'per_page': min(limit, 100), '_fields': WP_POST_FIELDS, '_embed': 'wp:featuredmedia'}
+    return f'https://{host}/wp-json/wp/v2/posts?{urlencode(params)}'
+
+
+def _rendered_text(field) -> str:
+    """Plain text of a REST API {'rendered': '<p>html</p>'} field."""
+    rendered = field.get('rendered') if isinstance(field, dict) else ''
+    return ' '.join(html_unescape(_TAG_RE.sub(' ', rendered or '')).split())
+
+
+def _featured_image(post: dict) -> str:
+    for media in (post.get('_embedded') or {}).get('wp:featuredmedia') or ():
+        if isinstance(media, dict) and media.get('source_url'):
+            return media['source_url']
+    return ''
+
+
+def discover_via_wp_api(host: str, limit: int = 20) -> list[dict] | None:
+    """The latest posts of a BWF host as items (title, date, excerpt and featured image) from
+    its WordPress REST API. None when the endpoint is blocked, disabled or returns no posts,
+    so the caller scrapes the HTML pages instead."""
+    if not BWF_WP_API:
+        return None
+    # outcomes are kept with the fetch stats as the host's 'wp_api' entry
+    if recently_failed(host, 'wp_api', WP_API_RETRY_HOURS):
+        print(f"WordPress REST API failed on {host} recently; scraping its HTML pages")
+        return None
+    started = time.monotonic()
+    try:
+        posts = json.loads(fetch(wp_posts_url(host, limit)))
+    except Exception as e:
+        print(f"WordPress REST API not usable on {host}: {e}")
+        posts = None
+    if posts is not None and not isinstance(posts, list):
+        print(f"WordPress REST API on {host} did not return a list of posts")
+        posts = None
+    if posts is None:
+        record_tier(host, 'wp_api', False, time.monotonic() - started)
+        return None
+    overrides = image_overrides()
+    items = []
+    for post in posts[:limit]:
+        if not isinstance(post, dict):
+            continue
+        href = canonical_url(post.get('link') or '')
+        title = remove_date_from_title(_rendered_text(post.get('title')))
+        if not href or not title:
+            continue
+        items.append({
+            'title': title,
+            'href': href,
+            'img': overrides.image_for(href, title) or _featured_image(post),
+            'preview': _rendered_text(post.get('excerpt'))[:220],
+            'date': normalize_date_iso(post.get('date_gmt') or post.get('date') or ''),
+        })
+    record_tier(host, 'wp_api', bool(items), time.monotonic() - started)
+    if not items:
+        print(f"WordPress REST API on {host} returned no usable posts")
+        return None
+    print(f"WordPress REST API: {len(items)} posts from {host}")
+    return items
+
+
+# --- Sitemaps ---
+SITEMAP_HOSTS = ('bwfbadminton.com', 'bwfworldtour.bwfbadminton.com', 'bwfworldchampionships.bwfbadminton.com')
+SITEMAP_PATHS = ('/news-sitemap.xml', '/wp-sitemap.xml')
+# post sitemaps in an index: WordPress core's wp-sitemap-posts-post-N.xml, Yoast's post-sitemapN.xml
+_POST_SITEMAP_RE = re.compile(r'posts-post-\d+\.xml|post-sitemap\d*\.xml', re.I)
+
+
+def _last_runs() -> dict:
+    global _last_run
+    with _last_run_lock:
+        if _last_run is None:
+            _last_run = {}
+            if not BWF_REPLAY:
+                try:
+                    with open(LAST_RUN_PATH, 'r', encoding='utf-8') as f:
+                        _last_run = dict(json.load(f).get('hosts') or {})
+                except Exception:
+                    pass
+        return _last_run
+
+
+def last_successful_run(host: str) -> datetime | None:
+    """Start of the last run that read `host`'s listing in full, from LAST_RUN_PATH (replays have none)."""
+    return utc_date(_last_runs().get(host) or '')
+
+
+def listing_read(host: str, items: list | None) -> list | None:
+    """Note that `host`'s listing was fetched and parsed in full: it gave items, and the
+    strategy was neither stopped nor out of run time, so no entry was left unfetched.
+    Returns `items` unchanged."""
+    if items and not stopped() and not RUN_DEADLINE.expired():
+        with _last_run_lock:
+            _listed_hosts.add(host)
+    return items
+
+
+def save_last_run(started: datetime) -> None:
+    """Record `started` for every host whose listing this run read in full."""
+    if BWF_REPLAY or not _listed_hosts:
+        return
+    runs = _last_runs()
+    with _last_run_lock:
+        runs.update((host, started.isoformat()) for host in _listed_hosts)
+        data = json.dumps({'hosts': runs}, indent=1)
+    try:
+        _write_atomic(LAST_RUN_PATH, data.encode('utf-8'))
+    except Exception as e:
+        print(f"Failed to save last run times: {e}")
+
+
+def iter_sitemap(xml: str):
+    """(loc, lastmod, is_index_entry) for every <url> or <sitemap> entry. The XML is stream-parsed
+    and each entry is freed once read, so a sitemap of thousands of URLs never becomes a tree."""
+    events = etree.iterparse(io.BytesIO(xml.encode('utf-8')), events=('end',), tag=('{*}url', '{*}sitemap'),
+                             no_network=True, resolve_entities=False, recover=True)
+    for _, el in events:
+        loc = (el.findtext('{*}loc') or '').strip()
+        # news sitemaps carry news:publication_date rather than lastmod
+        lastmod = (el.findtext('{*}lastmod') or el.findtext('.//{*}publication_date') or '').strip()
+        yield loc, lastmod, etree.QName(el).localname == 'sitemap'
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+
+
+def _sitemap_entries(host: str, url: str, since: datetime, follow: bool = True) -> list[tuple[str, str]]:
+    """(url, lastmod) entries of one sitemap modified after `since`. In an index only the post
+    sitemaps are followed: those modified after `since`, or the last SITEMAP_CHILDREN when the
+    index gives no lastmod (WordPress numbers them oldest first)."""
+    # fetched directly: sitemaps are rarely challenged and not worth proxy credits. They have
+    # their own breaker, so a host's failing sitemaps never trip its direct tier for pages
+    xml = guarded(f'sitemap@{host}', _fetch_sitemap, url)
+    changed, children = [], []
+    found = False
+    for loc, lastmod, is_index in iter_sitemap(xml):
+        found = True
+        modified = utc_date(lastmod)
+        if is_index:
+            if follow and _POST_SITEMAP_RE.search(loc) and (modified is None or modified > since):
+                children.append(loc)
+        elif loc and modified is not None and modified > since:
+            changed.append((canonical_url(loc), lastmod))
+    if not found:
+        raise ValueError('no sitemap entries')
+    for child in children[-SITEMAP_CHILDREN:]:
+        try:
+            changed += _sitemap_entries(host, child, since, follow=False)
+        except Exception as e:
+            print(f"Sitemap {child} failed: {e}")
+    return changed
+
+
+def _fetch_sitemap(url: str) -> str:
+    """_fetch_direct() without the short-page check: a small sitemap is a valid one."""
+    r = conditional_get(get_session(), url, timeout=60)
+    r.raise_for_status()
+    verdict = classify_page(r.content, consent=False)
+    if verdict in ('blocked', 'challenge'):
+        raise Exception(PAGE_ERRORS[verdict])
+    http_cache_store(url, r)
+    return r.text
+
+
+def _read_sitemaps(host: str, since: datetime) -> list[tuple[str, str]] | None:
+    started = time.monotonic()
+    for path in SITEMAP_PATHS:
+        try:
+            changes = _sitemap_entries(host, f'https://{host}{path}', since)
+        except Exception as e:
+            print(f"Sitemap {path} not usable on {host}: {e}")
+            continue
+        record_tier(host, 'sitemap', True, time.monotonic() - started)
+        print(f"Sitemaps of {host}: {len(changes)} entries changed since {since.isoformat()}")
+        return sorted(changes, key=lambda c: utc_date(c[1]) or DATE_MIN, reverse=True)
+    record_tier(host, 'sitemap', False, time.monotonic() - started)
+    return None
+
+
+def sitemap_changes(host: str) -> list[tuple[str, str]] | None:
+    """(url, lastmod) of the host's sitemap entries modified since its listing was last read in
+    full, newest first. None when it never was or no sitemap could be read (recently).
+    Read once per scrape() run, however many strategies ask."""
+    if not BWF_SITEMAPS:
+        return None
+    since = last_successful_run(host)
+    if since is None or recently_failed(host, 'sitemap', SITEMAP_RETRY_HOURS):
+        return None
+    return single_flight('sitemap', f'https://{host}/', lambda _: _read_sitemaps(host, since))
+
+
+def host_unchanged(host: str) -> bool:
+    """True when the host's sitemaps were read and list nothing changed since its listing was
+    last read in full (which then counts as read in full again)."""
+    if sitemap_changes(host) == []:
+        print(f"Sitemaps of {host} list no changes since its listing was last read; skipping its news pages")
+        with _last_run_lock:
+            _listed_hosts.add(host)
+        return True
+    return False
+
+
 def parse_listing(base: str, limit: int = 40) -> list[dict]:
     try:
         html = fetch(f'{base}/news/')
     except Exception:
         return []
-    soup = BeautifulSoup(html, 'lxml')
-    items: list[dict] = []
-    seen = set()
-    # Grab anchors first, then enrich from nearby context
-    for a in soup.select('a[href*="/news/"]'):
-        href = a.get('href') or ''
-        href_abs = to_abs_url(base, href)
-        try:
-            u = urlparse(href_abs)
-            if not (u.scheme and is_official_host((u.hostname or '').lower()) and re.search(r'/news/[^/].+', u.path)):
-                continue
-        except Exception:
-            continue
-        if href_abs in seen:
-            continue
-        seen.add(href_abs)
-        # determine a card context: up to two parent levels
-        # Restrict search to the anchor itself to avoid picking unrelated page assets
-        card = a
-        title = (a.get('title') or a.get_text(' ', strip=True) or '').strip()
-        img = None
-        img_el = None
-        # look for image nearby
-        img_el = card.select_one('img[src]') if hasattr(card, 'select_one') else None
-        if not img_el and hasattr(card, 'select_one'):
-            img_el = card.select_one('img[data-src]')
-        if img_el:
-            img = img_el.get('src') or img_el.get('data-src')
-        if not img:
-            meta = card.select_one('meta[property="og:image"][content]') if hasattr(card, 'select_one') else None
-            if meta:
-                img = meta.get('content')
-        img_abs = to_abs_url(href_abs, img or '') if img else ''
-        # preview and date heuristics
-        preview = ''
-        p = card.select_one('p') if hasattr(card, 'select_one') else None
-        if p:
-            preview = p.get_text(' ', strip=True)
-        date = ''
-        t = card.select_one('time[datetime]') if hasattr(card, 'select_one') else None
-        if t:
-            date = (t.get('datetime') or t.get_text(' ', strip=True) or '').strip()
-        if not date and hasattr(card, 'get_text'):
-            # try to find textual date like 'Friday, September 5, 2025'
-            txt = card.get_text(' ', strip=True)
-            mdate = re.search(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+[A-Za-z]+\s+\d{1,2},\s+\d{4}", txt)
-            if not mdate:
-                mdate = re.search(r"[A-Za-z]+\s+\d{1,2},\s+\d{4}", txt)
-            if mdate:
-                date = mdate.group(0)
-        if title:
-            items.append({
-                'title': title,
-                'href': href_abs,
-                'img': img_abs,
-                'preview': (preview or '')[:220],
-                'date': date,
-            })
-        if len(items) >= limit:
-            break
-    return items
+    return extract_cards(parse_html(html), 'bwf_news', base, limit)
 
 
 def parse_championships_list_only(page_url: str, limit: int = 40) -> list[dict]:
@@ -505,230 +2800,628 @@ def parse_championships_list_only(page_url: str, limit: int = 40) -> list[dict]:
         except Exception as e2:
             print(f"Failed to fetch (list_only) {page_url}: {e1} / {e2}")
             return []
-    soup = BeautifulSoup(html, 'lxml')
-    wrap = soup.select_one('.news-overview-wrap') or soup
-    items: list[dict] = []
-    seen = set()
-    overrides = load_image_overrides()
-    by_href = (overrides.get('by_href') or {}) if isinstance(overrides, dict) else {}
-    by_title_substr = (overrides.get('by_title_substr') or {}) if isinstance(overrides, dict) else {}
-    for a in wrap.select('a[href]'):
-        href = a.get('href') or ''
-        if '/news' not in href:
+    items = extract_cards(parse_html(html), 'tournament_list', page_url, limit)
+    overrides = image_overrides()
+    for item in items:
+        # apply overrides for this item
+        ov_img = overrides.image_for(item['href'], item['title'])
+        if ov_img:
+            item['img'] = ov_img
+    return items
+
+
+def parse_listing_latest(base: str, limit: int = 40) -> list[dict]:
+    """Parse only the 'LATEST NEWS' section on the BWF news page."""
+    try:
+        html = fetch(f'{base}/news/')
+    except Exception:
+        return []
+    soup = parse_html(html)
+
+    def is_latest_news_heading(text: str) -> bool:
+        t = (text or '').strip().lower()
+        return ('latest' in t) and ('news' in t)
+
+    heading = None
+    for tag in ['h1', 'h2', 'h3', 'h4', 'h5']:
+        for h in soup.select(tag):
+            if is_latest_news_heading(h.get_text(' ', strip=True)):
+                heading = h
+                break
+        if heading:
+            break
+
+    container = None
+    # Try by class/id heuristics first
+    candidates = soup.select('[id*="latest" i], [class*="latest" i]')
+    for c in candidates:
+        anchors = c.select('a[href]')
+        news_links = [a for a in anchors if '/news/' in (a.get('href') or '')]
+        if len(news_links) >= 6:
+            container = c
+            break
+
+    # If still not found, try ancestors around heading
+    if container is None and heading is not None:
+        node = heading
+        for _ in range(6):
+            parent = node.parent if node else None
+            if not parent:
+                break
+            anchors = parent.select('a[href]')
+            news_links = [a for a in anchors if '/news/' in (a.get('href') or '')]
+            if len(news_links) >= 6:
+                container = parent
+                break
+            node = parent
+
+    if container is not None:
+        items = extract_cards(soup, 'bwf_latest', base, limit, scope=container)
+    else:
+        # Traverse from heading forward and collect anchors until next heading or limit
+        start = heading if heading is not None else soup.select_one('body') or soup
+        items = extract_cards(soup, 'bwf_latest', base, limit, after=start, stop_tags=('h1', 'h2', 'h3', 'h4', 'h5'))
+
+    # Deduplicate and cap
+    uniq_items = []
+    seen_hrefs = set()
+    for it in items:
+        href = it.get('href')
+        if not href or href in seen_hrefs:
             continue
-        href_abs = to_abs_url(page_url, href)
-        try:
-            u = urlparse(href_abs)
-            if not (u.scheme and is_official_host((u.hostname or '').lower())):
+        seen_hrefs.add(href)
+        uniq_items.append(it)
+    return uniq_items[:limit]
+
+
+# Ancestor chains of the content-image selectors, in priority order. Each chain lists the
+# simple selectors that must appear, in order, among an img[src]'s ancestors:
+#   'article .wp-block-image img[src]', 'article figure img[src]', 'article .entry-content img[src]',
+#   '.news-single .entry-content img[src]', '.single-post__content img[src]', '.post-content img[src]',
+#   '.article-content img[src]', 'article img[src]', '.featured-image img[src]', '.post-thumbnail img[src]'
+ARTICLE_IMG_CHAINS = (
+    (('tag', 'article'), ('class', 'wp-block-image')),
+    (('tag', 'article'), ('tag', 'figure')),
+    (('tag', 'article'), ('class', 'entry-content')),
+    (('class', 'news-single'), ('class', 'entry-content')),
+    (('class', 'single-post__content'),),
+    (('class', 'post-content'),),
+    (('class', 'article-content'),),
+    (('tag', 'article'),),
+    (('class', 'featured-image'),),
+    (('class', 'post-thumbnail'),),
+)
+# Same for the preview paragraphs: 'article p', '.entry-content p', '.single-post__content p', 'p'
+ARTICLE_P_CHAINS = (
+    (('tag', 'article'),),
+    (('class', 'entry-content'),),
+    (('class', 'single-post__content'),),
+    (),
+)
+# meta[<attr>="<value>"][content] lookups used by parse_article
+ARTICLE_METAS = {
+    ('property', 'og:title'): 'og_title',
+    ('property', 'og:image'): 'og_image',
+    ('property', 'og:image:secure_url'): 'og_image_secure',
+    ('name', 'twitter:image'): 'twitter_image',
+    ('name', 'description'): 'description',
+    ('property', 'article:published_time'): 'published_time',
+}
+# plain str comes from the lxml backend, which leaves comments out of .contents
+_TEXT_TYPES = (str, NavigableString, CData)
+
+
+def _attr_equals(value, expected: str, ignore_case: bool = False) -> bool:
+    # mirrors soupsieve's [attr="value"] (a ^value$ regex, so one trailing newline still matches)
+    if value is None or isinstance(value, list):
+        return False
+    if ignore_case:
+        value, expected = value.lower(), expected.lower()
+    return value == expected or value == expected + '\n'
+
+
+class ArticleScan:
+    """Everything parse_article() reads from a page, collected in one pre-order walk.
+
+    Selector matches are kept in document order so the results are the same as the
+    soup.select()/select_one()/get_text() calls they replace.
+    """
+
+    def __init__(self, soup):
+        self.title_tag = None
+        self.h1 = None
+        self.time_tag = None
+        self.metas: dict = {}
+        self.images: list[list] = [[] for _ in ARTICLE_IMG_CHAINS]
+        self.paragraphs: list[list] = [[] for _ in ARTICLE_P_CHAINS]
+        self.json_ld: list = []
+        self.strings: list[str] = []
+        self.article_strings: list[str] | None = None
+        self.entry_strings: list[str] | None = None
+        self._page_text: str | None = None
+        self._walk(soup)
+
+    def _walk(self, soup) -> None:
+        chains = ARTICLE_IMG_CHAINS + ARTICLE_P_CHAINS
+        n_img = len(ARTICLE_IMG_CHAINS)
+        strings = self.strings
+        # state: (progress along each chain, inside first <article>, inside first .entry-content,
+        # inside a script/style/template/rt/rp whose strings get_text() leaves out)
+        stack = [(child, (0,) * len(chains), False, False, False) for child in reversed(soup.contents)]
+        while stack:
+            node, progress, in_article, in_entry, in_container = stack.pop()
+            if isinstance(node, str):
+                if not in_container and type(node) in _TEXT_TYPES:
+                    s = node.strip()
+                    if s:
+                        strings.append(s)
+                        if in_article:
+                            self.article_strings.append(s)
+                        if in_entry:
+                            self.entry_strings.append(s)
+                continue
+            name = node.name
+            attrs = node.attrs
+            classes = attrs.get('class') or ()
+            if isinstance(classes, str):
+                classes = classes.split()
+            # matches against this node use its ancestors' progress
+            if name == 'img' and 'src' in attrs:
+                for k in range(n_img):
+                    if progress[k] == len(chains[k]):
+                        self.images[k].append(node)
+            elif name == 'p':
+                for k in range(len(ARTICLE_P_CHAINS)):
+                    if progress[n_img + k] == len(chains[n_img + k]):
+                        self.paragraphs[k].append(node)
+            elif name == 'meta' and 'content' in attrs:
+                for (attr, value), field in ARTICLE_METAS.items():
+                    if field not in self.metas and _attr_equals(attrs.get(attr), value):
+                        self.metas[field] = node
+            elif name == 'script':
+                if _attr_equals(attrs.get('type'), 'application/ld+json', ignore_case=True):
+                    self.json_ld.append(node)
+            elif name == 'title' and self.title_tag is None:
+                self.title_tag = node
+            elif name == 'h1' and self.h1 is None:
+                self.h1 = node
+            elif name == 'time' and self.time_tag is None and 'datetime' in attrs:
+                self.time_tag = node
+            if name == 'article' and self.article_strings is None:
+                self.article_strings = []
+                in_article = True
+            if 'entry-content' in classes and self.entry_strings is None:
+                self.entry_strings = []
+                in_entry = True
+            new_progress = progress
+            for k, chain in enumerate(chains):
+                step = progress[k]
+                if step < len(chain):
+                    kind, value = chain[step]
+                    if (name == value) if kind == 'tag' else (value in classes):
+                        if new_progress is progress:
+                            new_progress = list(progress)
+                        new_progress[k] = step + 1
+            if new_progress is not progress:
+                new_progress = tuple(new_progress)
+            in_container = in_container or name in STRING_CONTAINERS
+            for child in reversed(node.contents):
+                stack.append((child, new_progress, in_article, in_entry, in_container))
+
+    def meta(self, field: str) -> str | None:
+        node = self.metas.get(field)
+        return node.get('content') if node is not None else None
+
+    @property
+    def page_text(self) -> str:
+        """Same as soup.get_text(' ', strip=True)."""
+        if self._page_text is None:
+            self._page_text = ' '.join(self.strings)
+        return self._page_text
+
+    def main_text(self) -> str:
+        """Text of the first <article>, else the first .entry-content, else the whole page."""
+        if self.article_strings is not None:
+            return ' '.join(self.article_strings)
+        if self.entry_strings is not None:
+            return ' '.join(self.entry_strings)
+        return self.page_text
+
+
+# Keywords that indicate generic/non-article images
+BAD_IMAGE_KEYWORDS = ('logo', 'favicon', 'default', 'placeholder', 'sprite', 'icon', 'avatar', 'thumbnail')
+GENERIC_IMAGE_TERMS = ('wc25', 'fi-', 'pablo-abian', 'momota', 'header', 'banner', 'featured')
+
+
+def normalize_article_img(page_url: str, u: str) -> str:
+    if not u:
+        return u
+    u = to_abs_url(page_url, u)
+    # Remove size parameters from URL but keep the file extension
+    u = re.sub(r'(-\d+x\d+)(\.(?:jpg|jpeg|png|webp))$', r'\2', u, flags=re.IGNORECASE)
+    # Remove any query parameters
+    return u.split('?')[0]
+
+
+def is_generic_image(low_src: str) -> bool:
+    return any(k in low_src for k in BAD_IMAGE_KEYWORDS) or any(term in low_src for term in GENERIC_IMAGE_TERMS)
+
+
+# --- Image candidates ---
+PHOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+ACTION_IMAGE_WORDS = ('action', 'match', 'court', 'celebration', 'win', 'champ')
+PORTRAIT_IMAGE_WORDS = ('headshot', 'profile', 'logo', 'banner', 'featured')
+_SIZE_IN_NAME_RE = re.compile(r'(\d{3,4})x(\d{3,4})')
+
+
+def _image_size(cand: dict) -> int:
+    # prefer larger images: real size when probed, else the filename suffix (e.g. '-2048x1365')
+    probe = cand.get('probe') or {}
+    if probe.get('width'):
+        w, h = probe['width'], probe['height']
+    else:
+        m = _SIZE_IN_NAME_RE.search(cand['url'])
+        if not m:
+            return 0
+        w, h = int(m.group(1)), int(m.group(2))
+    if w >= 1600 and h >= 900:
+        return 5
+    if w >= 1200 and h >= 800:
+        return 3
+    return -5
+
+
+# Scoring rules: candidate -> score change, or None to reject it. A candidate has 'raw' (the
+# src as found), 'url' (normalized), 'low' (url lowercased), 'source', 'index' (position
+# among the images its selector matched) and, once probed, 'probe' (see probe_image()).
+IMAGE_RULES = {
+    'not_vector': lambda c: None if c['raw'].lower().endswith(('.svg', '.gif')) else 0,
+    # only media from wp-content/uploads, to avoid unrelated assets
+    'uploads_only': lambda c: 0 if '/wp-content/uploads/' in c['low'] else None,
+    'photo_extension': lambda c: 0 if c['low'].endswith(PHOTO_EXTENSIONS) else None,
+    'not_generic': lambda c: None if is_generic_image(c['low']) else 0,
+    # generic images are kept, behind every other one
+    'generic_last': lambda c: -1 if is_generic_image(c['low']) else 0,
+    # earliest content images are the most representative
+    'position': lambda c: {1: -10, 2: -15}.get(c['index'], 0),
+    'action_words': lambda c: 5 if any(w in c['low'] for w in ACTION_IMAGE_WORDS) else 0,
+    'portrait_words': lambda c: -25 if any(w in c['low'] for w in PORTRAIT_IMAGE_WORDS) else 0,
+    'size': _image_size,
+    'alive': lambda c: None if (c.get('probe') or {}).get('ok') is False else 0,
+}
+
+# Where a candidate comes from: base score, whether its src still needs normalize_article_img(),
+# the rules applied in order (the first rejection stops the pipeline), whether it replaces
+# an already-found candidate for the same URL that scores lower ('better') or never ('keep'),
+# and whether it is worth probing
+IMAGE_SOURCES = {
+    # <img> inside the article body
+    'content': {'base': 100, 'normalize': True, 'duplicate': 'keep', 'probe': True,
+                'rules': ('not_vector', 'uploads_only', 'not_generic', 'alive', 'position', 'action_words',
+                          'portrait_words', 'size')},
+    'og': {'base': 80, 'normalize': True, 'duplicate': 'better', 'probe': True,
+           'rules': ('photo_extension', 'not_generic', 'alive', 'size')},
+    'twitter': {'base': 75, 'normalize': True, 'duplicate': 'keep', 'probe': True,
+                'rules': ('photo_extension', 'not_generic', 'alive', 'size')},
+    # enrichment of listing cards: the article's ranked images, then the card's own image
+    'article': {'base': 0, 'normalize': False, 'duplicate': 'keep', 'rules': ('generic_last',)},
+    'card': {'base': 0, 'normalize': False, 'duplicate': 'keep', 'rules': ('generic_last',)},
+}
+
+
+class ImageRanking:
+    """Image candidates of one page, deduplicated by normalized URL and scored per IMAGE_SOURCES.
+
+    ranked() sorts by score, then by order of discovery; every candidate carries the reasons
+    for its score in 'why'.
+    """
+
+    def __init__(self, page_url: str, sources: dict | None = None):
+        self.page_url = page_url
+        self.sources = sources or IMAGE_SOURCES
+        self.by_url: dict[str, dict] = {}
+        self.added = 0
+
+    def add(self, src: str, source: str, index: int = 0) -> dict | None:
+        raw = (src or '').strip()
+        if not raw:
+            return None
+        conf = self.sources[source]
+        url = normalize_article_img(self.page_url, raw) if conf['normalize'] else raw
+        if not url:
+            return None
+        known = self.by_url.get(url)
+        if known is not None and conf['duplicate'] == 'keep':
+            return known
+        cand = {'raw': raw, 'url': url, 'low': url.lower(), 'source': source, 'index': index}
+        if not self._score(cand):
+            return None
+        if known is not None and known['score'] >= cand['score']:
+            return known
+        cand['order'] = self.added
+        self.added += 1
+        self.by_url[url] = cand
+        return cand
+
+    def _score(self, cand: dict) -> bool:
+        """(Re)compute cand's score and 'why'; False when a rule rejects it."""
+        conf = self.sources[cand['source']]
+        cand['score'] = conf['base']
+        cand['why'] = [f'{cand["source"]} {conf["base"]:+d}']
+        for name in conf['rules']:
+            delta = IMAGE_RULES[name](cand)
+            if delta is None:
+                cand['why'].append(f'{name} rejected')
+                return False
+            if delta:
+                cand['score'] += delta
+                cand['why'].append(f'{name} {delta:+d}')
+        return True
+
+    def probe(self, top: int = IMAGE_PROBE_TOP) -> None:
+        """Probe the `top` best probe-worthy candidates and rescore them. Dead ones are dropped,
+        and the candidates moving up in their place are probed in turn."""
+        done = set()
+        while True:
+            cands = [c for c in self.ranked() if self.sources[c['source']].get('probe')][:top]
+            cands = [c for c in cands if c['url'] not in done]
+            if not cands:
+                return
+            done.update(c['url'] for c in cands)
+            for cand, result in zip(cands, probe_images([c['url'] for c in cands])):
+                if result is None:
+                    continue
+                cand['probe'] = result
+                if not self._score(cand):
+                    print(f"Dropping dead image {cand['url']}")
+                    del self.by_url[cand['url']]
+
+    def ranked(self) -> list[dict]:
+        return sorted(self.by_url.values(), key=lambda c: (-c['score'], c['order']))
+
+    def best(self) -> str | None:
+        ranked = self.ranked()
+        return ranked[0]['url'] if ranked else None
+
+    def urls(self) -> list[str]:
+        return [c['url'] for c in self.ranked()]
+
+
+# --- Image probing ---
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def image_info(data: bytes) -> tuple[str, int, int] | None:
+    """(format, width, height) read from the first bytes of a JPEG, PNG, GIF or WebP file."""
+    if data.startswith(b'\x89PNG\r\n\x1a\n') and len(data) >= 24:
+        w, h = struct.unpack('>II', data[16:24])
+        return 'png', w, h
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        w, h = struct.unpack('<HH', data[6:10])
+        return 'gif', w, h
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP' and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b'VP8 ':
+            # lossy: 3-byte frame tag and 3-byte start code, then 14-bit width and height
+            w, h = struct.unpack('<HH', data[26:30])
+            return 'webp', w & 0x3FFF, h & 0x3FFF
+        if chunk == b'VP8L':
+            # lossless: signature byte, then 14-bit width-1 and height-1
+            bits = int.from_bytes(data[21:25], 'little')
+            return 'webp', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X':
+            # extended: flags, then 24-bit canvas width-1 and height-1
+            return 'webp', int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+        return None
+    if data[:2] == b'\xff\xd8':
+        # walk the segments up to the first start-of-frame, which holds the size
+        i = 2
+        while i + 9 <= len(data):
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:
+                i += 1
                 continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                i += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                h, w = struct.unpack('>HH', data[i + 5:i + 9])
+                return 'jpeg', w, h
+            i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+    return None
+
+
+def _probe_cache() -> dict:
+    """URL -> probe result, loaded once from IMAGE_PROBES_PATH (replays start empty)."""
+    global _image_probes
+    with _probes_lock:
+        if _image_probes is None:
+            _image_probes = {}
+            if not BWF_REPLAY:
+                try:
+                    with open(IMAGE_PROBES_PATH, 'r', encoding='utf-8') as f:
+                        _image_probes = json.load(f) or {}
+                except Exception:
+                    pass
+        return _image_probes
+
+
+def save_image_probes() -> None:
+    if _image_probes is None or BWF_REPLAY:
+        return
+    cutoff = time.time() - IMAGE_PROBE_TTL_DAYS * 86400
+    try:
+        with _probes_lock:
+            fresh = {u: r for u, r in _image_probes.items() if r.get('checked', 0) >= cutoff}
+            data = json.dumps(fresh, indent=0, sort_keys=True).encode('utf-8')
+        _write_atomic(IMAGE_PROBES_PATH, data)
+    except Exception as e:
+        print(f"Failed to save image probes: {e}")
+
+
+def _probe_slot(host: str) -> threading.BoundedSemaphore:
+    with _probes_lock:
+        slot = _probe_slots.get(host)
+        if slot is None:
+            slot = _probe_slots[host] = threading.BoundedSemaphore(IMAGE_PROBE_PER_HOST)
+        return slot
+
+
+def probe_image(url: str) -> dict | None:
+    """{'ok', 'format', 'width', 'height', 'checked'} for an image URL, from its first
+    IMAGE_PROBE_BYTES only (Range request). 'ok' is False for a dead URL (404/410, or an HTML
+    page instead of an image). None when nothing was learned (network error, blocked, 5xx),
+    so the image is ranked as if unprobed."""
+    host = (urlparse(url).hostname or '').lower()
+    headers = dict(IMAGE_HEADERS, Range=f'bytes=0-{IMAGE_PROBE_BYTES - 1}')
+    with _probe_slot(host):
+        try:
+            r = throttled_get(get_session(), url, f'img:{host}', headers=headers, timeout=15, stream=True)
         except Exception:
-            continue
-        if href_abs in seen:
-            continue
-        seen.add(href_abs)
-        # Only search inside the anchor for image/title to avoid cross-pick
-        card = a
-        title = remove_date_from_title((a.get('title') or a.get_text(' ', strip=True) or '').strip())
-        # image candidates from the anchor
-        def pick_from_srcset(srcset: str) -> str:
-            parts = [p.strip() for p in (srcset or '').split(',') if p.strip()]
-            if parts:
-                return parts[0].split()[0]
-            return ''
-        img = ''
-        img_el = card.select_one('img[src], img[data-src], img[srcset], img[data-srcset]') if hasattr(card, 'select_one') else None
-        if img_el:
-            img = img_el.get('src') or img_el.get('data-src') or ''
-            if not img:
-                img = pick_from_srcset(img_el.get('srcset') or img_el.get('data-srcset') or '')
-        if not img and hasattr(card, 'select_one'):
-            src_el = card.select_one('picture source[srcset], source[srcset]')
-            if src_el and src_el.get('srcset'):
-                img = pick_from_srcset(src_el.get('srcset'))
-        if not img and hasattr(card, 'get'):
-            style_attr = card.get('style') or ''
-            m = re.search(r"background-image\s*:\s*url\((['\"]?)(.+?)\1\)", style_attr, re.I)
-            if m:
-                img = m.group(2)
-        img = to_abs_url(href_abs, img or '') if img else ''
-        if img:
-            img = re.sub(r'-\d+x\d+\.(jpg|jpeg|png|webp)$', r'.\1', img, flags=re.IGNORECASE)
-        # preview and date from card
-        preview = ''
-        p = card.select_one('p') if hasattr(card, 'select_one') else None
-        if p:
-            preview = p.get_text(' ', strip=True)
-        date_raw = ''
-        t = card.select_one('time[datetime]') if hasattr(card, 'select_one') else None
-        if t:
-            date_raw = (t.get('datetime') or t.get_text(' ', strip=True) or '').strip()
-        if not date_raw and hasattr(card, 'get_text'):
-            txt = card.get_text(' ', strip=True)
-            mdate = re.search(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+[A-Za-z]+\s+\d{1,2},\s+\d{4}", txt)
-            if not mdate:
-                mdate = re.search(r"[A-Za-z]+\s+\d{1,2},\s+\d{4}", txt)
-            if mdate:
-                date_raw = mdate.group(0)
-        # as last resort, date from URL
-        if not date_raw:
-            murl = re.search(r'/((\d{4})/(\d{1,2})/(\d{1,2}))/+', href_abs)
-            if murl:
-                y, mo, d = murl.group(2), murl.group(3), murl.group(4)
-                date_raw = f"{y}-{mo.zfill(2)}-{d.zfill(2)}T00:00:00+00:00"
-        # apply overrides for this item
-        ov_img = by_href.get(href_abs) or next((v for k, v in (by_title_substr.items()) if k and k.lower() in (title or '').lower()), None)
-        item = {
-            'title': title or href_abs,
-            'href': href_abs,
-            'img': ov_img or img,
-            'preview': (preview or '')[:220],
-            'date': normalize_date_iso(date_raw or ''),
-        }
-        items.append(item)
-        if len(items) >= limit:
-            break
-    return items
+            return None
+        data = b''
+        try:
+            if r.status_code in (404, 410):
+                return {'ok': False, 'status': r.status_code, 'checked': time.time()}
+            if r.status_code not in (200, 206):
+                return None
+            # a server ignoring Range sends the whole file; stop reading once the size is known
+            for chunk in r.iter_content(8192):
+                data += chunk
+                if len(data) >= IMAGE_PROBE_BYTES or image_info(data):
+                    break
+        except Exception:
+            return None
+        finally:
+            r.close()
+            record_streamed(url, r, data)
+    info = image_info(data)
+    if info:
+        fmt, width, height = info
+        return {'ok': True, 'format': fmt, 'width': width, 'height': height, 'checked': time.time()}
+    if 'html' in (r.headers.get('Content-Type') or '').lower():
+        return {'ok': False, 'status': r.status_code, 'checked': time.time()}
+    # alive, but a format (or a JPEG header) we cannot size from these bytes
+    return {'ok': True, 'checked': time.time()}
 
 
-def parse_listing_latest(base: str, limit: int = 40) -> list[dict]:
-    """Parse only the 'LATEST NEWS' section on the BWF news page."""
-    try:
-        html = fetch(f'{base}/news/')
-    except Exception:
-        return []
-    soup = BeautifulSoup(html, 'lxml')
+def _probe_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _probe_pool
+    with _client_lock:
+        if _probe_pool is None:
+            _probe_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4 * IMAGE_PROBE_PER_HOST,
+                                                                thread_name_prefix='probe')
+        return _probe_pool
 
-    def is_latest_news_heading(text: str) -> bool:
-        t = (text or '').strip().lower()
-        return ('latest' in t) and ('news' in t)
 
-    heading = None
-    for tag in ['h1', 'h2', 'h3', 'h4', 'h5']:
-        for h in soup.find_all(tag):
-            if is_latest_news_heading(h.get_text(' ', strip=True)):
-                heading = h
-                break
-        if heading:
-            break
+def _probe_and_store(url: str) -> dict | None:
+    try:
+        # queued by a strategy that has since been stopped: not worth a request any more
+        check_abandoned()
+        result = probe_image(url)
+        if result is not None:
+            cache = _probe_cache()
+            with _probes_lock:
+                cache[url] = result
+        return result
+    finally:
+        with _probes_lock:
+            _probe_inflight.pop(url, None)
 
-    container = None
-    # Try by class/id heuristics first
-    candidates = soup.select('[id*="latest" i], [class*="latest" i]')
-    for c in candidates:
-        anchors = c.find_all('a', href=True)
-        news_links = [a for a in anchors if '/news/' in (a.get('href') or '')]
-        if len(news_links) >= 6:
-            container = c
-            break
 
-    # If still not found, try ancestors around heading
-    if container is None and heading is not None:
-        node = heading
-        for _ in range(6):
-            parent = node.parent if node else None
-            if not parent:
-                break
-            anchors = parent.find_all('a', href=True)
-            news_links = [a for a in anchors if '/news/' in (a.get('href') or '')]
-            if len(news_links) >= 6:
-                container = parent
-                break
-            node = parent
+def probe_images(urls: list[str]) -> list[dict | None]:
+    """probe_image() for each URL, concurrently: cached results are reused, and a URL already
+    being probed for another article is waited for rather than requested twice."""
+    cache = _probe_cache()
+    cutoff = time.time() - IMAGE_PROBE_TTL_DAYS * 86400
+    pending = {}
+    with _probes_lock:
+        for url in urls:
+            hit = cache.get(url)
+            if (hit and hit.get('checked', 0) >= cutoff) or url in pending:
+                continue
+            future = _probe_inflight.get(url)
+            if future is None:
+                future = _probe_inflight[url] = _probe_executor().submit(carry_strategy(_probe_and_store), url)
+            pending[url] = future
+    results = []
+    for url in urls:
+        if url in pending:
+            try:
+                results.append(pending[url].result())
+            except Exception:
+                results.append(None)
+        else:
+            results.append(cache.get(url))
+    return results
 
-    items: list[dict] = []
-    seen = set()
 
-    def push_anchor(a):
-        nonlocal items
-        href = a.get('href') or ''
-        href_abs = to_abs_url(base, href)
-        try:
-            u = urlparse(href_abs)
-            if not (u.scheme and is_main_host((u.hostname or '').lower()) and re.search(r'/news/[^/].+', u.path)):
-                return
-        except Exception:
-            return
-        if href_abs in seen:
-            return
-        # Build card context
-        card = a
-        if card.parent:
-            card = card.parent
-        if card and card.parent:
-            card = card.parent
-        title = (a.get('title') or a.get_text(' ', strip=True) or '').strip()
-        img = None
-        img_el = card.select_one('img[src]') if hasattr(card, 'select_one') else None
-        if not img_el and hasattr(card, 'select_one'):
-            img_el = card.select_one('img[data-src]')
-        if img_el:
-            img = img_el.get('src') or img_el.get('data-src')
-        if not img and hasattr(card, 'select_one'):
-            meta = card.select_one('meta[property="og:image"][content]')
-            if meta:
-                img = meta.get('content')
-        img_abs = to_abs_url(href_abs, img or '') if img else ''
-        preview = ''
-        p = card.select_one('p') if hasattr(card, 'select_one') else None
-        if p:
-            preview = p.get_text(' ', strip=True)
-        date = ''
-        t = card.select_one('time[datetime]') if hasattr(card, 'select_one') else None
-        if t:
-            date = (t.get('datetime') or t.get_text(' ', strip=True) or '').strip()
-        if title:
-            items.append({
-                'title': title,
-                'href': href_abs,
-                'img': img_abs,
-                'preview': (preview or '')[:220],
-                'date': date,
-            })
+def is_bad_preview(t: str) -> bool:
+    """Empty, too short, or cookie/consent text."""
+    t_low = (t or '').strip().lower()
+    if not t_low:
+        return True
+    bad_words = ('cookie', 'privacy', 'consent', 'we do not use cookies')
+    return any(b in t_low for b in bad_words) or len(t_low) < 12
 
-    if container is not None:
-        for a in container.select('a[href*="/news/"]'):
-            push_anchor(a)
-            if len(items) >= limit:
-                break
-    else:
-        # Traverse from heading forward and collect anchors until next heading or limit
-        start = heading if heading is not None else soup.body or soup
-        count = 0
-        for el in start.next_elements:
-            if hasattr(el, 'name') and el.name in ('h1', 'h2', 'h3', 'h4', 'h5') and el is not start:
-                # stop at the next section heading
-                break
-            if getattr(el, 'name', '') == 'a' and el.has_attr('href') and '/news/' in (el.get('href') or ''):
-                push_anchor(el)
-                count += 1
-                if len(items) >= limit:
-                    break
 
-    # Deduplicate and cap
-    uniq_items = []
-    seen_hrefs = set()
-    for it in items:
-        href = it.get('href')
-        if not href or href in seen_hrefs:
-            continue
-        seen_hrefs.add(href)
-        uniq_items.append(it)
-    return uniq_items[:limit]
+def meta_image_candidates(page: ArticleScan, images: ImageRanking) -> None:
+    """Add the og:image and twitter:image fallbacks."""
+    images.add(page.meta('og_image') or page.meta('og_image_secure'), 'og')
+    images.add(page.meta('twitter_image'), 'twitter')
 
 
-def normalize_date_iso(s: str) -> str:
-    try:
-        dt = date_parser.parse(s)
-        return dt.replace(tzinfo=timezone.utc).isoformat()
-    except Exception:
-        return s.strip() if s else ''
+def parse_article_head(url: str) -> dict | None:
+    """parse_article() from the streamed <head> alone (og:title, og:image/twitter:image,
+    description, article:published_time). None when any of them is missing or fails the
+    quality checks, so the caller falls back to the full page."""
+    head = fetch_head(url)
+    # a <head> is legitimately short, so only a block/challenge verdict rejects it
+    if not head or classify_page(head.encode(), consent=False) in ('blocked', 'challenge'):
+        return None
+    page = ArticleScan(parse_html(head))
+    title = page.meta('og_title') or (page.title_tag.string if page.title_tag else '')
+    title = (title or '').strip()
+    desc = page.meta('description')
+    date_iso = normalize_date_iso(page.meta('published_time') or '')
+    if not title or is_bad_preview(desc or '') or not date_iso:
+        return None
+    images = ImageRanking(url)
+    meta_image_candidates(page, images)
+    if BWF_IMAGE_PROBE:
+        images.probe()
+    if not images.by_url:
+        return None
+    return {
+        'title': remove_date_from_title(title),
+        'href': url,
+        'img': images.best(),
+        'img_candidates': images.urls(),
+        'preview': desc[:220],
+        'date': date_iso,
+    }
 
 
 def parse_article(url: str) -> dict | None:
+    """Article record (title, href, img, img_candidates, preview, date) or None; parsed once
+    per canonical URL within a scrape() run, each caller getting its own copy."""
+    art = single_flight('article', url, _parse_article)
+    return dict(art) if art else art
+
+
+def _parse_article(url: str) -> dict | None:
+    # a page already in the HTTP cache revalidates with an empty 304, cheaper than its head
+    if BWF_HEAD_FIRST and is_official_host((urlparse(url).hostname or '').lower()) and not http_cache_load(url):
+        item = parse_article_head(url)
+        if item:
+            return item
+
     def load_html(use_proxy_first: bool = False) -> str | None:
         if use_proxy_first:
             try:
-                return fetch_via_proxy(url)
+                return fetch_via_proxy(url, render=True)
             except Exception:
                 pass
         try:
@@ -742,155 +3435,46 @@ def parse_article(url: str) -> dict | None:
     html = load_html(False)
     if html is None:
         return None
-    soup = BeautifulSoup(html, 'lxml')
-    # Detect consent/cookie pages; if detected, retry via proxy explicitly once
-    page_text = soup.get_text(" ", strip=True).lower()
-    consent_bad_signals = (
-        'we do not use cookies of this type',
-        'cookie',
-        'consent',
-        'privacy',
-        'gdpr'
-    )
-    if sum(1 for s in consent_bad_signals if s in page_text) >= 2:
-        html2 = load_html(True)
-        if not html2:
+    # Consent/cookie pages are retried via proxy explicitly once, before anything is parsed
+    if classify_page(html) == 'consent':
+        html = load_html(True)
+        if not html:
             return None
-        soup = BeautifulSoup(html2, 'lxml')
+    page = ArticleScan(parse_html(html))
     # Title
-    title = (soup.select_one('meta[property="og:title"][content]') or {}).get('content') or (soup.title.string if soup.title else '')
+    title = page.meta('og_title') or (page.title_tag.string if page.title_tag else '')
     title = (title or '').strip()
     if not title:
         # try h1 fallback
-        h1 = soup.select_one('h1')
-        if h1:
-            title = h1.get_text(' ', strip=True)
+        if page.h1:
+            title = page.h1.get_text(' ', strip=True)
     if not title:
         return None
-    # Image: prefer content images inside article (to avoid generic header), then fallback to og:image
-    def normalize_img(u: str) -> str:
-        if not u:
-            return u
-        u = to_abs_url(url, u)
-        # Remove size parameters from URL but keep the file extension
-        u = re.sub(r'(-\d+x\d+)(\.(?:jpg|jpeg|png|webp))$', r'\2', u, flags=re.IGNORECASE)
-        # Remove any query parameters
-        return u.split('?')[0]
-
-    # Keywords that indicate generic/non-article images
-    bad_keywords = ('logo', 'favicon', 'default', 'placeholder', 'sprite', 'icon', 'avatar', 'thumbnail')
-    generic_image_terms = ('wc25', 'fi-', 'pablo-abian', 'momota', 'header', 'banner', 'featured')
-    
-    # Ordered list of selectors to try for finding article images
-    content_selectors = [
-        'article .wp-block-image img[src]',
-        'article figure img[src]',
-        'article .entry-content img[src]',
-        '.news-single .entry-content img[src]',
-        '.single-post__content img[src]',
-        '.post-content img[src]',
-        '.article-content img[src]',
-        'article img[src]',
-        '.featured-image img[src]',
-        '.post-thumbnail img[src]'
-    ]
-    
-    # Collect all candidate images with their priority
-    candidates = []
-    
-    # We prefer in-article content images FIRST; OG/Twitter later as fallback
-    
-    # Scan the article for images
-    for sel in content_selectors:
-        for i, node in enumerate(soup.select(sel)):
-            src = (node.get('src') or '').strip()
-            if not src or src.lower().endswith(('.svg', '.gif')):
-                continue
-                
-            abs_src = normalize_img(src)
-            if not abs_src or abs_src in [c[0] for c in candidates]:
-                continue
-            low_src = abs_src.lower()
-            # Accept only media from wp-content/uploads to avoid unrelated assets
-            if '/wp-content/uploads/' not in low_src:
-                continue
-            if any(k in low_src for k in bad_keywords) or any(term in low_src for term in generic_image_terms):
-                continue
-            # Priority: earliest content images are highest
-            priority = 100
-            if i == 0:
-                priority += 0
-            elif i == 1:
-                priority -= 10
-            elif i == 2:
-                priority -= 15
-            
-            # Some heuristic boosts
-            if any(word in low_src for word in ['action', 'match', 'court', 'celebration', 'win', 'champ']):
-                priority += 5
-            if any(word in low_src for word in ['headshot', 'profile', 'logo', 'banner', 'featured']):
-                priority -= 25
-            # Prefer larger images by filename suffix (e.g., '-2048x1365')
-            m = re.search(r'(\d{3,4})x(\d{3,4})', abs_src)
-            if m:
-                w, h = int(m.group(1)), int(m.group(2))
-                if w >= 1600 and h >= 900:
-                    priority += 5
-                elif w >= 1200 and h >= 800:
-                    priority += 3
-                else:
-                    priority -= 5
-            # Earlier images inside article tend to be more representative
-            if i < 5:
-                priority += 0
-                
-            candidates.append((abs_src, priority))
-
-    # Fallback OG/Twitter after content images
-    og_img = (soup.select_one('meta[property="og:image"][content]') or {}).get('content') or \
-             (soup.select_one('meta[property="og:image:secure_url"][content]') or {}).get('content')
-    if og_img:
-        og_img = normalize_img(og_img)
-        low_og = (og_img or '').lower()
-        if low_og.endswith(('.jpg', '.jpeg', '.png', '.webp')) and not (any(k in low_og for k in bad_keywords) or any(term in low_og for term in generic_image_terms)):
-            candidates.append((og_img, 80))
-
-    twitter_img = (soup.select_one('meta[name="twitter:image"][content]') or {}).get('content')
-    if twitter_img:
-        twitter_img = normalize_img(twitter_img)
-        low_tw = (twitter_img or '').lower()
-        if low_tw.endswith(('.jpg', '.jpeg', '.png', '.webp')) and twitter_img not in [c[0] for c in candidates]:
-            if not (any(k in low_tw for k in bad_keywords) or any(term in low_tw for term in generic_image_terms)):
-                candidates.append((twitter_img, 75))
-    
-    # Sort candidates by priority (highest first)
-    candidates.sort(key=lambda x: -x[1])
-    
-    # Return the best candidate, or None if no good candidates found
-    img = candidates[0][0] if candidates else None
-    img_candidates = [u for (u, _) in candidates]
+    # Image: in-article content images first (to avoid generic headers), then og/twitter:image
+    images = ImageRanking(url)
+    # Scan the article for images, selector by selector (see ARTICLE_IMG_CHAINS)
+    for matches in page.images:
+        for i, node in enumerate(matches):
+            images.add(node.get('src'), 'content', i)
+    meta_image_candidates(page, images)
+    if BWF_IMAGE_PROBE:
+        images.probe()
+    img = images.best()
+    img_candidates = images.urls()
     # Description/Preview (avoid cookie/consent text)
-    def is_bad_preview(t: str) -> bool:
-        t_low = (t or '').strip().lower()
-        if not t_low:
-            return True
-        bad_words = ('cookie', 'privacy', 'consent', 'we do not use cookies')
-        return any(b in t_low for b in bad_words) or len(t_low) < 12
-
-    desc = (soup.select_one('meta[name="description"][content]') or {}).get('content')
+    desc = page.meta('description')
     if is_bad_preview(desc or ''):
         # Prefer lines that look like BWF byline/date
         paras = []
-        for sel in ['article p', '.entry-content p', '.single-post__content p', 'p']:
-            for node in soup.select(sel):
+        for matches in page.paragraphs:
+            for node in matches:
                 txt = node.get_text(' ', strip=True)
                 if txt:
                     paras.append(txt)
             if paras:
                 break
         # Heuristics: pick first that contains 'TEXT BY' or a month name
-        month_re = re.compile(r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\b", re.I)
-        candidates = [t for t in paras if 'text by' in t.lower() or month_re.search(t)] or paras
+        candidates = [t for t in paras if 'text by' in t.lower() or MONTH_NAME_RE.search(t)] or paras
         for t in candidates:
             if not is_bad_preview(t):
                 desc = t
@@ -899,24 +3483,23 @@ def parse_article(url: str) -> dict | None:
             desc = ''
     # Date
     date_raw = ''
-    m = soup.select_one('meta[property="article:published_time"][content]')
-    if m:
-        date_raw = m.get('content') or ''
+    if 'published_time' in page.metas:
+        date_raw = page.meta('published_time') or ''
     if not date_raw:
         # Try time tag or date text in article header/meta
-        t = soup.select_one('time[datetime]')
+        t = page.time_tag
         if t and t.get('datetime'):
             date_raw = t.get('datetime')
     if not date_raw:
         # Try to extract date-like string from typical byline text
-        body_txt = soup.get_text(' ', strip=True)
-        m2 = re.search(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+([A-Za-z]+)\s+\d{1,2},\s+\d{4}", body_txt)
+        body_txt = page.page_text
+        m2 = DOW_DATE_RE.search(body_txt)
         if not m2:
-            m2 = re.search(r"([A-Za-z]+)\s+\d{1,2},\s+\d{4}", body_txt)
+            m2 = MONTH_DAY_YEAR_RE.search(body_txt)
         if m2:
             date_raw = m2.group(0)
         # JSON-LD
-        for s in soup.select('script[type="application/ld+json"]'):
+        for s in page.json_ld:
             try:
                 data = json.loads(s.get_text("\n", strip=True))
             except Exception:
@@ -942,20 +3525,18 @@ def parse_article(url: str) -> dict | None:
                 break
     if not date_raw:
         # Try to extract date from URL path like /2025/09/07/
-        url_date_match = re.search(r'/(\d{4})/(\d{1,2})/(\d{1,2})/', url)
+        url_date_match = URL_DATE_RE.search(url)
         if url_date_match:
             year, month, day = url_date_match.groups()
             date_raw = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
     if not date_raw:
         # Fallback: parse from visible text like 'Friday, September 5, 2025'
         text_blocks = [
-            (soup.select_one('article') or soup.select_one('.entry-content') or soup).get_text(' ', strip=True),
+            page.main_text(),
             desc or ''
         ]
-        dow = '(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)'
-        pattern = re.compile(rf'{dow},?\s+[A-Za-z]+\s+\d{{1,2}},\s+\d{{4}}')
         for txt in text_blocks:
-            m = pattern.search(txt)
+            m = DOW_DATE_RE.search(txt)
             if m:
                 date_raw = m.group(0)
                 break
@@ -970,6 +3551,105 @@ def parse_article(url: str) -> dict | None:
     }
 
 
+# --- Article index ---
+
+def article_index() -> dict:
+    """Canonical href -> {'record', 'fingerprint', 'checked', 'seen', 'changed'}, loaded once
+    from ARTICLE_INDEX_PATH (replays start empty)."""
+    global _article_index
+    with _index_lock:
+        if _article_index is None:
+            _article_index = {}
+            if not BWF_REPLAY:
+                try:
+                    with open(ARTICLE_INDEX_PATH, 'r', encoding='utf-8') as f:
+                        _article_index = json.load(f) or {}
+                except Exception:
+                    pass
+        return _article_index
+
+
+def article_fingerprint(record: dict) -> str:
+    return hashlib.sha1(json.dumps(record, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _recheck_after(entry: dict) -> float:
+    """Seconds after its last check before an indexed article is parsed again."""
+    published = date_sort_key(normalize_date_iso(entry['record'].get('date') or ''))
+    if datetime.now(timezone.utc) - published < timedelta(days=ARTICLE_FRESH_DAYS):
+        return ARTICLE_FRESH_RECHECK_HOURS * 3600
+    if time.time() - entry.get('changed', 0) < ARTICLE_FRESH_DAYS * 86400:
+        return ARTICLE_FRESH_RECHECK_HOURS * 3600
+    return ARTICLE_RECHECK_DAYS * 86400
+
+
+def parse_article_indexed(url: str, modified: str = '') -> dict | None:
+    """parse_article(), skipped for an article the index holds and has checked recently (and,
+    given its sitemap lastmod as `modified`, not since it changed). A re-check whose
+    fingerprint matches keeps the stored record and only renews its check time; one that
+    differs replaces it and is marked changed, which puts it on the fresh re-check window.
+    The record's date is confirmed with the run's frontier either way."""
+    art = _parse_article_indexed(url, modified)
+    if art and _frontier is not None:
+        _frontier.confirm(art.get('href') or url, art.get('date') or '')
+    return art
+
+
+def _parse_article_indexed(url: str, modified: str) -> dict | None:
+    if not BWF_ARTICLE_INDEX:
+        return parse_article(url)
+    index = article_index()
+    key = canonical_url(url)
+    now = time.time()
+    changed = utc_date(modified) if modified else None
+    with _index_lock:
+        entry = index.get(key)
+        if (entry and now - entry.get('checked', 0) < _recheck_after(entry)
+                and (changed is None or changed.timestamp() <= entry.get('checked', 0))):
+            entry['seen'] = now
+            _index_counts['reused'] += 1
+            return dict(entry['record'])
+    art = parse_article(url)
+    if not art:
+        return art
+    fingerprint = article_fingerprint(art)
+    with _index_lock:
+        old = index.get(key)
+        if old is not None and old.get('fingerprint') == fingerprint:
+            old['checked'] = old['seen'] = now
+            _index_counts['unchanged'] += 1
+            return art
+        entry = {'record': dict(art), 'fingerprint': fingerprint, 'checked': now, 'seen': now}
+        if old is None:
+            _index_counts['new'] += 1
+        else:
+            entry['changed'] = now
+            _index_counts['changed'] += 1
+        index[key] = entry
+    return art
+
+
+def log_article_index() -> None:
+    with _index_lock:
+        counts = dict(_index_counts)
+    if any(counts.values()):
+        print(f"Article index: {counts['reused']} reused without fetching, {counts['new']} new, "
+              f"{counts['unchanged']} re-checked unchanged, {counts['changed']} changed")
+
+
+def save_article_index() -> None:
+    if _article_index is None or BWF_REPLAY:
+        return
+    cutoff = time.time() - ARTICLE_INDEX_MAX_AGE_DAYS * 86400
+    try:
+        with _index_lock:
+            live = {h: e for h, e in _article_index.items() if e.get('seen', 0) >= cutoff}
+            data = json.dumps(live, indent=0, ensure_ascii=False).encode('utf-8')
+        _write_atomic(ARTICLE_INDEX_PATH, data)
+    except Exception as e:
+        print(f"Failed to save article index: {e}")
+
+
 def parse_championships_overview(page_url: str, limit: int = 40) -> list[dict]:
     """Parse items inside .news-overview-wrap on BWF World Championships site.
     Works on both the news overview page and a news-single page that contains the wrap.
@@ -985,101 +3665,21 @@ def parse_championships_overview(page_url: str, limit: int = 40) -> list[dict]:
         except Exception as e2:
             print(f"Failed to fetch {page_url}: {e1} / {e2}")
             return []
-    soup = BeautifulSoup(html, 'lxml')
-    wrap = soup.select_one('.news-overview-wrap')
-    if wrap is None:
+    cards = extract_cards(parse_html(html), 'tournament_overview', page_url, limit)
+    if cards is None:
         return []
-
-    # Collect targets (href, fallback title, fallback img, fallback preview, fallback date)
-    targets = []
-    seen = set()
-    for a in wrap.select('a[href]'):
-        href = a.get('href') or ''
-        if '/news' not in href:
-            continue
-        href_abs = to_abs_url(page_url, href)
-        try:
-            u = urlparse(href_abs)
-            if not (u.scheme and is_official_host((u.hostname or '').lower())):
-                continue
-        except Exception:
-            continue
-        if href_abs in seen:
-            continue
-        seen.add(href_abs)
-        card = a
-        if card.parent:
-            card = card.parent
-        if card and card.parent:
-            card = card.parent
-        title_fb = remove_date_from_title((a.get('title') or a.get_text(' ', strip=True) or '').strip())
-        def pick_from_srcset(srcset: str) -> str:
-            # take first url in srcset
-            parts = [p.strip() for p in (srcset or '').split(',') if p.strip()]
-            if parts:
-                first = parts[0].split()[0]
-                return first
-            return ''
-
-        img_fb = ''
-        img_el = card.select_one('img[src], img[data-src], img[srcset], img[data-srcset]') if hasattr(card, 'select_one') else None
-        if img_el:
-            img_fb = img_el.get('src') or img_el.get('data-src') or ''
-            if not img_fb:
-                img_fb = pick_from_srcset(img_el.get('srcset') or img_el.get('data-srcset') or '')
-        if not img_fb and hasattr(card, 'select_one'):
-            # picture > source srcset
-            src_el = card.select_one('picture source[srcset], source[srcset]')
-            if src_el and src_el.get('srcset'):
-                img_fb = pick_from_srcset(src_el.get('srcset'))
-        if not img_fb and hasattr(card, 'get'):
-            # background-image in style
-            style_attr = card.get('style') or ''
-            m = re.search(r"background-image\s*:\s*url\((['\"]?)(.+?)\1\)", style_attr, re.I)
-            if m:
-                img_fb = m.group(2)
-        if not img_fb and hasattr(card, 'select_one'):
-            meta = card.select_one('meta[property="og:image"][content]')
-            if meta:
-                img_fb = meta.get('content')
-        img_fb = to_abs_url(href_abs, img_fb or '') if img_fb else ''
-        if img_fb:
-            img_fb = re.sub(r'-\d+x\d+\.(jpg|jpeg|png|webp)$', r'.\1', img_fb, flags=re.IGNORECASE)
-            low_fb = img_fb.lower()
-            # Drop generic/featured images from card if we can find better from article later
-            if any(k in low_fb for k in ('logo','favicon','default','placeholder','sprite','icon','avatar','thumbnail')) or any(term in low_fb for term in ('fi-','header','banner','featured','momota')):
-                img_fb = ''
-        preview_fb = ''
-        p = card.select_one('p') if hasattr(card, 'select_one') else None
-        if p:
-            preview_fb = p.get_text(' ', strip=True)
-        # fallback date from card (date_fb)
-        date_fb = ''
-        t = card.select_one('time[datetime]') if hasattr(card, 'select_one') else None
-        if t:
-            date_fb = (t.get('datetime') or t.get_text(' ', strip=True) or '').strip()
-        if not date_fb and hasattr(card, 'get_text'):
-            txt = card.get_text(' ', strip=True)
-            mdate = re.search(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+[A-Za-z]+\s+\d{1,2},\s+\d{4}", txt)
-            if not mdate:
-                mdate = re.search(r"[A-Za-z]+\s+\d{1,2},\s+\d{4}", txt)
-            if mdate:
-                date_fb = mdate.group(0)
-        targets.append((href_abs, title_fb, img_fb, preview_fb, date_fb))
-        if len(targets) >= limit:
-            break
+    # Fallbacks from the card (href, title, img, preview, date) for when the article gives none
+    targets = [(c['href'], c['title'], c['img'], c['preview'], c['date']) for c in cards]
 
     # Enrich by fetching each article page
     items: list[dict] = []
-    overrides = load_image_overrides()
-    by_href = (overrides.get('by_href') or {}) if isinstance(overrides, dict) else {}
-    by_title_substr = (overrides.get('by_title_substr') or {}) if isinstance(overrides, dict) else {}
+    overrides = image_overrides()
     def enrich(entry):
         href_abs, title_fb, img_fb, preview_fb, date_fb = entry
-        art = parse_article(href_abs)
+        art = parse_article_indexed(href_abs)
         if art:
             # Apply overrides by href or title substring first
-            ov_img = by_href.get(href_abs) or next((v for k, v in (by_title_substr.items()) if k and k.lower() in (art.get('title') or '').lower()), None)
+            ov_img = overrides.image_for(href_abs, art.get('title') or '')
             if ov_img:
                 art['img'] = ov_img
             # choose best non-duplicate image among candidates
@@ -1096,37 +3696,25 @@ def parse_championships_overview(page_url: str, limit: int = 40) -> list[dict]:
                 if 'img_candidates' in art:
                     del art['img_candidates']
                 return art
-            # Choose best per-article image (no global de-dup to avoid mismatches)
-            candidates: list[str] = []
-            # article-reported best
-            if art.get('img'):
-                candidates.append(art['img'])
-            # article candidates list
-            if isinstance(art.get('img_candidates'), list):
-                candidates.extend([c for c in art['img_candidates'] if isinstance(c, str)])
-            # fallback from card
-            if img_fb:
-                candidates.append(img_fb)
-            def is_generic(u: str) -> bool:
-                lu = (u or '').lower()
-                return any(k in lu for k in ('logo','favicon','default','placeholder','sprite','icon','avatar','thumbnail')) or any(term in lu for term in ('header','banner','featured'))
-            # pick first non-generic, else first available
-            non_generic = [c for c in candidates if c and not is_generic(c)]
-            art['img'] = (non_generic[0] if non_generic else next((c for c in candidates if c), art.get('img') or img_fb))
+            # Choose best per-article image (no global de-dup to avoid mismatches):
+            # the article's best, its other candidates, then the card's; first non-generic wins
+            images = ImageRanking(href_abs)
+            images.add(art.get('img'), 'article')
+            for c in art.get('img_candidates') or ():
+                if isinstance(c, str):
+                    images.add(c, 'article')
+            images.add(img_fb, 'card')
+            art['img'] = images.best() or art.get('img') or img_fb
             # clean up helper key
             if 'img_candidates' in art:
                 del art['img_candidates']
             return art
         else:
             # Extract date from URL as fallback when parse_article fails
-            url_date = ''
-            url_date_match = re.search(r'/(\d{4})/(\d{1,2})/(\d{1,2})/', href_abs)
-            if url_date_match:
-                year, month, day = url_date_match.groups()
-                url_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}T00:00:00+00:00"
+            url_date = url_path_date(href_abs)
             
             # apply overrides even on fallback path
-            ov_img = by_href.get(href_abs) or next((v for k, v in (by_title_substr.items()) if k and k.lower() in (title_fb or '').lower()), None)
+            ov_img = overrides.image_for(href_abs, title_fb or '')
             return {
                 'title': title_fb or href_abs,
                 'href': href_abs,
@@ -1135,168 +3723,319 @@ def parse_championships_overview(page_url: str, limit: int = 40) -> list[dict]:
                 'date': url_date or normalize_date_iso(date_fb or ''),
             }
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-        for art in executor.map(enrich, targets[:limit]):
-            if art:
-                items.append(art)
-                if len(items) >= 20:
-                    break
-
+    if _frontier is not None:
+        for t in targets:
+            _frontier.note_date(t[0], t[4])
+    # newest first; once MAX_ITEMS items are confirmed newer than a card's date hint it is
+    # no longer fetched, and if already queued it is cancelled
+    skipped = unstarted = 0
+    enriched = run_all(lambda t: gathered(enrich(t)), targets[:limit], url_of=lambda t: t[0], newest_first=True)
+    for target, art in zip(targets, enriched):
+        if isinstance(art, Skipped):
+            skipped += 1
+            continue
+        # results come back in card order, so one that failed or never started before the
+        # deadline says nothing about the others: keep everything that did come back
+        if isinstance(art, DeadlineExceeded):
+            unstarted += 1
+            continue
+        if isinstance(art, Exception):
+            print(f"✗ Error enriching {target[0]}: {art}")
+            continue
+        if art:
+            items.append(art)
+            if len(items) >= MAX_ITEMS:
+                break
+    if skipped:
+        print(f"Skipped {skipped} articles from {page_url} older than the newest {MAX_ITEMS} found")
+    if unstarted:
+        print(f"Deadline reached before {unstarted} articles from {page_url} were fetched")
     return items
 
 
-def scrape() -> dict:
-    """Main scraping function with multiple fallback strategies."""
-    all_items = []
-    
-    # Strategy 0: RSS Feeds (most reliable, lightweight)
-    print("=== Strategy 0: RSS Feeds ===")
-    try:
-        rss_items = discover_links_via_rss(limit=30)
-        if rss_items:
-            print(f"RSS feeds yielded {len(rss_items)} items")
-            all_items.extend(rss_items)
-        else:
-            print("No items found via RSS feeds")
-    except Exception as e:
-        print(f"RSS strategy failed: {e}")
-    
-    # Strategy 1: Google News RSS (backup for RSS)
-    print("\n=== Strategy 1: Google News RSS ===")
-    try:
-        google_links = discover_links_via_google(limit=30)
-        if google_links:
-            print(f"Found {len(google_links)} links via Google News")
-            
-            # Parse articles from Google News links
-            for i, link in enumerate(google_links[:15]):  # Limit to avoid timeouts
-                try:
-                    print(f"Parsing article {i+1}/{min(15, len(google_links))}: {link}")
-                    art = parse_article(link)
-                    if art and art.get('title'):
-                        all_items.append(art)
-                        print(f"✓ Parsed: {art['title'][:60]}...")
-                    else:
-                        print(f"✗ Failed to parse article content")
-                except Exception as e:
-                    print(f"✗ Error parsing {link}: {e}")
-                    continue
-            
-            print(f"Google News strategy added {len([item for item in all_items if item.get('source') != 'rss'])} articles")
+def strategy_rss(until: float) -> list[dict]:
+    """Strategy 0: RSS feeds (most reliable, lightweight)."""
+    rss_items = gathered(discover_links_via_rss(limit=30, until=until))
+    if rss_items:
+        print(f"RSS feeds yielded {len(rss_items)} items")
+    else:
+        print("No items found via RSS feeds")
+    return rss_items
+
+
+def strategy_google(until: float) -> list[dict]:
+    """Strategy 1: Google News RSS (backup for RSS), each linked article parsed."""
+    if out_of_time('Google News', until):
+        raise DeadlineExceeded('run deadline reached')
+    google_links = discover_links_via_google(limit=30, until=until)
+    if not google_links:
+        print("No links found via Google News")
+        return []
+    print(f"Found {len(google_links)} links via Google News")
+
+    # Parse articles from Google News links
+    links = google_links[:15]  # Limit to avoid timeouts
+    items = []
+    skipped = unstarted = 0
+    parsed = run_all(lambda link: gathered(parse_article_indexed(link)), links, until=until, newest_first=True)
+    for i, (link, art) in enumerate(zip(links, parsed)):
+        if isinstance(art, Skipped):
+            skipped += 1
+            continue
+        if isinstance(art, DeadlineExceeded):
+            unstarted += 1
+            continue
+        print(f"Parsed article {i+1}/{len(links)}: {link}")
+        if isinstance(art, Exception):
+            print(f"✗ Error parsing {link}: {art}")
+        elif art and art.get('title'):
+            items.append(art)
+            print(f"✓ Parsed: {art['title'][:60]}...")
         else:
-            print("No links found via Google News")
-    except Exception as e:
-        print(f"Google News strategy failed: {e}")
-    
-    # Strategy 2: Alternative News Sources
-    print("\n=== Strategy 2: Alternative News Sources ===")
-    try:
-        # Try badminton news aggregators and sports sites
-        alt_sources = [
-            'https://www.badmintoncentral.com/forums/index.php?forums/bwf-international-badminton.25/rss',
-            'https://www.badmintonplanet.com/feed/',
-        ]
-        
-        for source_url in alt_sources:
-            try:
-                print(f"Trying alternative source: {source_url}")
-                # This would need custom parsing for each source
-                # For now, skip to avoid complexity
-                pass
-            except Exception as e:
-                print(f"Alternative source {source_url} failed: {e}")
-                
-    except Exception as e:
-        print(f"Alternative sources strategy failed: {e}")
-    
-    # Strategy 3: Direct BWF site scraping (if we have good proxy/cloudscraper)
-    print("\n=== Strategy 3: Direct BWF scraping ===")
-    try:
-        # Try official BWF Latest News first
-        print("Trying BWF Latest News section...")
-        official_items = parse_listing_latest('https://bwfbadminton.com', limit=20)
-        if official_items:
-            print(f"Found {len(official_items)} items from Latest News")
-            all_items.extend(official_items)
-        
-        # Try broader BWF main pages
-        print("Trying BWF main pages...")
-        for url in ['https://bwfbadminton.com/news/', 'https://bwfbadminton.com/']:
-            try:
-                part = parse_bwf_main_pages(url, limit=20)
-                if part:
-                    print(f"Found {len(part)} items from {url}")
-                    all_items.extend(part)
-            except Exception as e:
-                print(f"Failed to parse {url}: {e}")
-                
-    except Exception as e:
-        print(f"Direct BWF scraping failed: {e}")
-    
-    # Strategy 4: BWF World Tour and Championships sites
-    print("\n=== Strategy 4: BWF Tournament sites ===")
+            print(f"✗ Failed to parse article content")
+    if skipped:
+        print(f"Skipped {skipped} Google News articles older than the newest {MAX_ITEMS} found")
+    if unstarted:
+        print(f"Deadline reached before {unstarted} Google News articles were fetched")
+    print(f"Google News strategy added {len(items)} articles")
+    return items
+
+
+def strategy_alternative(until: float) -> list[dict]:
+    """Strategy 2: alternative news sources."""
+    # Try badminton news aggregators and sports sites
+    alt_sources = [
+        'https://www.badmintoncentral.com/forums/index.php?forums/bwf-international-badminton.25/rss',
+        'https://www.badmintonplanet.com/feed/',
+    ]
+    for source_url in alt_sources:
+        print(f"Trying alternative source: {source_url}")
+        # This would need custom parsing for each source
+        # For now, skip to avoid complexity
+    return []
+
+
+def strategy_direct(until: float) -> list[dict]:
+    """Strategy 3: direct BWF site scraping (if we have good proxy/cloudscraper): the
+    WordPress REST API, or when that is blocked the Latest News section first, then the
+    broader main pages."""
+    if out_of_time('direct BWF scraping', until):
+        raise DeadlineExceeded('run deadline reached')
+    if host_unchanged('bwfbadminton.com'):
+        return []
+    posts = gathered(discover_via_wp_api('bwfbadminton.com', limit=20))
+    if posts is not None:
+        return listing_read('bwfbadminton.com', posts)
+    # (label, page fetched, parser)
+    sources = [
+        ('Latest News', 'https://bwfbadminton.com/news/', lambda: parse_listing_latest('https://bwfbadminton.com', limit=20)),
+        ('https://bwfbadminton.com/news/', 'https://bwfbadminton.com/news/', lambda: parse_bwf_main_pages('https://bwfbadminton.com/news/', limit=20)),
+        ('https://bwfbadminton.com/', 'https://bwfbadminton.com/', lambda: parse_bwf_main_pages('https://bwfbadminton.com/', limit=20)),
+    ]
+    items = []
+    parts = run_all(lambda src: gathered(src[2]()), sources, url_of=lambda src: src[1], until=until)
+    for (label, _, _), part in zip(sources, parts):
+        if isinstance(part, Exception):
+            print(f"Failed to parse {label}: {part}")
+        elif part:
+            print(f"Found {len(part)} items from {label}")
+            items.extend(part)
+    if not any(isinstance(part, Exception) for part in parts):
+        listing_read('bwfbadminton.com', items)
+    return items
+
+
+def strategy_tournaments(until: float) -> list[dict]:
+    """Strategy 4: BWF World Tour and Championships sites."""
     tournament_urls = [
         'https://bwfworldtour.bwfbadminton.com/news/',
         'https://bwfworldchampionships.bwfbadminton.com/news/',
     ]
-    
-    for url in tournament_urls:
-        try:
-            print(f"Trying {url}...")
-            if BWF_MODE == 'list_only':
-                part = parse_championships_list_only(url, limit=15)
-            else:
-                part = parse_championships_overview(url, limit=15)
-            
-            if part:
-                print(f"Found {len(part)} items from {url}")
-                all_items.extend(part)
-            else:
-                print(f"No items found from {url}")
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
+
+    def parse_tournament(url: str) -> list[dict]:
+        if out_of_time(url, until):
+            return []
+        print(f"Trying {url}...")
+        host = urlparse(url).hostname
+        if host_unchanged(host):
+            return []
+        posts = gathered(discover_via_wp_api(host, limit=15))
+        if posts is not None:
+            return listing_read(host, posts)
+        if BWF_MODE == 'list_only':
+            return listing_read(host, gathered(parse_championships_list_only(url, limit=15)))
+        return listing_read(host, parse_championships_overview(url, limit=15))
+
+    items = []
+    for url, part in zip(tournament_urls, run_all(parse_tournament, tournament_urls, until=until)):
+        if isinstance(part, Exception):
+            print(f"Error scraping {url}: {part}")
+        elif part:
+            print(f"Found {len(part)} items from {url}")
+            items.extend(part)
+        else:
+            print(f"No items found from {url}")
+    return items
+
+
+def strategy_sitemaps(until: float) -> list[dict]:
+    """Strategy 5: articles the BWF sitemaps list as changed since each host's listing was last read."""
+    changes: dict[str, str] = {}
+    found = run_all(sitemap_changes, list(SITEMAP_HOSTS), url_of=lambda h: f'https://{h}/', until=until)
+    for host, part in zip(SITEMAP_HOSTS, found):
+        if isinstance(part, Exception):
+            print(f"Sitemaps of {host} failed: {part}")
             continue
-    
+        for url, lastmod in part or ():
+            changes.setdefault(url, lastmod)
+    if not changes:
+        print("No changed articles in the sitemaps")
+        return []
+    urls = sorted(changes, key=lambda u: utc_date(changes[u]) or DATE_MIN, reverse=True)[:SITEMAP_MAX_ARTICLES]
+    if _frontier is not None:
+        for url in urls:
+            # lastmod is never before publication, so it is a safe upper-bound hint
+            _frontier.note_date(url, changes[url])
+    items = []
+    unstarted = 0
+    parsed = run_all(lambda u: gathered(parse_article_indexed(u, modified=changes[u])), urls, until=until, newest_first=True)
+    for url, art in zip(urls, parsed):
+        if isinstance(art, Skipped):
+            continue
+        # not started in time, or the strategy was stopped (Abandoned): not a parse failure
+        if isinstance(art, DeadlineExceeded):
+            unstarted += 1
+            continue
+        if isinstance(art, Exception):
+            print(f"✗ Error parsing {url}: {art}")
+        elif art and art.get('title'):
+            items.append(art)
+    if unstarted:
+        print(f"Deadline reached before {unstarted} changed articles were fetched")
+    print(f"Sitemaps added {len(items)} changed articles")
+    return items
+
+
+# (key in STRATEGY_BUDGETS, title, function), in merge priority order
+STRATEGIES = [
+    ('rss', 'RSS Feeds', strategy_rss),
+    ('google', 'Google News RSS', strategy_google),
+    ('alternative', 'Alternative News Sources', strategy_alternative),
+    ('direct', 'Direct BWF scraping', strategy_direct),
+    ('tournaments', 'BWF Tournament sites', strategy_tournaments),
+    ('sitemaps', 'Sitemaps', strategy_sitemaps),
+]
+
+
+def run_strategies(strategies: list, collected: list) -> None:
+    """Run every strategy at once, each until its STRATEGY_BUDGETS entry runs out.
+
+    `collected` always holds the items of the strategies finished so far, in `strategies`
+    order whatever order they finish in, so partial and full runs merge deterministically.
+    A strategy still running past its budget (or the run deadline) is stopped: the items it
+    had already found (see gathered) are kept, and its remaining fetches fail with Abandoned
+    instead of holding the process open.
+    """
+    start = time.monotonic()
+    results: dict = {}
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix='strategy')
+    running = {}
+    for n, (key, title, fn) in enumerate(strategies):
+        print(f"=== Strategy {n}: {title} ===")
+        until = start + STRATEGY_BUDGETS.get(key, math.inf)
+        run = StrategyRun()
+        running[pool.submit(run.call, fn, until)] = (key, title, until, run)
+
+    def merge(key: str, items: list) -> None:
+        results[key] = items
+        if _frontier is not None:
+            for it in items:
+                _frontier.confirm(it.get('href') or '', it.get('date') or '')
+        collected[:] = [it for k, _, _ in strategies for it in results.get(k, ())]
+
+    try:
+        while running:
+            wait_for = min(min(until for _, _, until, _ in running.values()) - time.monotonic(), RUN_DEADLINE.budget())
+            done, _ = concurrent.futures.wait(
+                running, timeout=None if wait_for == math.inf else max(wait_for, 0),
+                return_when=concurrent.futures.FIRST_COMPLETED)
+            for f in done:
+                key, title, _, run = running.pop(f)
+                try:
+                    items = f.result() or []
+                except Exception as e:
+                    print(f"{title} strategy failed: {e}")
+                    items = run.found()
+                merge(key, items)
+            now = time.monotonic()
+            for f, (key, title, until, run) in list(running.items()):
+                if now >= until or RUN_DEADLINE.expired():
+                    run.cancel.set()
+                    items = run.found()
+                    print(f"{title} strategy is over its time budget; stopping it with {len(items)} items")
+                    del running[f]
+                    merge(key, items)
+    finally:
+        for _, _, _, run in running.values():
+            run.cancel.set()
+        pool.shutdown(wait=False)
+
+
+def scrape(collected: list | None = None) -> dict:
+    """Main scraping function with multiple fallback strategies, run concurrently (see run_strategies).
+
+    Items are added to `collected` as each strategy finishes, so a caller that runs out
+    of time can still build output from whatever has been gathered (see finalize_items).
+    """
+    global _frontier
+    RUN_DEADLINE.start(BWF_DEADLINE)
+    all_items = collected if collected is not None else []
+    _frontier = UrlFrontier()
+    run_strategies(STRATEGIES, all_items)
+
     print(f"\n=== Processing Results ===")
+    log_breakers()
+    log_proxy_usage()
+    _frontier.log()
+    log_article_index()
+    return {
+        'scraped_at': datetime.now(timezone.utc).isoformat(),
+        'items': finalize_items(all_items),
+    }
+
+
+def finalize_items(all_items: list[dict]) -> list[dict]:
+    """Deduplicate, normalize and keep the MAX_ITEMS newest of the collected items."""
     print(f"Total items collected: {len(all_items)}")
     
-    # Deduplicate by href while preserving order
+    # Deduplicate by canonical href while preserving order
     seen = set()
     unique_items = []
     for item in all_items:
-        href = item.get('href')
+        href = canonical_url(item.get('href') or '')
         if not href or href in seen:
             continue
         seen.add(href)
         
         # Normalize and enrich item
         item_copy = dict(item)
+        item_copy['href'] = href
         item_copy['title'] = remove_date_from_title(item.get('title') or '')
         
         # Ensure date is properly formatted
         date_raw = item.get('date') or ''
         if not date_raw and href:
             # Extract date from URL
-            m = re.search(r'/(\d{4})/(\d{1,2})/(\d{1,2})/', href)
-            if m:
-                y, mo, d = m.group(1), m.group(2), m.group(3)
-                date_raw = f"{y}-{mo.zfill(2)}-{d.zfill(2)}T00:00:00+00:00"
+            date_raw = url_path_date(href)
         
         item_copy['date'] = normalize_date_iso(date_raw or '')
         unique_items.append(item_copy)
     
     print(f"Unique items after deduplication: {len(unique_items)}")
     
-    # Sort by date (newest first)
-    def get_date_key(item):
-        date_str = item.get('date', '')
-        try:
-            return date_parser.parse(date_str) if date_str else datetime.min.replace(tzinfo=timezone.utc)
-        except:
-            return datetime.min.replace(tzinfo=timezone.utc)
-    
-    sorted_items = sorted(unique_items, key=get_date_key, reverse=True)
-    final_items = sorted_items[:20]  # Take top 20 most recent
+    # Sort by date (newest first); parse_date() is memoized, so each date string is parsed once
+    sorted_items = sorted(unique_items, key=lambda item: date_sort_key(item.get('date', '')), reverse=True)
+    final_items = sorted_items[:MAX_ITEMS]  # Take the most recent
     
     if final_items:
         newest_date = final_items[0].get('date', '')
@@ -1307,24 +4046,43 @@ def scrape() -> dict:
     else:
         print("No items found from any strategy!")
     
-    return {
-        'scraped_at': datetime.now(timezone.utc).isoformat(),
-        'items': final_items,
-    }
+    return final_items
 
 
 def main():
-    print(f"Starting BWF scraper at {datetime.now(timezone.utc).isoformat()}")
-    print(f"Environment: BWF_MODE={BWF_MODE}, BWF_FORCE_PROXY={BWF_FORCE_PROXY}")
+    run_started = datetime.now(timezone.utc)
+    print(f"Starting BWF scraper at {run_started.isoformat()}")
+    print(f"Environment: BWF_MODE={BWF_MODE}, BWF_FORCE_PROXY={BWF_FORCE_PROXY}, BWF_CONCURRENCY={BWF_CONCURRENCY}")
+    if BWF_ASYNC:
+        print(f"Async engine: BWF_MAX_INFLIGHT={BWF_MAX_INFLIGHT}, BWF_PER_HOST={BWF_PER_HOST}")
     print(f"API Keys available: SCRAPERAPI_KEY={'Yes' if SCRAPERAPI_KEY else 'No'}, SCRAPINGBEE_KEY={'Yes' if SCRAPINGBEE_KEY else 'No'}")
     
-    try:
-        new_data = scrape()
-        new_items = list(new_data.get('items', []))
+    RUN_DEADLINE.start(BWF_DEADLINE)
+    if BWF_DEADLINE > 0:
+        print(f"Run deadline: {BWF_DEADLINE:.0f}s")
+
+    # Scrape in a worker thread so that, when the deadline hits, we can still write the best
+    # result so far; late requests end on their own because their timeouts are capped too.
+    collected: list[dict] = []
+    result: dict = {}
+
+    def run_scrape():
+        try:
+            result.update(scrape(collected))
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+
+    worker = threading.Thread(target=run_scrape, daemon=True)
+    worker.start()
+    budget = RUN_DEADLINE.budget()
+    worker.join(None if budget == math.inf else max(budget, 0) + MIN_REQUEST_TIMEOUT)
+    if 'items' in result:
+        new_items = list(result['items'])
         print(f"Scraped {len(new_items)} new items")
-    except Exception as e:
-        print(f"Error during scraping: {e}")
-        new_items = []
+    else:
+        if worker.is_alive():
+            print("Run deadline reached before scraping finished; using partial results")
+        new_items = finalize_items(list(collected))
 
     # Load previous items if exist
     old_items = []
@@ -1359,24 +4117,22 @@ def main():
         push_list(old_items)
 
         # Sort by date desc when possible, else keep insertion order
-        def date_key(it: dict):
-            d = it.get('date') or ''
-            try:
-                dt = date_parser.parse(d)
-                return dt
-            except Exception:
-                return datetime.min.replace(tzinfo=timezone.utc)
-        merged_sorted = sorted(merged, key=date_key, reverse=True)
+        merged_sorted = sorted(merged, key=lambda it: date_sort_key(it.get('date')), reverse=True)
 
         data_out = {
             'scraped_at': datetime.now(timezone.utc).isoformat(),
-            'items': merged_sorted[:20],
+            'items': merged_sorted[:MAX_ITEMS],
         }
 
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
     with open(OUT_PATH, 'w', encoding='utf-8') as f:
         json.dump(data_out, f, ensure_ascii=False, indent=2)
     print(f'wrote {len(data_out.get("items", []))} items to {OUT_PATH}')
+    prune_http_cache()
+    save_fetch_stats()
+    save_image_probes()
+    save_article_index()
+    save_last_run(run_started)
 
 
 if __name__ == '__main__':
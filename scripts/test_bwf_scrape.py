@@ -0,0 +1,1438 @@
+#!/usr/bin/env python3
+"""
+Offline checks for the pure helpers of bwf_scrape.py (no network, no cache directory).
+
+Usage: python -m pytest scripts/test_bwf_scrape.py
+(test_bwf_access.py beside it is a live-network script, not a pytest module.)
+"""
+import json
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bwf_scrape as bwf  # noqa: E402
+
+# bs4's lxml tree builder passes an option lxml has deprecated
+pytestmark = pytest.mark.filterwarnings('ignore::DeprecationWarning')
+
+
+# --- canonical_url / UrlFrontier ---
+
+@pytest.mark.parametrize('url, expected', [
+    # BWF hosts: https, no www., trailing slash on directory paths, no fragment or tracking tags
+    ('http://www.bwfbadminton.com/news/2025/01/02/foo', 'https://bwfbadminton.com/news/2025/01/02/foo/'),
+    ('https://bwfbadminton.com/news/2025/01/02/foo/#top', 'https://bwfbadminton.com/news/2025/01/02/foo/'),
+    ('https://bwfbadminton.com/news/foo?utm_source=x&utm_medium=y', 'https://bwfbadminton.com/news/foo/'),
+    ('https://bwfbadminton.com/news/foo/?id=3&fbclid=1', 'https://bwfbadminton.com/news/foo/?id=3'),
+    ('https://BWFworldtour.bwfbadminton.com:443/news/x', 'https://bwfworldtour.bwfbadminton.com/news/x/'),
+    # files and URLs with a real query keep their path as is
+    ('https://bwfbadminton.com/wp-content/uploads/a.jpg', 'https://bwfbadminton.com/wp-content/uploads/a.jpg'),
+    ('https://bwfbadminton.com/wp-json/wp/v2/posts?per_page=20', 'https://bwfbadminton.com/wp-json/wp/v2/posts?per_page=20'),
+    # other hosts keep their scheme, www. and path; only tracking tags and default ports go
+    ('http://www.example.com/a?utm_source=1&b=2', 'http://www.example.com/a?b=2'),
+    ('https://example.com:443/x', 'https://example.com/x'),
+    ('https://example.com:8080/x/', 'https://example.com:8080/x/'),
+    # not absolute: left alone
+    ('/relative', '/relative'),
+    ('', ''),
+])
+def test_canonical_url(url, expected):
+    assert bwf.canonical_url(url) == expected
+
+
+def test_canonical_url_is_idempotent():
+    for url in ('http://www.bwfbadminton.com/news/foo?utm_campaign=a', 'https://example.com/a?gclid=1&q=2#x'):
+        once = bwf.canonical_url(url)
+        assert bwf.canonical_url(once) == once
+
+
+def test_frontier_runs_concurrent_callers_once():
+    frontier = bwf.UrlFrontier()
+    calls = []
+    gate = threading.Event()
+
+    def slow(url):
+        calls.append(url)
+        gate.wait(5)
+        return url.upper()
+
+    spellings = ['http://www.bwfbadminton.com/news/a', 'https://bwfbadminton.com/news/a/?utm_source=x'] * 3
+    results = [None] * len(spellings)
+
+    def call(i):
+        results[i] = frontier.once('page', spellings[i], slow)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(spellings))]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join()
+    # done once, for the URL as the first caller spelled it
+    assert len(calls) == 1 and calls[0] in spellings
+    assert set(results) == {calls[0].upper()}
+
+
+def test_fetch_shares_pages_per_cloudscraper_setting(monkeypatch):
+    monkeypatch.setattr(bwf, '_frontier', bwf.UrlFrontier())
+    calls = []
+    monkeypatch.setattr(bwf, '_fetch_page', lambda url, use_cloud: calls.append((url, use_cloud)) or url)
+    url = 'https://bwfbadminton.com/news/a/?utm_source=x&id=7'
+    assert bwf.fetch(url) == url
+    assert bwf.fetch('https://bwfbadminton.com/news/a/?id=7') == url
+    bwf.fetch(url, use_cloud=False)
+    bwf.fetch(url, use_cloud=False)
+    assert calls == [(url, True), (url, False)]
+
+
+def test_frontier_forgets_failures():
+    frontier = bwf.UrlFrontier()
+    outcomes = [ValueError('down'), 'page']
+
+    def flaky(url):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with pytest.raises(ValueError):
+        frontier.once('page', 'https://bwfbadminton.com/news/', flaky)
+    assert frontier.once('page', 'https://bwfbadminton.com/news/', flaky) == 'page'
+    # a success is kept for the rest of the run
+    assert frontier.once('page', 'https://bwfbadminton.com/news/', flaky) == 'page'
+
+
+def confirmed_frontier(monkeypatch, day='2025-03-10'):
+    """The run's frontier holding MAX_ITEMS confirmed items dated `day`."""
+    frontier = bwf.UrlFrontier()
+    monkeypatch.setattr(bwf, '_frontier', frontier)
+    for i in range(bwf.MAX_ITEMS):
+        frontier.confirm(f'https://bwfbadminton.com/news/item-{i}/', day)
+    return frontier
+
+
+def test_frontier_cutoff_is_the_oldest_of_the_newest_items():
+    frontier = bwf.UrlFrontier()
+    frontier.note_date('https://bwfbadminton.com/news/card/', '2025-03-01')
+    for i in range(bwf.MAX_ITEMS - 1):
+        frontier.confirm(f'https://bwfbadminton.com/news/item-{i}/', f'2025-03-{i + 2:02d}')
+    assert not frontier.behind('https://bwfbadminton.com/news/card/')
+    # the 20th item sets the cutoff at the oldest of the 20 newest
+    frontier.confirm('https://bwfbadminton.com/news/late/', '2025-02-28')
+    assert not frontier.behind('https://bwfbadminton.com/news/card/')
+    frontier.confirm('https://bwfbadminton.com/news/newer/', '2025-03-25')
+    assert frontier.behind('https://bwfbadminton.com/news/card/')
+    assert frontier.behind('https://bwfbadminton.com/2025/02/01/old-story/')
+    assert not frontier.behind('https://bwfbadminton.com/news/undated/')
+
+
+@pytest.mark.parametrize('engine', ['threads', 'async'])
+def test_run_all_skips_hinted_urls_older_than_the_cutoff(monkeypatch, engine):
+    monkeypatch.setattr(bwf, 'BWF_ASYNC', engine == 'async')
+    frontier = confirmed_frontier(monkeypatch)
+    old = 'https://bwfbadminton.com/2024/11/02/old-story/'
+    carded = 'https://bwfbadminton.com/news/carded/'
+    frontier.note_date(carded, '2025-01-15')
+    new = 'https://bwfbadminton.com/2025/03/12/new-story/'
+    undated = 'https://bwfbadminton.com/news/undated/'
+    fetched = []
+    results = bwf.run_all(lambda u: fetched.append(u) or u, [old, carded, new, undated], newest_first=True)
+    assert isinstance(results[0], bwf.Skipped) and isinstance(results[1], bwf.Skipped)
+    assert results[2:] == [new, undated]
+    assert sorted(fetched) == sorted([new, undated])
+    # without newest_first nothing is ruled out
+    assert bwf.run_all(lambda u: u, [old, carded]) == [old, carded]
+
+
+def test_run_all_stops_once_fetched_items_reach_the_cutoff(monkeypatch):
+    monkeypatch.setattr(bwf, 'BWF_ASYNC', False)
+    monkeypatch.setattr(bwf, 'BWF_CONCURRENCY', 1)
+    frontier = bwf.UrlFrontier()
+    monkeypatch.setattr(bwf, '_frontier', frontier)
+    urls = [f'https://bwfbadminton.com/2025/{1 + i // 28:02d}/{1 + i % 28:02d}/story-{i}/' for i in range(30)]
+    urls.append('https://bwfbadminton.com/news/undated/')
+    fetched = []
+
+    def parse(url):
+        fetched.append(url)
+        frontier.confirm(url, '')
+        return url
+
+    results = bwf.run_all(parse, urls, newest_first=True)
+    # the undated URL goes first, then the newest MAX_ITEMS dated ones; the rest are dropped
+    assert fetched == [urls[-1]] + urls[-2:-2 - bwf.MAX_ITEMS:-1]
+    assert [isinstance(r, bwf.Skipped) for r in results[:-1]] == [True] * 10 + [False] * 20
+
+
+# --- ImageOverrides ---
+
+def substring_loop(by_title_substr, title):
+    """The matcher ImageOverrides replaced: first key (file order) contained in the title."""
+    t = (title or '').lower()
+    for key, img in by_title_substr.items():
+        if key and key.lower() in t:
+            return img
+    return None
+
+
+def test_overrides_match_substring_loop():
+    rng = random.Random(7)
+    alphabet = 'abc '
+    for _ in range(300):
+        keys = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))): f'img{i}.jpg' for i in range(rng.randint(1, 8))}
+        overrides = bwf.ImageOverrides({'by_title_substr': keys})
+        for _ in range(20):
+            title = ''.join(rng.choice(alphabet + 'ABC') for _ in range(rng.randint(0, 12)))
+            assert overrides.title_image(title) == substring_loop(keys, title), (keys, title)
+
+
+def test_overrides_prefer_file_order_over_position():
+    keys = {'open': 'open.jpg', 'indonesia open': 'indonesia.jpg', 'she': 'she.jpg'}
+    overrides = bwf.ImageOverrides({'by_title_substr': keys})
+    # 'she' (in 'Ushers') occurs first in the title, but 'open' comes first in the file
+    assert overrides.title_image('Ushers at the Indonesia Open') == 'open.jpg'
+    assert overrides.title_image('She wins') == 'she.jpg'
+    assert overrides.title_image('Nothing here') is None
+    assert overrides.title_image('') is None
+
+
+def test_overrides_by_href_uses_canonical_urls():
+    overrides = bwf.ImageOverrides({
+        'by_href': {'http://www.bwfbadminton.com/news/a': 'href.jpg'},
+        'by_title_substr': {'final': 'title.jpg'},
+    })
+    assert overrides.image_for('https://bwfbadminton.com/news/a/?utm_source=x', 'The final') == 'href.jpg'
+    assert overrides.image_for('https://bwfbadminton.com/news/b/', 'The final') == 'title.jpg'
+    assert bwf.ImageOverrides(None).image_for('https://bwfbadminton.com/news/a/', 'The final') is None
+
+
+def test_overrides_reload_when_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'image_overrides.json'
+    monkeypatch.setattr(bwf, 'OVERRIDES_PATH', str(path))
+    monkeypatch.setattr(bwf, '_overrides', None)
+    path.write_text(json.dumps({'by_title_substr': {'final': 'one.jpg'}}))
+    assert bwf.image_overrides().title_image('The final') == 'one.jpg'
+    first = bwf.image_overrides()
+    assert bwf.image_overrides() is first
+    path.write_text(json.dumps({'by_title_substr': {'final': 'two.jpg'}}))
+    os.utime(path, ns=(time.time_ns() + 10**9,) * 2)
+    assert bwf.image_overrides().title_image('The final') == 'two.jpg'
+
+
+# --- dates ---
+
+FAST_PATH_DATES = [
+    '2025-09-05',
+    '2025-09-05T10:30',
+    '2025-09-05T10:30:15',
+    '2025-09-05 10:30:15.123456',
+    '2025-09-05T10:30:15Z',
+    '2025-09-05T10:30:15+08:00',
+    '2025-09-05T10:30:15-05:30',
+    'September 5, 2025',
+    'Sept 5 2025',
+    'Friday, September 5, 2025',
+    'Fri, Sep 5, 2025',
+    'Fri, 05 Sep 2025 10:30:00 GMT',
+    'Fri, 05 Sep 2025 10:30:00 +0000',
+    'Fri, 05 Sep 2025 10:30 +0800',
+    '5 Sep 2025 10:30:00 -0430',
+]
+
+
+@pytest.mark.parametrize('s', FAST_PATH_DATES)
+def test_fast_date_paths_agree_with_dateutil(s):
+    fast = bwf._fast_parse_date(s)
+    assert fast is not None, 'expected a fast path for this format'
+    slow = bwf.date_parser.parse(s)
+    assert fast == slow
+    assert fast.replace(tzinfo=None) == slow.replace(tzinfo=None)
+    assert fast.utcoffset() == slow.utcoffset()
+
+
+@pytest.mark.parametrize('s', ['05/09/2025', 'yesterday', '2025-13-45', 'Smarch 5, 2025', ''])
+def test_parse_date_falls_back_to_dateutil(s):
+    try:
+        expected = bwf.date_parser.parse(s)
+    except Exception:
+        expected = None
+    assert bwf.parse_date(s) == expected
+
+
+def test_normalize_date_iso():
+    assert bwf.normalize_date_iso('Friday, September 5, 2025') == '2025-09-05T00:00:00+00:00'
+    # the wall-clock time is kept and labelled UTC, as the stored output always has been
+    assert bwf.normalize_date_iso('2025-09-05T10:30:00+08:00') == '2025-09-05T10:30:00+00:00'
+    assert bwf.normalize_date_iso('not a date') == 'not a date'
+    assert bwf.url_path_date('https://bwfbadminton.com/news/2025/9/5/x/') == '2025-09-05T00:00:00+00:00'
+    assert bwf.url_path_date('https://bwfbadminton.com/news/x/') == ''
+
+
+# --- HTML parser backends ---
+
+PARITY_HTML = '''<!DOCTYPE html>
+<html><head>
+<title>Title &amp; more</title>
+<meta property="og:image" content="https://bwfbadminton.com/og.jpg">
+<meta property="OG:Title" content="Upper">
+<meta name="description" content="  A description  ">
+<style>.x { color: red }</style>
+<script>var s = "<p>not a tag</p>";</script>
+</head><body class="home page">
+<div id="main" class="news-overview-wrap wide">
+  <article class="card"><a href="/news/2025/09/05/one/"><img src="/a-300x200.jpg" data-src="/lazy.jpg">
+    <h3>One</h3></a><p>First <b>bold</b> preview</p><time datetime="2025-09-05">5 Sep</time></article>
+  <article class="card featured"><a href="https://bwfbadminton.com/news/two/" title="Two">
+    <span>Two</span></a><p>Second</p><template><p>in template</p></template></article>
+  <div class="Card"><a href="/events/">Events</a><!-- a comment --></div>
+</div>
+<ul class="latest-news"><li><a href="/news/three/">Three<ruby>x<rt>ex</rt></ruby></a></li></ul>
+<p>Tail text <script>var t = 1;</script> after</p>
+<pre>  <b>kept</b>
+  </pre><textarea>
+</textarea>
+</body></html>'''
+
+SELECTORS = [
+    'a', 'a[href]', 'img[src]', 'img[data-src]', 'p', 'time[datetime]', 'h3',
+    '.card', 'article.card', '.card.featured', '#main', 'div#main > article',
+    '#main a', 'div > a', 'article > a > img', 'ul li a',
+    'a[href*="/news/"]', 'a[href^="https://"]', 'a[href$="/"]', 'a[href="/events/"]',
+    '[class*="latest" i]', '[id*="MAIN" i]', 'meta[property="og:image"][content]',
+    'meta[property="og:title" i]', '[class~="wide"]', 'h3, time', 'template p', 'rt',
+]
+
+
+def node_signature(node):
+    attrs = {k: v for k, v in node.attrs.items()}
+    return node.name, sorted(attrs.items()), node.get_text(' ', strip=True)
+
+
+@pytest.mark.parametrize('selector', SELECTORS)
+def test_lxml_select_matches_bs4(selector):
+    ref = bwf.parse_html(PARITY_HTML, 'bs4')
+    fast = bwf.parse_html(PARITY_HTML, 'lxml')
+    assert [node_signature(n) for n in fast.select(selector)] == [node_signature(n) for n in ref.select(selector)]
+    ref_one, fast_one = ref.select_one(selector), fast.select_one(selector)
+    assert (fast_one and node_signature(fast_one)) == (ref_one and node_signature(ref_one))
+
+
+def test_lxml_node_api_matches_bs4():
+    ref = bwf.parse_html(PARITY_HTML, 'bs4')
+    fast = bwf.parse_html(PARITY_HTML, 'lxml')
+    for doc in (ref, fast):
+        assert doc.select_one('title').string == 'Title & more'
+    assert fast.get_text('|', strip=True) == ref.get_text('|', strip=True)
+    assert fast.select_one('script').get_text() == ref.select_one('script').get_text()
+    for selector in ('p', 'article', 'a', 'li', 'template', 'h3', 'pre', 'textarea', 'body'):
+        for f, r in zip(fast.select(selector), ref.select(selector)):
+            assert f.string == r.string
+            assert f.get_text() == r.get_text()
+            assert f.parent.name == r.parent.name
+            assert f.get('class') == r.get('class')
+    first_f, first_r = fast.select_one('article'), ref.select_one('article')
+    assert [c.name if not isinstance(c, str) else c for c in first_f.contents] == \
+        [c.name if not isinstance(c, str) else str(c) for c in first_r.contents]
+
+
+def test_css_to_xpath_rejects_unsupported_selectors():
+    for selector in ('a:first-child', 'a + b', 'a ~ b'):
+        with pytest.raises(ValueError):
+            bwf.css_to_xpath(selector)
+
+
+# --- listing cards ---
+
+TOURNAMENT_PAGE = '''<html><head><meta property="og:image" content="https://bwfworldtour.bwfbadminton.com/og.jpg"></head><body>
+<div class="news-overview-wrap"><ul>
+ <li><div class="card"><a href="/news/2025/09/05/final-day/" title="Final day 05 Sep">
+   <img data-src="/wp-content/uploads/final-300x200.jpg"></a>
+   <p>Preview of the final</p><time datetime="2025-09-05T10:00:00">5 Sep</time></div></li>
+ <li><div class="card"><a href="https://bwfworldtour.bwfbadminton.com/news/semis/"><span>Semis</span></a>
+   <p>Semis preview</p><span>September 4, 2025</span></div></li>
+ <li><div class="card"><a href="https://example.com/news/elsewhere/">Elsewhere</a></div></li>
+ <li><div class="card"><a href="/players/">Players</a></div></li>
+</ul></div></body></html>'''
+
+MAIN_PAGE = '''<html><body>
+<div><a href="https://bwfbadminton.com/news/2025/09/05/a-long-enough-title/">A long enough title 5 Sep</a><img src="/a.jpg"></div>
+<div><a href="https://bwfworldtour.bwfbadminton.com/news/2025/09/05/sub/">Subdomain story here</a></div>
+<div><a href="/news/2025/09/04/short/">Short</a></div>
+<div><a href="/news/2025/09/03/relative-title-ok/">Relative title is fine</a></div>
+<div><a href="/news/2025/09/03/relative-title-ok/">Relative title is fine</a></div>
+</body></html>'''
+
+TOURNAMENT_BASE = 'https://bwfworldtour.bwfbadminton.com/news/'
+
+
+@pytest.mark.parametrize('backend', bwf.PARSER_BACKENDS)
+def test_tournament_overview_cards(backend):
+    items = bwf.extract_cards(bwf.parse_html(TOURNAMENT_PAGE, backend), 'tournament_overview', TOURNAMENT_BASE)
+    assert items == [
+        {
+            'title': 'Final day',
+            'href': 'https://bwfworldtour.bwfbadminton.com/news/2025/09/05/final-day/',
+            'img': 'https://bwfworldtour.bwfbadminton.com/wp-content/uploads/final.jpg',
+            'preview': 'Preview of the final',
+            'date': '2025-09-05T10:00:00',
+        },
+        {
+            'title': 'Semis',
+            'href': 'https://bwfworldtour.bwfbadminton.com/news/semis/',
+            'img': '',
+            'preview': 'Semis preview',
+            'date': 'September 4, 2025',
+        },
+    ]
+
+
+@pytest.mark.parametrize('backend', bwf.PARSER_BACKENDS)
+def test_required_container(backend):
+    page = bwf.parse_html(MAIN_PAGE, backend)
+    assert bwf.extract_cards(page, 'tournament_overview', TOURNAMENT_BASE) is None
+    # without container_required the whole page is used instead
+    assert len(bwf.extract_cards(page, 'tournament_list', TOURNAMENT_BASE)) == 4
+
+
+@pytest.mark.parametrize('backend', bwf.PARSER_BACKENDS)
+def test_main_page_cards(backend):
+    page = bwf.parse_html(MAIN_PAGE, backend)
+    items = bwf.extract_cards(page, 'bwf_main', 'https://bwfbadminton.com/')
+    # main host only, titles of at least 10 characters without their trailing date, each href
+    # once, dates from the URL
+    assert [(it['title'], it['date'], it['img']) for it in items] == [
+        ('A long enough title', '2025-09-05T00:00:00+00:00', 'https://bwfbadminton.com/a.jpg'),
+        ('Relative title is fine', '2025-09-03T00:00:00+00:00', ''),
+    ]
+    assert len(bwf.extract_cards(page, 'bwf_news', 'https://bwfbadminton.com')) == 4
+    assert len(bwf.extract_cards(page, 'bwf_news', 'https://bwfbadminton.com', limit=2)) == 2
+
+
+@pytest.mark.parametrize('rule', sorted(bwf.LISTING_RULES))
+def test_card_rules_agree_across_backends(rule):
+    for html, base in ((TOURNAMENT_PAGE, TOURNAMENT_BASE), (MAIN_PAGE, 'https://bwfbadminton.com')):
+        ref = bwf.extract_cards(bwf.parse_html(html, 'bs4'), rule, base)
+        assert bwf.extract_cards(bwf.parse_html(html, 'lxml'), rule, base) == ref
+
+
+# --- page classifier ---
+
+FILLER = '<p>' + 'Badminton news. ' * 100 + '</p>'
+
+
+@pytest.mark.parametrize('body, consent, verdict', [
+    (f'<html><body>{FILLER}</body></html>', True, 'ok'),
+    ('<title>Attention Required! | Cloudflare</title>' + FILLER, True, 'challenge'),
+    ('<h1>Sorry, you have been blocked</h1><p>Cloudflare Ray ID</p>' + FILLER, True, 'blocked'),
+    ('<html><body>Cloudflare blocked</body></html>', True, 'blocked'),
+    ('<html><body>short</body></html>', True, 'truncated'),
+    ('', False, 'truncated'),
+    (f'<div>We use cookies. Manage your consent.</div>{FILLER}', True, 'consent'),
+    (f'<div>We use cookies. Manage your consent.</div>{FILLER}', False, 'ok'),
+    # markers in scripts and attributes are not page text
+    (f'<script>var cookie = 1, consent = 2;</script><a title="privacy">x</a>{FILLER}', True, 'ok'),
+    # a CDN mention alone is not a challenge
+    (f'<script src="https://cdnjs.cloudflare.com/x.js"></script>{FILLER}', True, 'ok'),
+])
+def test_classify_page(body, consent, verdict):
+    assert bwf.classify_page(body, consent=consent) == verdict
+    assert bwf.classify_page(body.encode('utf-8'), consent=consent) == verdict
+
+
+def test_check_page_raises_on_bad_pages():
+    bwf.check_page(FILLER)
+    for body in ('<title>Attention Required! | Cloudflare</title>', 'tiny'):
+        with pytest.raises(Exception):
+            bwf.check_page(body)
+    # a consent wall is left for parse_article() to handle
+    bwf.check_page(f'<div>cookie consent</div>{FILLER}')
+
+
+ARTICLE_HEAD = '''<html><head><title>Fallback</title>
+<meta property="og:title" content="Axelsen wins the final">
+<meta property="og:image" content="https://bwfbadminton.com/wp-content/uploads/final.jpg">
+<meta name="description" content="Viktor Axelsen won the men's singles final on Sunday.">
+<meta property="article:published_time" content="2025-09-05T10:00:00+00:00">
+<script src="https://bwfbadminton.com/cdn-cgi/scripts/cloudflare-static/email-decode.min.js"></script>
+</head>'''
+
+
+def test_article_head_ignores_cloudflare_cdn_mentions(monkeypatch):
+    monkeypatch.setattr(bwf, 'BWF_IMAGE_PROBE', False)
+    monkeypatch.setattr(bwf, 'fetch_head', lambda url: ARTICLE_HEAD)
+    item = bwf.parse_article_head('https://bwfbadminton.com/news/2025/09/05/final/')
+    assert item['title'] == 'Axelsen wins the final'
+    assert item['img'] == 'https://bwfbadminton.com/wp-content/uploads/final.jpg'
+    assert item['date'] == '2025-09-05T10:00:00+00:00'
+    monkeypatch.setattr(bwf, 'fetch_head', lambda url: '<title>Attention Required! | Cloudflare</title>' + ARTICLE_HEAD)
+    assert bwf.parse_article_head('https://bwfbadminton.com/news/2025/09/05/final/') is None
+
+
+# --- rate limiting ---
+
+class FakeClock:
+    """Stands in for the time module: sleep() only advances monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bwf, 'time', fake)
+    return fake
+
+
+def test_token_bucket_burst_then_rate(clock):
+    bucket = bwf.TokenBucket(rate=2, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+    # the bucket is empty: each further call waits 1/rate
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == [0.5, 0.5]
+    # an idle period refills up to the burst, not beyond
+    clock.now += 60
+    clock.slept.clear()
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.slept == [0.5]
+
+
+def test_token_bucket_pause_holds_every_caller(clock):
+    bucket = bwf.TokenBucket(rate=10, burst=10)
+    bucket.pause(5)
+    bucket.acquire()
+    assert clock.slept == [5.0]
+    # a shorter pause never cuts a longer one short
+    bucket.pause(10)
+    bucket.pause(1)
+    bucket.acquire()
+    assert clock.slept[-1] == 10.0
+
+
+class FakeResponse:
+    def __init__(self, status, body=b'', headers=None):
+        self.status_code = status
+        self.content = body
+        self.headers = headers or {}
+        self.encoding = 'utf-8'
+        self.elapsed = None
+        self.consumed = 0
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+    def iter_content(self, size):
+        for i in range(0, len(self.content), size):
+            self.consumed = i + size
+            yield self.content[i:i + size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise bwf.requests.HTTPError(str(self.status_code), response=self)
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        self.requests.append((url, kwargs.get('headers') or {}))
+        return self.responses.pop(0)
+
+
+def test_throttled_get_retries_with_retry_after(clock, monkeypatch):
+    monkeypatch.setattr(bwf, '_limiters', {})
+    session = FakeSession(FakeResponse(429, headers={'Retry-After': '3'}), FakeResponse(200, FILLER.encode()))
+    r = bwf.throttled_get(session, 'https://bwfbadminton.com/news/')
+    assert r.status_code == 200 and session.calls == 2
+    assert 3.0 in clock.slept
+
+
+def test_throttled_get_hands_back_challenge_pages_at_once(clock, monkeypatch):
+    monkeypatch.setattr(bwf, '_limiters', {})
+    challenge = FakeResponse(503, b'<title>Attention Required! | Cloudflare</title>' + FILLER.encode())
+    session = FakeSession(challenge, FakeResponse(200, FILLER.encode()))
+    r = bwf.throttled_get(session, 'https://bwfbadminton.com/news/')
+    assert r is challenge and session.calls == 1
+    assert clock.slept == []
+    assert bwf.limiter('bwfbadminton.com').blocked_until == 0.0
+
+
+def test_retry_after_parsing():
+    assert bwf._retry_after(FakeResponse(429, headers={'Retry-After': '7'})) == 7.0
+    assert bwf._retry_after(FakeResponse(429, headers={'Retry-After': '-3'})) == 0.0
+    assert bwf._retry_after(FakeResponse(429, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0.0
+    assert bwf._retry_after(FakeResponse(429, headers={'Retry-After': 'soon'})) is None
+    assert bwf._retry_after(FakeResponse(429)) is None
+
+
+# --- circuit breakers ---
+
+def test_breaker_opens_after_threshold_and_recovers(clock):
+    cb = bwf.CircuitBreaker('test', threshold=3, cooldown=60)
+    for _ in range(2):
+        assert cb.allow()
+        cb.failure()
+    assert cb.state == 'closed'
+    cb.success()
+    # a success resets the streak: three more in a row are needed
+    for _ in range(3):
+        assert cb.allow()
+        cb.failure()
+    assert cb.state == 'open' and not cb.allow()
+    clock.now += 59
+    assert not cb.allow()
+    clock.now += 1
+    # half-open: exactly one trial call at a time
+    assert cb.allow() and cb.state == 'half_open'
+    assert not cb.allow()
+    cb.success()
+    assert cb.state == 'closed' and cb.allow()
+
+
+def test_breaker_trial_failure_reopens(clock):
+    cb = bwf.CircuitBreaker('test', threshold=1, cooldown=10)
+    cb.failure()
+    clock.now += 10
+    assert cb.allow()
+    cb.failure()
+    assert cb.state == 'open' and not cb.allow()
+    # a trial that never reached the endpoint frees the slot without deciding anything
+    clock.now += 10
+    assert cb.allow()
+    cb.release()
+    assert cb.state == 'half_open' and cb.allow()
+
+
+def test_guarded_counts_outages_only(clock, monkeypatch):
+    monkeypatch.setattr(bwf, '_breakers', {})
+
+    def http_error(status):
+        response = bwf.requests.Response()
+        response.status_code = status
+        return bwf.requests.HTTPError(f'{status}', response=response)
+
+    def fail(e):
+        raise e
+
+    for _ in range(bwf.BWF_BREAKER_THRESHOLD):
+        with pytest.raises(bwf.requests.HTTPError):
+            bwf.guarded('direct@example.com', fail, http_error(404))
+    assert bwf.breaker('direct@example.com').state == 'closed'
+    with pytest.raises(bwf.DeadlineExceeded):
+        bwf.guarded('direct@example.com', fail, bwf.DeadlineExceeded('late'))
+    assert bwf.breaker('direct@example.com').failures == 0
+    for _ in range(bwf.BWF_BREAKER_THRESHOLD):
+        with pytest.raises(bwf.requests.HTTPError):
+            bwf.guarded('direct@example.com', fail, http_error(503))
+    assert bwf.breaker('direct@example.com').state == 'open'
+    with pytest.raises(bwf.CircuitOpen):
+        bwf.guarded('direct@example.com', lambda: 'never called')
+
+
+# --- concurrency ---
+
+def test_async_caps_are_shared_across_maps(monkeypatch):
+    monkeypatch.setattr(bwf, '_inflight_gate', threading.BoundedSemaphore(4))
+    monkeypatch.setattr(bwf, '_host_gates', {})
+    monkeypatch.setattr(bwf, 'BWF_PER_HOST', 1)
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def work(url):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return url
+
+    urls = [f'https://bwfbadminton.com/news/{i}/' for i in range(4)]
+    threads = [threading.Thread(target=bwf.AsyncFetcher().map, args=(work, urls)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 1
+
+
+def test_nested_async_maps_do_not_starve(monkeypatch):
+    monkeypatch.setattr(bwf, '_inflight_gate', threading.BoundedSemaphore(1))
+    monkeypatch.setattr(bwf, '_host_gates', {})
+    inner = lambda url: bwf.AsyncFetcher().map(len, [url, url + 'x'])
+    assert bwf.AsyncFetcher().map(inner, ['https://a.example/', 'https://b.example/']) == [[18, 19], [18, 19]]
+
+
+def test_stopped_strategy_keeps_what_it_found(monkeypatch):
+    monkeypatch.setattr(bwf, 'STRATEGY_BUDGETS', {'slow': 0.2, 'fast': 5})
+    monkeypatch.setattr(bwf, '_frontier', None)
+    item = {'title': 'Early', 'href': 'https://bwfbadminton.com/news/early/', 'date': ''}
+    stopped = threading.Event()
+
+    def slow(until):
+        bwf.gathered(item)
+        while not bwf.stopped():
+            time.sleep(0.01)
+        stopped.set()
+        return [item, dict(item, href='https://bwfbadminton.com/news/late/')]
+
+    def fast(until):
+        return [dict(item, title='Fast', href='https://bwfbadminton.com/news/fast/')]
+
+    collected = []
+    bwf.run_strategies([('slow', 'Slow', slow), ('fast', 'Fast', fast)], collected)
+    assert [it['title'] for it in collected] == ['Early', 'Fast']
+    assert stopped.wait(2)
+
+
+# --- image probing ---
+
+def jpeg(*segments):
+    return b'\xff\xd8' + b''.join(segments)
+
+
+def segment(marker, payload):
+    return bytes((0xFF, marker)) + struct.pack('>H', len(payload) + 2) + payload
+
+
+JFIF = segment(0xE0, b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00')
+
+
+@pytest.mark.parametrize('data, info', [
+    (b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR' + struct.pack('>II', 640, 480) + b'\x08\x06', ('png', 640, 480)),
+    (b'GIF89a' + struct.pack('<HH', 320, 200) + b'\x00', ('gif', 320, 200)),
+    (b'GIF87a' + struct.pack('<HH', 1, 2), ('gif', 1, 2)),
+    (b'RIFF\x00\x00\x00\x00WEBPVP8 \x00\x00\x00\x00\x10\x02\x00\x9d\x01\x2a' + struct.pack('<HH', 800, 600),
+     ('webp', 800, 600)),
+    (b'RIFF\x00\x00\x00\x00WEBPVP8L\x00\x00\x00\x00\x2f' + (399 | 299 << 14).to_bytes(4, 'little') + b'\x00' * 5,
+     ('webp', 400, 300)),
+    (b'RIFF\x00\x00\x00\x00WEBPVP8X\x00\x00\x00\x00\x00\x00\x00\x00'
+     + (1919).to_bytes(3, 'little') + (1079).to_bytes(3, 'little'), ('webp', 1920, 1080)),
+    # size in the SOF0 frame after an APP0 segment; SOF2 (progressive) too
+    (jpeg(JFIF, segment(0xC0, b'\x08' + struct.pack('>HH', 720, 1280) + b'\x03')), ('jpeg', 1280, 720)),
+    (jpeg(JFIF, segment(0xC2, b'\x08' + struct.pack('>HH', 10, 20) + b'\x03')), ('jpeg', 20, 10)),
+    # DHT (0xC4) is in the SOF range but holds no size
+    (jpeg(segment(0xC4, b'\x00' * 20), segment(0xC0, b'\x08' + struct.pack('>HH', 5, 6) + b'\x03')), ('jpeg', 6, 5)),
+    # truncated before the frame header, and no SOF at all
+    (jpeg(JFIF)[:12], None),
+    (jpeg(JFIF, segment(0xDB, b'\x00' * 65)), None),
+    (jpeg(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'), None),
+    # too short to hold the size, or not an image
+    (b'\x89PNG\r\n\x1a\n\x00\x00', None),
+    (b'RIFF\x00\x00\x00\x00WEBPVP8 ', None),
+    (b'<!DOCTYPE html><html><body>Not found</body></html>', None),
+    (b'', None),
+])
+def test_image_info(data, info):
+    assert bwf.image_info(data) == info
+
+
+PNG_640 = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR' + struct.pack('>II', 640, 480) + b'\x00' * 5000
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Empty probe cache and in-flight table, a fresh limiter, and a fake session to fill."""
+    monkeypatch.setattr(bwf, '_image_probes', {})
+    monkeypatch.setattr(bwf, '_probe_inflight', {})
+    monkeypatch.setattr(bwf, '_limiters', {})
+    session = FakeSession()
+    monkeypatch.setattr(bwf, 'get_session', lambda: session)
+    return session
+
+
+def test_probe_image_reads_only_the_header(probes):
+    body = FakeResponse(206, PNG_640, {'Content-Type': 'image/png'})
+    probes.responses.append(body)
+    result = bwf.probe_image('https://img.example/a.png')
+    assert (result['ok'], result['format'], result['width'], result['height']) == (True, 'png', 640, 480)
+    assert probes.requests[0][1]['Range'] == f'bytes=0-{bwf.IMAGE_PROBE_BYTES - 1}'
+    assert body.consumed == 8192
+
+
+@pytest.mark.parametrize('response, ok', [
+    (FakeResponse(404), False),
+    (FakeResponse(410), False),
+    (FakeResponse(200, b'<html>' + b' ' * 100, {'Content-Type': 'text/html'}), False),
+    # alive but unsized (a format or header we cannot read) still counts as alive
+    (FakeResponse(200, b'\x00' * 100, {'Content-Type': 'image/avif'}), True),
+    # nothing learned: ranked as if unprobed
+    (FakeResponse(503), None),
+    (FakeResponse(403), None),
+])
+def test_probe_image_outcomes(probes, response, ok):
+    probes.responses.append(response)
+    result = bwf.probe_image('https://img.example/a.jpg')
+    assert (result['ok'] if result else None) is ok
+
+
+def test_probe_images_caches_and_drops_dead_urls(probes):
+    probes.responses += [FakeResponse(404), FakeResponse(206, PNG_640)]
+    dead, live = 'https://img.example/dead.jpg', 'https://img.example/live.png'
+    first = bwf.probe_images([dead, live, dead])
+    assert probes.calls == 2
+    assert first[0] == first[2] and first[0]['ok'] is False and first[0]['status'] == 404
+    assert first[1]['width'] == 640
+    # fresh results come from the cache: no further requests
+    assert bwf.probe_images([live, dead]) == [first[1], first[0]]
+    assert probes.calls == 2
+    # a result older than IMAGE_PROBE_TTL_DAYS is probed again
+    bwf._image_probes[live]['checked'] -= bwf.IMAGE_PROBE_TTL_DAYS * 86400 + 1
+    probes.responses.append(FakeResponse(206, PNG_640))
+    bwf.probe_images([live])
+    assert probes.calls == 3
+
+
+def test_probe_images_skips_work_of_a_stopped_strategy(probes):
+    run = bwf.StrategyRun()
+    run.cancel.set()
+    assert run.call(bwf.probe_images, ['https://img.example/a.png']) == [None]
+    assert probes.calls == 0 and bwf._image_probes == {}
+
+
+# --- article index ---
+
+OLD_ARTICLE = {'title': 'Final day', 'href': 'https://bwfbadminton.com/news/a/', 'img': '', 'img_candidates': [],
+               'preview': '', 'date': '2024-03-10'}
+
+
+@pytest.fixture
+def index(monkeypatch):
+    """An empty article index and a parse_article that returns the records queued in `parsed`."""
+    monkeypatch.setattr(bwf, 'BWF_ARTICLE_INDEX', True)
+    monkeypatch.setattr(bwf, '_article_index', {})
+    monkeypatch.setattr(bwf, '_index_counts', dict.fromkeys(bwf._index_counts, 0))
+    parsed = []
+    monkeypatch.setattr(bwf, 'parse_article', lambda url: dict(parsed.pop(0)))
+    return parsed
+
+
+def age(url, seconds):
+    """Move an indexed article's last check `seconds` into the past."""
+    bwf.article_index()[bwf.canonical_url(url)]['checked'] -= seconds
+
+
+def test_indexed_article_is_reused_until_its_recheck(index):
+    url = OLD_ARTICLE['href']
+    index.append(OLD_ARTICLE)
+    assert bwf._parse_article_indexed(url, '') == OLD_ARTICLE
+    # a tracking-param variant is the same article: reused without a parse
+    assert bwf._parse_article_indexed(url + '?utm_source=x', '') == OLD_ARTICLE
+    age(url, bwf.ARTICLE_RECHECK_DAYS * 86400 - 60)
+    assert bwf._parse_article_indexed(url, '') == OLD_ARTICLE
+    assert bwf._index_counts == {'reused': 2, 'new': 1, 'unchanged': 0, 'changed': 0}
+    # 14 days after the last check it is parsed again
+    age(url, 120)
+    index.append(OLD_ARTICLE)
+    bwf._parse_article_indexed(url, '')
+    assert index == [] and bwf._index_counts['unchanged'] == 1
+
+
+def test_fresh_article_is_rechecked_after_hours(index):
+    url = 'https://bwfbadminton.com/news/fresh/'
+    fresh = dict(OLD_ARTICLE, href=url, date=datetime.now(timezone.utc).strftime('%Y-%m-%d'))
+    index.append(fresh)
+    bwf._parse_article_indexed(url, '')
+    age(url, bwf.ARTICLE_FRESH_RECHECK_HOURS * 3600 - 60)
+    bwf._parse_article_indexed(url, '')
+    assert bwf._index_counts['reused'] == 1
+    age(url, 120)
+    index.append(fresh)
+    bwf._parse_article_indexed(url, '')
+    assert index == []
+
+
+def test_sitemap_lastmod_after_the_check_forces_a_parse(index):
+    url = OLD_ARTICLE['href']
+    index.append(OLD_ARTICLE)
+    bwf._parse_article_indexed(url, '')
+    age(url, 86400)
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+    assert bwf._parse_article_indexed(url, yesterday) == OLD_ARTICLE
+    assert bwf._index_counts['reused'] == 1
+    index.append(OLD_ARTICLE)
+    bwf._parse_article_indexed(url, datetime.now(timezone.utc).isoformat())
+    assert index == []
+
+
+def test_recheck_keeps_an_unchanged_record_and_replaces_a_changed_one(index):
+    url = OLD_ARTICLE['href']
+    key = bwf.canonical_url(url)
+    index.append(OLD_ARTICLE)
+    bwf._parse_article_indexed(url, '')
+    stored = bwf.article_index()[key]
+    age(url, bwf.ARTICLE_RECHECK_DAYS * 86400)
+    index.append(OLD_ARTICLE)
+    bwf._parse_article_indexed(url, '')
+    # same fingerprint: the stored entry stays, with a renewed check time
+    assert bwf.article_index()[key] is stored and 'changed' not in stored
+    assert bwf._recheck_after(stored) == bwf.ARTICLE_RECHECK_DAYS * 86400
+
+    edited = dict(OLD_ARTICLE, img='https://img.example/new.jpg')
+    age(url, bwf.ARTICLE_RECHECK_DAYS * 86400)
+    index.append(edited)
+    assert bwf._parse_article_indexed(url, '') == edited
+    entry = bwf.article_index()[key]
+    assert entry['record'] == edited and entry['fingerprint'] == bwf.article_fingerprint(edited)
+    assert bwf._index_counts == {'reused': 0, 'new': 1, 'unchanged': 1, 'changed': 1}
+    # an edited story is watched on the fresh window, however old its date
+    assert bwf._recheck_after(entry) == bwf.ARTICLE_FRESH_RECHECK_HOURS * 3600
+    entry['changed'] -= bwf.ARTICLE_FRESH_DAYS * 86400
+    assert bwf._recheck_after(entry) == bwf.ARTICLE_RECHECK_DAYS * 86400
+
+
+# --- proxy ladder ---
+
+GOOD_PAGE = b'<html><body>' + b'<p>Results</p>' * 100 + b'</body></html>'
+SHORT_PAGE = b'<html><body>Loading...</body></html>'
+
+
+@pytest.fixture
+def proxies(clock, monkeypatch):
+    """Both proxy keys set, fresh breakers/limiters/usage, and a fake session to fill."""
+    monkeypatch.setattr(bwf, 'SCRAPERAPI_KEY', 'k1')
+    monkeypatch.setattr(bwf, 'SCRAPINGBEE_KEY', 'k2')
+    for name in ('_breakers', '_limiters', '_proxy_usage'):
+        monkeypatch.setattr(bwf, name, {})
+    monkeypatch.setattr(bwf, '_render_hosts', set())
+    session = FakeSession()
+    monkeypatch.setattr(bwf, 'get_session', lambda: session)
+    return session
+
+
+def proxy_calls(session):
+    return [('scraperapi' if 'scraperapi' in url else 'scrapingbee',
+             'render' if 'render=true' in url or 'render_js=true' in url else 'plain')
+            for url, _ in session.requests]
+
+
+def usage():
+    return {key: (u['requests'], u['ok'], u['credits']) for key, u in bwf._proxy_usage.items()}
+
+
+def test_proxy_plain_page_is_enough(proxies):
+    proxies.responses.append(FakeResponse(200, GOOD_PAGE))
+    assert bwf.fetch_via_proxy('https://bwfbadminton.com/news/') == GOOD_PAGE.decode()
+    assert proxy_calls(proxies) == [('scraperapi', 'plain')]
+    assert usage() == {('scraperapi', 'plain'): (1, 1, 1)}
+    assert bwf._render_hosts == set()
+
+
+def test_proxy_rejected_plain_page_escalates_and_marks_the_host(proxies):
+    proxies.responses += [FakeResponse(200, SHORT_PAGE), FakeResponse(200, GOOD_PAGE)]
+    assert bwf.fetch_via_proxy('https://bwfbadminton.com/news/') == GOOD_PAGE.decode()
+    assert proxy_calls(proxies) == [('scraperapi', 'plain'), ('scraperapi', 'render')]
+    # the rejected plain page was still paid for
+    assert usage() == {('scraperapi', 'plain'): (1, 1, 1), ('scraperapi', 'render'): (1, 1, 10)}
+    assert bwf._render_hosts == {'bwfbadminton.com'}
+    # the rest of the run goes straight to rendering for that host
+    proxies.responses.append(FakeResponse(200, GOOD_PAGE))
+    bwf.fetch_via_proxy('https://bwfbadminton.com/results/')
+    assert proxy_calls(proxies)[-1] == ('scraperapi', 'render')
+
+
+def test_proxy_plain_error_escalates_without_marking_the_host(proxies):
+    proxies.responses += [FakeResponse(500), FakeResponse(200, GOOD_PAGE)]
+    bwf.fetch_via_proxy('https://bwfbadminton.com/news/')
+    assert proxy_calls(proxies) == [('scraperapi', 'plain'), ('scraperapi', 'render')]
+    assert usage() == {('scraperapi', 'plain'): (1, 0, 0), ('scraperapi', 'render'): (1, 1, 10)}
+    assert bwf._render_hosts == set()
+
+
+def test_proxy_open_circuit_moves_to_the_next_provider(proxies, clock):
+    cb = bwf.breaker('scraperapi')
+    cb.state, cb.opened_at = 'open', clock.now
+    proxies.responses.append(FakeResponse(200, GOOD_PAGE))
+    assert bwf.fetch_via_proxy('https://bwfbadminton.com/news/') == GOOD_PAGE.decode()
+    assert proxy_calls(proxies) == [('scrapingbee', 'plain')]
+    assert usage() == {('scrapingbee', 'plain'): (1, 1, 1)}
+
+
+def test_proxy_failure_everywhere_raises_the_last_error(proxies):
+    proxies.responses += [FakeResponse(200, SHORT_PAGE), FakeResponse(500),
+                          FakeResponse(200, SHORT_PAGE), FakeResponse(502)]
+    with pytest.raises(bwf.requests.HTTPError):
+        bwf.fetch_via_proxy('https://bwfbadminton.com/news/', render=None)
+    assert proxy_calls(proxies) == [('scraperapi', 'plain'), ('scraperapi', 'render'),
+                                    ('scrapingbee', 'plain'), ('scrapingbee', 'render')]
+    assert usage()[('scrapingbee', 'render')] == (1, 0, 0)
+    assert bwf._render_hosts == set()
+
+
+# --- sitemaps ---
+
+def urlset(*entries, news=False):
+    if news:
+        body = ''.join(f'<url><loc>{loc}</loc><news:news><news:publication_date>{date}</news:publication_date>'
+                       f'</news:news></url>' for loc, date in entries)
+        return ('<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+                'xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">' + body + '</urlset>')
+    body = ''.join(f'<url><loc>{loc}</loc>' + (f'<lastmod>{date}</lastmod>' if date else '') + '</url>'
+                   for loc, date in entries)
+    return '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">' + body + '</urlset>'
+
+
+def sitemapindex(*entries):
+    body = ''.join(f'<sitemap><loc>{loc}</loc>' + (f'<lastmod>{date}</lastmod>' if date else '') + '</sitemap>'
+                   for loc, date in entries)
+    return '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">' + body + '</sitemapindex>'
+
+
+SM = 'https://bwfbadminton.com'
+
+
+def test_iter_sitemap_reads_urlsets_news_sitemaps_and_indexes():
+    assert list(bwf.iter_sitemap(urlset((f'{SM}/news/a/', '2025-03-02T10:00:00+00:00'), (f'{SM}/news/b/', '')))) == [
+        (f'{SM}/news/a/', '2025-03-02T10:00:00+00:00', False), (f'{SM}/news/b/', '', False)]
+    assert list(bwf.iter_sitemap(urlset((f'{SM}/news/c/', '2025-03-03'), news=True))) == [
+        (f'{SM}/news/c/', '2025-03-03', False)]
+    assert list(bwf.iter_sitemap(sitemapindex((f'{SM}/wp-sitemap-posts-post-1.xml', '2025-01-01'),
+                                              (f'{SM}/wp-sitemap-users-1.xml', '')))) == [
+        (f'{SM}/wp-sitemap-posts-post-1.xml', '2025-01-01', True), (f'{SM}/wp-sitemap-users-1.xml', '', True)]
+    assert list(bwf.iter_sitemap('<html><body>not a sitemap</body></html>')) == []
+
+
+class FakeSitemaps(dict):
+    """url -> XML for _fetch_sitemap() to serve (a missing URL fails), noting what was fetched."""
+
+    def __init__(self):
+        super().__init__()
+        self.fetched = []
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        return self[url]
+
+
+@pytest.fixture
+def sitemaps(clock, monkeypatch):
+    monkeypatch.setattr(bwf, '_breakers', {})
+    served = FakeSitemaps()
+    monkeypatch.setattr(bwf, '_fetch_sitemap', served.fetch)
+    return served
+
+
+SINCE = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def test_sitemap_entries_keep_only_changes_since(sitemaps):
+    sitemaps[f'{SM}/news-sitemap.xml'] = urlset(
+        (f'{SM}/news/new/?utm_source=rss', '2025-03-02T08:00:00Z'), (f'{SM}/news/old/', '2025-02-20'),
+        (f'{SM}/news/undated/', ''))
+    assert bwf._sitemap_entries('bwfbadminton.com', f'{SM}/news-sitemap.xml', SINCE) == [
+        (f'{SM}/news/new/', '2025-03-02T08:00:00Z')]
+    # sitemaps have their own breaker, apart from the host's direct tier
+    assert set(bwf._breakers) == {'sitemap@bwfbadminton.com'}
+
+
+def test_sitemap_index_follows_changed_post_sitemaps(sitemaps):
+    index = f'{SM}/wp-sitemap.xml'
+    sitemaps[index] = sitemapindex(
+        (f'{SM}/wp-sitemap-posts-post-1.xml', '2024-12-01'), (f'{SM}/wp-sitemap-posts-post-2.xml', '2025-03-05'),
+        (f'{SM}/wp-sitemap-posts-page-1.xml', '2025-03-05'), (f'{SM}/wp-sitemap-taxonomies-category-1.xml', ''))
+    sitemaps[f'{SM}/wp-sitemap-posts-post-2.xml'] = urlset((f'{SM}/news/x/', '2025-03-04'))
+    assert bwf._sitemap_entries('bwfbadminton.com', index, SINCE) == [(f'{SM}/news/x/', '2025-03-04')]
+    assert sitemaps.fetched == [index, f'{SM}/wp-sitemap-posts-post-2.xml']
+
+
+def test_sitemap_index_without_lastmod_follows_the_last_children(sitemaps):
+    index = f'{SM}/wp-sitemap.xml'
+    children = [f'{SM}/wp-sitemap-posts-post-{n}.xml' for n in range(1, 5)]
+    sitemaps[index] = sitemapindex(*((c, '') for c in children))
+    sitemaps[children[2]] = urlset((f'{SM}/news/y/', '2025-03-02'))
+    # a failing child is logged and skipped; the others still count
+    sitemaps[children[3]] = sitemapindex((f'{SM}/wp-sitemap-posts-post-9.xml', ''))
+    assert bwf._sitemap_entries('bwfbadminton.com', index, SINCE) == [(f'{SM}/news/y/', '2025-03-02')]
+    assert sitemaps.fetched == [index] + children[-bwf.SITEMAP_CHILDREN:]
+
+
+def test_sitemap_without_entries_is_an_error(sitemaps):
+    sitemaps[f'{SM}/news-sitemap.xml'] = '<html><body>Welcome</body></html>'
+    with pytest.raises(ValueError):
+        bwf._sitemap_entries('bwfbadminton.com', f'{SM}/news-sitemap.xml', SINCE)
+
+
+@pytest.fixture
+def last_run(tmp_path, monkeypatch):
+    """last_run.json in a temporary cache, with sitemaps on and no fetch stats or frontier."""
+    path = tmp_path / 'last_run.json'
+    monkeypatch.setattr(bwf, 'LAST_RUN_PATH', str(path))
+    monkeypatch.setattr(bwf, 'BWF_REPLAY', '')
+    monkeypatch.setattr(bwf, 'BWF_SITEMAPS', True)
+    monkeypatch.setattr(bwf, '_last_run', None)
+    monkeypatch.setattr(bwf, '_listed_hosts', set())
+    monkeypatch.setattr(bwf, '_tier_stats', {})
+    monkeypatch.setattr(bwf, '_frontier', None)
+    return path
+
+
+def test_sitemap_changes_since_the_hosts_last_full_read(last_run, sitemaps):
+    last_run.write_text(json.dumps({'hosts': {'bwfbadminton.com': SINCE.isoformat()}}))
+    # no news sitemap: the wp-sitemap.xml index is used instead
+    sitemaps[f'{SM}/news-sitemap.xml'] = '<html>404</html>'
+    sitemaps[f'{SM}/wp-sitemap.xml'] = urlset(
+        (f'{SM}/news/older/', '2025-03-02'), (f'{SM}/news/newer/', '2025-03-04'), (f'{SM}/news/stale/', '2025-01-04'))
+    assert bwf.sitemap_changes('bwfbadminton.com') == [
+        (f'{SM}/news/newer/', '2025-03-04'), (f'{SM}/news/older/', '2025-03-02')]
+    assert bwf._fetch_stats()['bwfbadminton.com']['sitemap']['ok'] == 1
+    # a host no run has read in full yet has nothing to compare against
+    assert bwf.sitemap_changes('bwfworldtour.bwfbadminton.com') is None
+    assert not bwf.host_unchanged('bwfbadminton.com')
+
+
+def test_unchanged_host_counts_as_read_and_is_saved(last_run, sitemaps):
+    last_run.write_text(json.dumps({'hosts': {'bwfbadminton.com': SINCE.isoformat(),
+                                              'bwfworldtour.bwfbadminton.com': '2025-02-01T00:00:00+00:00'}}))
+    sitemaps[f'{SM}/news-sitemap.xml'] = urlset((f'{SM}/news/stale/', '2025-01-04'))
+    assert bwf.host_unchanged('bwfbadminton.com')
+    started = datetime(2025, 3, 6, tzinfo=timezone.utc)
+    bwf.save_last_run(started)
+    assert json.loads(last_run.read_text()) == {'hosts': {
+        'bwfbadminton.com': started.isoformat(), 'bwfworldtour.bwfbadminton.com': '2025-02-01T00:00:00+00:00'}}
+
+
+def test_unreadable_sitemaps_are_not_asked_again_for_a_while(last_run, sitemaps):
+    last_run.write_text(json.dumps({'hosts': {'bwfbadminton.com': SINCE.isoformat()}}))
+    assert bwf.sitemap_changes('bwfbadminton.com') is None
+    assert len(sitemaps.fetched) == len(bwf.SITEMAP_PATHS)
+    assert bwf.sitemap_changes('bwfbadminton.com') is None
+    assert len(sitemaps.fetched) == len(bwf.SITEMAP_PATHS)
+
+
+# --- fixture recording ---
+
+class StreamedResponse(FakeResponse):
+    """A stream=True response: reading .content would download the whole body."""
+
+    @property
+    def content(self):
+        raise AssertionError('streamed body downloaded in full')
+
+    @content.setter
+    def content(self, body):
+        self.body = body
+
+    def iter_content(self, size):
+        for i in range(0, len(self.body), size):
+            self.consumed = i + size
+            yield self.body[i:i + size]
+
+
+def test_recorder_keeps_only_the_streamed_bytes_read(tmp_path, monkeypatch):
+    recorder = bwf.FixtureRecorder(str(tmp_path / 'fx.zip'))
+    monkeypatch.setattr(bwf, '_recorder', recorder)
+    monkeypatch.setattr(bwf, '_limiters', {})
+    page = b'<html><head><title>T</title></head><body>' + b'x' * 50000 + b'</body></html>'
+    url = 'https://bwfbadminton.com/news/a/'
+    head = bwf._stream_head(FakeSession(StreamedResponse(200, page)), url)
+    assert head.endswith('</head>')
+    assert recorder.entries[url]['body'] == head.encode() and recorder.entries[url]['partial']
+    # the full page fetched later replaces the head; a later head read never replaces the page
+    bwf.throttled_get(FakeSession(FakeResponse(200, page)), url)
+    bwf._stream_head(FakeSession(StreamedResponse(200, page)), url)
+    assert recorder.entries[url]['body'] == page and 'partial' not in recorder.entries[url]
+
+
+def test_nested_async_maps_share_one_small_pool(monkeypatch):
+    # two pool threads, each outer call fanning out twice: queued helpers must not be waited on
+    pool = bwf.concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(bwf, '_fetch_pool', pool)
+    monkeypatch.setattr(bwf, '_inflight_gate', threading.BoundedSemaphore(2))
+    monkeypatch.setattr(bwf, '_host_gates', {})
+    workers, results = set(), []
+
+    def leaf(url):
+        workers.add(threading.current_thread().name)
+        time.sleep(0.005)
+        return len(url)
+
+    def inner(url):
+        return bwf.AsyncFetcher().map(leaf, [url + str(i) for i in range(3)])
+
+    def outer(url):
+        return inner(url) + inner(url + 'x')
+
+    urls = [f'https://h{i}.example/' for i in range(4)]
+    caller = threading.Thread(target=lambda: results.extend(bwf.AsyncFetcher().map(outer, urls)))
+    caller.start()
+    caller.join(10)
+    assert not caller.is_alive(), 'nested maps deadlocked'
+    assert results == [[20] * 3 + [21] * 3] * 4
+    # every call ran on the two pool threads
+    assert len(workers) <= 2 and all(name.startswith('ThreadPoolExecutor') for name in workers)
+    pool.shutdown()
+
+
+# --- strategies ---
+
+def test_sitemap_strategy_drops_unstarted_articles_quietly(monkeypatch, capsys):
+    monkeypatch.setattr(bwf, '_frontier', None)
+    monkeypatch.setattr(bwf, 'BWF_ASYNC', False)
+    changes = [(f'{SM}/news/a/', '2025-03-04'), (f'{SM}/news/b/', '2025-03-03'), (f'{SM}/news/c/', '2025-03-02')]
+    monkeypatch.setattr(bwf, 'sitemap_changes', lambda host: changes if host == 'bwfbadminton.com' else None)
+    outcomes = {changes[0][0]: {'title': 'A', 'href': changes[0][0]},
+                changes[1][0]: bwf.Abandoned('strategy stopped at its time budget'),
+                changes[2][0]: ValueError('broken page')}
+
+    def parse(url, modified=''):
+        if isinstance(outcomes[url], Exception):
+            raise outcomes[url]
+        return outcomes[url]
+    monkeypatch.setattr(bwf, 'parse_article_indexed', parse)
+    assert bwf.strategy_sitemaps(time.monotonic() + 60) == [outcomes[changes[0][0]]]
+    out = capsys.readouterr().out
+    assert f'Error parsing {changes[2][0]}' in out and changes[1][0] not in out
+    assert 'Deadline reached before 1 changed articles' in out
+
+
+def test_feed_strategies_respect_their_time_budget(monkeypatch):
+    monkeypatch.setattr(bwf, '_frontier', None)
+    fetched = []
+    monkeypatch.setattr(bwf, 'fetch', lambda url, use_cloud=True: fetched.append(url) or '<rss/>')
+    assert bwf.strategy_rss(time.monotonic() - 1) == []
+    assert bwf.discover_links_via_google(until=time.monotonic() - 1) == []
+    assert fetched == []
+    bwf.strategy_rss(time.monotonic() + 60)
+    assert len(fetched) == 3
+
+
+# --- tier ordering ---
+
+TIERS = [('proxy', 'P'), ('cloudscraper', 'C'), ('direct', 'D')]
+
+
+@pytest.fixture
+def fetch_stats(tmp_path, clock, monkeypatch):
+    """fetch_stats.json in a temporary cache; write it before the first lookup."""
+    path = tmp_path / 'fetch_stats.json'
+    monkeypatch.setattr(bwf, 'FETCH_STATS_PATH', str(path))
+    monkeypatch.setattr(bwf, 'BWF_REPLAY', '')
+    monkeypatch.setattr(bwf, '_tier_stats', None)
+    monkeypatch.setattr(bwf, '_order_logged', set())
+    return path
+
+
+def stat(ok, fail, secs, streak=0, last=0.0):
+    return {'ok': ok, 'fail': fail, 'streak': streak, 'secs': secs, 'last': last}
+
+
+def names(tiers):
+    return [name for name, _ in tiers]
+
+
+def test_order_tiers_by_expected_seconds_per_success(fetch_stats):
+    fetch_stats.write_text(json.dumps({'bwfbadminton.com': {
+        # 6s, always works; 2s, half the time (4s per success); too few samples to judge
+        'proxy': stat(10, 0, 6.0), 'cloudscraper': stat(5, 5, 2.0), 'direct': stat(1, 0, 30.0)}}))
+    assert names(bwf.order_tiers('bwfbadminton.com', TIERS)) == ['direct', 'cloudscraper', 'proxy']
+    # an unknown host keeps the given order
+    assert bwf.order_tiers('bwfworldtour.bwfbadminton.com', TIERS) == TIERS
+
+
+def test_order_tiers_moves_a_failing_tier_back_for_a_while(fetch_stats, clock):
+    fetch_stats.write_text(json.dumps({'bwfbadminton.com': {
+        'proxy': stat(10, 0, 6.0), 'cloudscraper': stat(6, 5, 1.0, streak=3, last=clock.now - 60),
+        'direct': stat(4, 0, 9.0)}}))
+    assert names(bwf.order_tiers('bwfbadminton.com', TIERS)) == ['proxy', 'direct', 'cloudscraper']
+    clock.now += bwf.TIER_SKIP_HOURS * 3600
+    assert names(bwf.order_tiers('bwfbadminton.com', TIERS)) == ['cloudscraper', 'proxy', 'direct']
+
+
+def test_tier_outcomes_are_saved_and_reorder_the_next_run(fetch_stats, monkeypatch):
+    for _ in range(bwf.TIER_MIN_SAMPLES):
+        bwf.record_tier('bwfbadminton.com', 'proxy', True, 8.0)
+        bwf.record_tier('bwfbadminton.com', 'direct', True, 0.5)
+    bwf.record_tier('bwfbadminton.com', 'cloudscraper', False, 2.0)
+    bwf.save_fetch_stats()
+    monkeypatch.setattr(bwf, '_tier_stats', None)
+    # cloudscraper, with one sample, is still being measured
+    assert names(bwf.order_tiers('bwfbadminton.com', TIERS)) == ['cloudscraper', 'direct', 'proxy']
+
+
+# --- HTTP cache ---
+
+def http_response(status, body=b'', headers=None):
+    """A real requests.Response, for code that swaps its body (conditional_get on a 304)."""
+    r = bwf.requests.Response()
+    r.status_code = status
+    r._content = body
+    r.headers.update(headers or {})
+    r.encoding = 'utf-8'
+    return r
+
+
+@pytest.fixture
+def http_cache(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(bwf, 'HTTP_CACHE_DIR', str(tmp_path / 'http'))
+    monkeypatch.setattr(bwf, 'BWF_HTTP_CACHE', True)
+    monkeypatch.setattr(bwf, '_limiters', {})
+    return tmp_path / 'http'
+
+
+def test_conditional_get_revalidates_from_the_cache(http_cache):
+    url = 'https://bwfbadminton.com/news/'
+    page = b'<html>' + b'news ' * 300 + b'</html>'
+    validators = {'ETag': '"v1"', 'Last-Modified': 'Mon, 03 Mar 2025 10:00:00 GMT'}
+    session = FakeSession(http_response(200, page, validators), http_response(304, b'', validators))
+
+    first = bwf.conditional_get(session, url)
+    assert 'If-None-Match' not in session.requests[0][1]
+    bwf.http_cache_store(url, first)
+    meta_path, body_path = bwf._http_cache_paths(url)
+    for path in (meta_path, body_path):
+        os.utime(path, (0, 0))
+
+    second = bwf.conditional_get(session, url)
+    sent = session.requests[1][1]
+    assert (sent['If-None-Match'], sent['If-Modified-Since']) == ('"v1"', 'Mon, 03 Mar 2025 10:00:00 GMT')
+    # the 304 comes back as the cached 200, and the entry counts as fresh for pruning again
+    assert (second.status_code, second.content, second.from_cache) == (200, page, True)
+    assert os.path.getmtime(meta_path) > 0 and os.path.getmtime(body_path) > 0
+    # a body served from the cache is not written back
+    os.utime(body_path, (0, 0))
+    bwf.http_cache_store(url, second)
+    assert os.path.getmtime(body_path) == 0
+
+
+def test_conditional_get_without_validators_is_not_cached(http_cache):
+    url = 'https://bwfbadminton.com/news/'
+    session = FakeSession(http_response(200, b'<html>fresh</html>'), http_response(200, b'<html>again</html>'))
+    bwf.http_cache_store(url, bwf.conditional_get(session, url))
+    assert bwf.http_cache_load(url) is None
+    assert bwf.conditional_get(session, url).content == b'<html>again</html>'
+    assert 'If-None-Match' not in session.requests[1][1] and 'If-Modified-Since' not in session.requests[1][1]
+
+
+# --- hedged fetches ---
+
+@pytest.fixture
+def hedging(monkeypatch):
+    monkeypatch.setattr(bwf, 'BWF_HEDGE_DELAY', 0.05)
+    monkeypatch.setattr(bwf, '_tier_stats', {})
+    monkeypatch.setattr(bwf, '_limiters', {})
+
+
+def test_hedge_cancels_the_losing_side(hedging):
+    url = 'https://bwfbadminton.com/news/'
+    release, finished = threading.Event(), threading.Event()
+    late = FakeSession(FakeResponse(200, GOOD_PAGE))
+    outcome = []
+
+    def slow_tier(u):
+        # still waiting on its request when the other side wins
+        release.wait(5)
+        try:
+            return bwf.throttled_get(late, u).text
+        except BaseException as e:
+            outcome.append(e)
+            raise
+        finally:
+            finished.set()
+
+    tiers = [('proxy', slow_tier), ('direct', lambda u: GOOD_PAGE.decode())]
+    assert bwf._fetch_hedged(url, 'bwfbadminton.com', tiers) == GOOD_PAGE.decode()
+    release.set()
+    assert finished.wait(5)
+    # the loser never sends its request and leaves the tier statistics alone
+    assert isinstance(outcome[0], bwf.HedgeCancelled) and late.calls == 0
+    assert set(bwf._tier_stats['bwfbadminton.com']) == {'direct'}
+
+
+def test_hedge_moves_on_when_the_first_side_fails(hedging):
+    calls = []
+
+    def tier(name, result):
+        def fn(u):
+            calls.append(name)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return name, fn
+
+    tiers = [tier('proxy', ValueError('down')), tier('cloudscraper', GOOD_PAGE.decode()), tier('direct', 'unused')]
+    assert bwf._fetch_hedged('https://bwfbadminton.com/news/', 'bwfbadminton.com', tiers) == GOOD_PAGE.decode()
+    assert calls == ['proxy', 'cloudscraper']
+    # a page that fails check_page() counts as a failed side
+    tiers = [tier('proxy', SHORT_PAGE.decode()), tier('direct', ValueError('down'))]
+    with pytest.raises(ValueError):
+        bwf._fetch_hedged('https://bwfbadminton.com/news/', 'bwfbadminton.com', tiers)
+
+
+# --- run deadline ---
+
+def test_deadline_clamps_request_timeouts(clock):
+    deadline = bwf.Deadline()
+    assert deadline.budget() == float('inf') and deadline.timeout(60) == 60
+    deadline.start(0)
+    assert deadline.end is None
+    deadline.start(100)
+    # the output reserve is not scraping time
+    assert deadline.budget() == 100 - bwf.DEADLINE_RESERVE
+    assert deadline.timeout(60) == 60
+    deadline.start(1000)
+    assert deadline.budget() == 100 - bwf.DEADLINE_RESERVE
+    clock.now += 70
+    assert deadline.timeout(60) == 100 - bwf.DEADLINE_RESERVE - 70
+    clock.now = deadline.end - bwf.DEADLINE_RESERVE - bwf.MIN_REQUEST_TIMEOUT
+    assert deadline.timeout(60) == bwf.MIN_REQUEST_TIMEOUT and not deadline.expired()
+    clock.now += 0.5
+    with pytest.raises(bwf.DeadlineExceeded):
+        deadline.timeout(60)
+    assert not deadline.expired()
+    clock.now += bwf.MIN_REQUEST_TIMEOUT
+    assert deadline.expired()
+
+
+def test_requests_get_the_clamped_timeout(clock, monkeypatch):
+    deadline = bwf.Deadline()
+    monkeypatch.setattr(bwf, 'RUN_DEADLINE', deadline)
+    monkeypatch.setattr(bwf, '_limiters', {})
+    timeouts = []
+
+    class Session(FakeSession):
+        def get(self, url, **kwargs):
+            timeouts.append(kwargs['timeout'])
+            return super().get(url, **kwargs)
+
+    session = Session(FakeResponse(200), FakeResponse(200))
+    deadline.start(bwf.DEADLINE_RESERVE + 25)
+    bwf.throttled_get(session, 'https://bwfbadminton.com/', timeout=60)
+    clock.now += 20
+    bwf.throttled_get(session, 'https://bwfbadminton.com/', timeout=60)
+    assert timeouts == [25, 5]
+    # too little time left for any request: nothing is sent
+    clock.now += 3
+    with pytest.raises(bwf.DeadlineExceeded):
+        bwf.throttled_get(session, 'https://bwfbadminton.com/', timeout=60)
+    assert session.calls == 2